@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+audio_stats_kernels.py - Numba kernels for diarization_audio_preprocessor
+
+Importing numba and compiling kernels takes long enough to dominate a short
+CLI call, so diarization_audio_preprocessor imports this module only when a
+kernel is first needed. The kernels are lazy dispatchers: each is compiled
+on its first call, for the argument types actually passed, and cached on
+disk (cache=True) for later processes.
+"""
+
+import numpy as np
+from numba import njit, prange, types
+from numba.extending import overload
+
+
+def _sample_magnitude(x):
+    """Absolute value of one sample (implemented per type below)."""
+    return abs(x)
+
+
+@overload(_sample_magnitude)
+def _sample_magnitude_overload(x):
+    # abs(-32768) wraps around in int16, so integers are widened first
+    if isinstance(x, types.Integer):
+        return lambda x: abs(np.int64(x))
+    return lambda x: abs(x)
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, parallel=True)
+def audio_stats_kernel(audio, clip_threshold, frame_size, chunk_size, frame_rms):
+    """
+    Accumulate sum, sum of squares, peak and clip count in one pass,
+    writing the RMS of each whole frame into frame_rms along the way
+    (frame_rms may be empty when per-frame values are not needed).
+
+    The buffer is split into contiguous chunks of chunk_size samples (a
+    multiple of frame_size) reduced in parallel (each thread walks its own
+    slice), then the partials are combined.
+    """
+    n = audio.shape[0]
+    num_frames = frame_rms.shape[0]
+    num_chunks = (n + chunk_size - 1) // chunk_size
+    totals = np.zeros(num_chunks)
+    totals_sq = np.zeros(num_chunks)
+    peaks = np.zeros(num_chunks)
+    clip_counts = np.zeros(num_chunks, dtype=np.int64)
+    for k in prange(num_chunks):
+        chunk_stop = min((k + 1) * chunk_size, n)
+        total = 0.0
+        total_sq = 0.0
+        peak = 0.0
+        clip_count = 0
+        for frame_start in range(k * chunk_size, chunk_stop, frame_size):
+            frame_sq = 0.0
+            for i in range(frame_start, min(frame_start + frame_size, chunk_stop)):
+                x = audio[i]
+                ax = _sample_magnitude(x)
+                total += x
+                frame_sq += x * x
+                if ax > peak:
+                    peak = ax
+                if ax >= clip_threshold:
+                    clip_count += 1
+            total_sq += frame_sq
+            frame = frame_start // frame_size
+            if frame < num_frames:
+                frame_rms[frame] = np.sqrt(frame_sq / frame_size)
+        totals[k] = total
+        totals_sq[k] = total_sq
+        peaks[k] = peak
+        clip_counts[k] = clip_count
+
+    peak = 0.0
+    for k in range(num_chunks):
+        peak = max(peak, peaks[k])
+    return totals.sum(), totals_sq.sum(), peak, clip_counts.sum()
+
+
+@njit(cache=True)
+def dc_block_kernel(audio, pole):
+    """In-place one-pole DC blocker: y[n] = x[n] - x[n-1] + pole * y[n-1]."""
+    x_prev = audio[0]
+    y_prev = 0.0
+    for i in range(audio.shape[0]):
+        x = audio[i]
+        y = x - x_prev + pole * y_prev
+        audio[i] = y
+        x_prev = x
+        y_prev = y
@@ -159,6 +159,13 @@ except Exception as e:
     PYANNOTE_IMPORT_ERROR = str(e)
 
 
+def _pick_device(device: Optional[str] = None) -> str:
+    """Resolve the computation device, auto-detecting CUDA when not specified."""
+    if device is not None:
+        return device
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
 # ============================================================================
 # Data Classes
 # ============================================================================
@@ -300,10 +307,7 @@ class CoreDiarizationEngine:
         self.hop_samples = int(self.hop_size * sample_rate)
 
         # Auto-detect device
-        if device is None:
-            self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        else:
-            self.device = device
+        self.device = _pick_device(device)
 
         # Initialize embedding model
         self._embedding_model = None
@@ -380,6 +384,24 @@ class CoreDiarizationEngine:
               f"speakers={min_speakers}-{max_speakers}, window={window_size}s, device={self.device}",
               file=sys.stderr, flush=True)
 
+    @staticmethod
+    def probe_lightweight() -> Dict[str, Any]:
+        """
+        Probe diarization prerequisites without loading the embedding model.
+
+        Checks that pyannote.audio imports, resolves the computation device and
+        reports whether an HF token is configured. Loading the pyannote model
+        takes several seconds, so this is the preferred startup check.
+
+        Returns:
+            Dict with pyannote_installed, device and hf_token_present
+        """
+        return {
+            "pyannote_installed": PYANNOTE_AVAILABLE,
+            "device": _pick_device() if PYANNOTE_AVAILABLE else None,
+            "hf_token_present": bool(os.environ.get("HF_TOKEN")),
+        }
+
     def _get_bundled_model_path(self, model_name: str) -> Optional[str]:
         """
         Check if a model is bundled with the application.
@@ -1131,13 +1153,20 @@ class StreamingDiarizationProcessor:
 # Verification Functions
 # ============================================================================
 
-def verify_diarization_available() -> Dict[str, Any]:
+def verify_diarization_available(deep: bool = False) -> Dict[str, Any]:
     """
     Verify that speaker diarization is available.
 
     This function should be called at startup to ensure the mandatory
     diarization requirement can be met.
 
+    By default only a lightweight probe is performed (imports, device
+    selection, HF token presence). Pass deep=True to also instantiate the
+    engine, which loads the pyannote embedding model.
+
+    Args:
+        deep: Load the embedding model to verify it can actually be used
+
     Returns:
         Dict with availability status and details
     """
@@ -1153,6 +1182,13 @@ def verify_diarization_available() -> Dict[str, Any]:
         result["message"] = f"pyannote.audio is not installed: {PYANNOTE_IMPORT_ERROR}"
         return result
 
+    if not deep:
+        probe = CoreDiarizationEngine.probe_lightweight()
+        result.update(probe)
+        result["available"] = True
+        result["message"] = "Speaker diarization is available (model not loaded)"
+        return result
+
     try:
         # Try to initialize the engine (will load model)
         engine = CoreDiarizationEngine(sample_rate=16000)
@@ -1192,6 +1228,12 @@ def main():
         help="Verify diarization availability and exit"
     )
 
+    parser.add_argument(
+        "--deep-verify",
+        action="store_true",
+        help="With --verify, also load the embedding model (slow)"
+    )
+
     parser.add_argument(
         "--audio",
         help="Path to audio file for batch processing"
@@ -1226,8 +1268,8 @@ def main():
 
     args = parser.parse_args()
 
-    if args.verify:
-        result = verify_diarization_available()
+    if args.verify or args.deep_verify:
+        result = verify_diarization_available(deep=args.deep_verify)
         output_json(result)
         sys.exit(0 if result["available"] else 1)
 
@@ -1275,7 +1317,7 @@ def main():
             sys.exit(1)
     else:
         # No audio file, just verify
-        result = verify_diarization_available()
+        result = verify_diarization_available(deep=args.deep_verify)
         output_json(result)
         sys.exit(0 if result["available"] else 1)
 
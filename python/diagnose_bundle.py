@@ -13,6 +13,7 @@ Usage:
 import sys
 import os
 import importlib
+import importlib.util
 import warnings
 
 # Suppress warnings
@@ -89,30 +90,40 @@ def check_critical_imports():
         'pyannote.audio': 'Pyannote Audio',
     }
 
-    results = {}
+    # First pass: locate specs without executing the packages, so that
+    # provably-missing packages skip the (multi-second) import entirely
+    checks = []
     for pkg_name, display_name in packages.items():
         try:
-            # Try basic import
-            if '.' in pkg_name:
-                parts = pkg_name.split('.')
-                module = __import__(pkg_name)
-                for part in parts[1:]:
-                    module = getattr(module, part)
-            else:
-                module = __import__(pkg_name)
+            spec = importlib.util.find_spec(pkg_name)
+            error = f"No module named '{pkg_name}'"
+        except (ImportError, ValueError) as e:
+            spec = None
+            error = str(e)
+        if spec is None:
+            checks.append((pkg_name, display_name, False, None, 'ImportError', error))
+            continue
 
+        try:
+            module = importlib.import_module(pkg_name)
             # Get version if available
             version = getattr(module, '__version__', 'unknown')
-            results[pkg_name] = {'success': True, 'version': version, 'error': None}
-            print(f"  {Colors.GREEN}✓{Colors.NC} {display_name:20s} v{version}")
-        except ImportError as e:
-            results[pkg_name] = {'success': False, 'version': None, 'error': str(e)}
-            print(f"  {Colors.RED}✗{Colors.NC} {display_name:20s} - {Colors.RED}ImportError{Colors.NC}")
-            print(f"    └─ {str(e)[:70]}")
+            checks.append((pkg_name, display_name, True, version, None, None))
         except Exception as e:
-            results[pkg_name] = {'success': False, 'version': None, 'error': str(e)}
-            print(f"  {Colors.RED}✗{Colors.NC} {display_name:20s} - {Colors.RED}{type(e).__name__}{Colors.NC}")
-            print(f"    └─ {str(e)[:70]}")
+            checks.append((pkg_name, display_name, False, None, type(e).__name__, str(e)))
+
+    # Second pass: render the whole table with a single write
+    results = {}
+    rows = []
+    for pkg_name, display_name, success, version, error_type, error in checks:
+        results[pkg_name] = {'success': success, 'version': version, 'error': error}
+        if success:
+            rows.append(f"  {Colors.GREEN}✓{Colors.NC} {display_name:20s} v{version}")
+        else:
+            rows.append(f"  {Colors.RED}✗{Colors.NC} {display_name:20s} - {Colors.RED}{error_type}{Colors.NC}")
+            rows.append(f"    └─ {error[:70]}")
+    sys.stdout.write("\n".join(rows) + "\n")
+    sys.stdout.flush()
 
     return results
 
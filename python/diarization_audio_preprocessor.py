@@ -40,15 +40,26 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import importlib.util
+import io
 import json
+import math
+import multiprocessing
 import os
+import shlex
+import struct
 import sys
 import tempfile
+import threading
 import warnings
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -98,6 +109,28 @@ try:
 except ImportError:
     FFMPEG_AVAILABLE = False
 
+# Polyphase resampling and IIR filtering (preferred over torchaudio on the CPU
+# path). scipy.signal takes about a second to import, so it is imported where
+# it is used rather than on every CLI start
+SCIPY_AVAILABLE = importlib.util.find_spec("scipy") is not None
+
+# Optional JIT compiler for single-pass signal statistics. The kernels live in
+# audio_stats_kernels and are imported on first use (see _numba_kernels())
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Optional fast JSON encoder for batch report serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional SIMD RMS implementation (float32 only)
+try:
+    from numpy_rms import rms as _fast_rms
+except ImportError:
+    _fast_rms = None
+
 
 # ============================================================================
 # Constants
@@ -107,6 +140,7 @@ except ImportError:
 DIARIZATION_SAMPLE_RATE = 16000  # pyannote.audio expects 16kHz
 DIARIZATION_CHANNELS = 1  # Mono
 DIARIZATION_BIT_DEPTH = 16  # 16-bit PCM
+DIARIZATION_OUTPUT_FORMAT = "flac"  # Lossless, about half the size of WAV
 
 # Quality thresholds
 CLIPPING_THRESHOLD = 0.99  # Peak amplitude that indicates clipping
@@ -121,11 +155,271 @@ MIN_AUDIO_DURATION_S = 1.0  # Minimum audio duration for quality analysis
 PEAK_LIMIT_DB = -1.0  # Limit peaks to -1dB to prevent clipping
 PEAK_LIMIT_RATIO = 10 ** (PEAK_LIMIT_DB / 20)  # ~0.89
 
+# Suitability score deductions, indexed by the number of thresholds crossed
+# (none, warning threshold, severe threshold)
+_CLIPPING_PENALTIES = (0.0, 0.15, 0.3)
+_SNR_PENALTIES = (0.0, 0.15, 0.3)
+_NOISE_PENALTIES = (0.0, 0.1, 0.2)
+_VOLUME_PENALTIES = (0.0, 0.1, 0.2)
+_DYNAMIC_RANGE_PENALTIES = (0.0, 0.05, 0.15)
+
+# SILENCE_THRESHOLD_DB as a linear RMS value
+_SILENCE_THRESHOLD_RMS = 10 ** (SILENCE_THRESHOLD_DB / 20)
+
+# Samples per chunk in the parallel statistics kernel
+STATS_CHUNK_SIZE = 1 << 16
+
+# Buffers shorter than this (~33s at 16kHz) are reduced with NumPy instead:
+# for them, importing numba and starting its thread pool costs more than the
+# parallel pass saves
+PARALLEL_STATS_MIN_SAMPLES = 1 << 19
+
+# Smallest 16-bit PCM magnitude counted as clipping (CLIPPING_THRESHOLD * 32768)
+_PCM16_CLIPPING_LEVEL = int(np.ceil(CLIPPING_THRESHOLD * 32768))
+
+# One-pole DC blocker pole at DIARIZATION_SAMPLE_RATE (cutoff ~13Hz, far below
+# speech fundamentals); _dc_block_pole() rescales it for the source sample rate,
+# since the filter runs before resampling
+DC_BLOCK_POLE = 0.995
+
+# Frames per block when quality analysis streams a file from disk
+STREAM_BLOCK_SIZE = 1 << 20
+
+
+# ============================================================================
+# Signal Statistics Kernels
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels() -> Any:
+    """
+    Import the Numba kernels on first use.
+
+    Returns:
+        The audio_stats_kernels module, or None when numba is unavailable
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    try:
+        import audio_stats_kernels
+    except ImportError:
+        return None
+    return audio_stats_kernels
+
+
+# The kernel already uses every core, and Numba's default workqueue threading
+# layer aborts on concurrent parallel launches, so calls are serialized
+_STATS_KERNEL_LOCK = threading.Lock()
+
+
+def _parallel_stats_kernel(num_samples: int) -> Any:
+    """The parallel Numba stats kernel for a buffer this long, or None for NumPy."""
+    if num_samples < PARALLEL_STATS_MIN_SAMPLES:
+        return None
+    kernels = _numba_kernels()
+    return kernels.audio_stats_kernel if kernels is not None else None
+
+
+def _stats_chunk_size(frame_size: int) -> int:
+    """STATS_CHUNK_SIZE rounded down to whole frames (at least one frame)."""
+    return max(1, STATS_CHUNK_SIZE // frame_size) * frame_size
+
+
+def _audio_stats(audio: np.ndarray, count_clipping: bool = True) -> Tuple[float, float, float, int]:
+    """
+    Compute basic signal statistics of a mono buffer with NumPy reductions
+    (the fallback for the fused Numba kernel).
+
+    Args:
+        audio: Mono float buffer
+        count_clipping: Set to False when the caller counts clipping itself
+                       (the clipping passes are then skipped)
+
+    Returns:
+        Tuple of (sum, sum_of_squares, peak_amplitude, clipping_samples)
+    """
+    clipping_samples = 0
+    if count_clipping:
+        clipping_samples = (
+            np.count_nonzero(audio >= CLIPPING_THRESHOLD)
+            + np.count_nonzero(audio <= -CLIPPING_THRESHOLD)
+        )
+    return (
+        float(np.sum(audio, dtype=np.float64)),
+        float(np.dot(audio, audio)),
+        _peak_amplitude(audio),
+        int(clipping_samples),
+    )
+
+
+def _audio_frame_stats(
+    audio: np.ndarray,
+    frame_size: int,
+    count_clipping: bool = True
+) -> Tuple[Tuple[float, float, float, int], np.ndarray]:
+    """
+    Compute _audio_stats() and _frame_rms() of a mono buffer together.
+
+    With Numba and at least PARALLEL_STATS_MIN_SAMPLES samples, statistics
+    and frame RMS come out of one parallel pass over the samples; otherwise
+    the NumPy helpers run one after the other.
+
+    Args:
+        audio: Mono float buffer
+        frame_size: Samples per RMS frame (trailing partial frame dropped)
+        count_clipping: Set to False when the caller counts clipping itself
+
+    Returns:
+        Tuple of (stats, frame_rms) where stats is the _audio_stats() tuple
+    """
+    if audio.ndim == 2 and audio.shape[1] == 1:
+        # (frames, 1) buffers: the kernels and reductions expect 1-D input
+        audio = audio.reshape(-1)
+    num_frames = len(audio) // frame_size
+    stats_kernel = _parallel_stats_kernel(len(audio))
+    if stats_kernel is not None:
+        if audio.dtype != np.float64:
+            audio = audio.astype(np.float32, copy=False)
+        frame_rms = np.empty(num_frames, dtype=np.float32)
+        with _STATS_KERNEL_LOCK:
+            total, total_sq, peak, clip_count = stats_kernel(
+                np.ascontiguousarray(audio), CLIPPING_THRESHOLD, frame_size,
+                _stats_chunk_size(frame_size), frame_rms
+            )
+        return (float(total), float(total_sq), float(peak), int(clip_count)), frame_rms
+
+    stats = _audio_stats(audio, count_clipping)
+    if num_frames == 0:
+        return stats, np.empty(0, dtype=np.float32)
+    return stats, _frame_rms(audio, frame_size)
+
+
+def _pcm16_frame_stats(samples: np.ndarray, frame_size: int) -> Tuple[Tuple[float, float, float, int], np.ndarray]:
+    """
+    Compute _audio_frame_stats() of mono 16-bit PCM samples without
+    converting them to float.
+
+    Sums, peak and clipping are accumulated on the integers (2 bytes per
+    sample instead of 4) and only the results are scaled by 1/32768, the
+    same scaling libsndfile applies when decoding to float.
+    """
+    num_frames = len(samples) // frame_size
+    stats_kernel = _parallel_stats_kernel(len(samples))
+    if stats_kernel is not None:
+        frame_rms = np.empty(num_frames, dtype=np.float32)
+        with _STATS_KERNEL_LOCK:
+            total, total_sq, peak, clip_count = stats_kernel(
+                np.ascontiguousarray(samples), float(_PCM16_CLIPPING_LEVEL), frame_size,
+                _stats_chunk_size(frame_size), frame_rms
+            )
+    else:
+        total = np.sum(samples, dtype=np.int64)
+        total_sq = np.einsum('i,i->', samples, samples, dtype=np.int64)
+        peak = max(int(samples.max()), -int(samples.min()))
+        clip_count = _pcm16_clipping_count(samples)
+        frames = samples[:num_frames * frame_size].reshape(num_frames, frame_size)
+        frame_energy = np.einsum('ij,ij->i', frames, frames, dtype=np.int64)
+        frame_rms = np.sqrt(frame_energy / frame_size).astype(np.float32)
+
+    scale = 1.0 / 32768
+    frame_rms *= np.float32(scale)
+    stats = (float(total) * scale, float(total_sq) * scale * scale, float(peak) * scale, int(clip_count))
+    return stats, frame_rms
+
+
+def _pcm16_clipping_count(samples: np.ndarray) -> int:
+    """
+    Count clipping samples directly on 16-bit PCM data.
+
+    Equivalent to |x / 32768| >= CLIPPING_THRESHOLD on the float conversion,
+    but compares 2-byte integers and never materializes the float buffer.
+    """
+    return int(
+        np.count_nonzero(samples >= _PCM16_CLIPPING_LEVEL)
+        + np.count_nonzero(samples <= -_PCM16_CLIPPING_LEVEL)
+    )
+
+
+def _to_db(rms):
+    """Convert linear RMS to dB (same epsilon as the report metrics)."""
+    return 20 * np.log10(rms + 1e-10)
+
+
+def _peak_amplitude(audio: np.ndarray) -> float:
+    """Maximum absolute sample value without allocating an np.abs() temporary."""
+    return float(max(audio.max(), -audio.min()))
+
+
+def _dc_block_pole(sample_rate: int) -> float:
+    """DC_BLOCK_POLE for audio at sample_rate, keeping the same cutoff frequency."""
+    # pole = exp(-2*pi*cutoff / sample_rate)
+    return DC_BLOCK_POLE ** (DIARIZATION_SAMPLE_RATE / sample_rate)
+
+
+def _dc_block(audio: np.ndarray, pole: float = DC_BLOCK_POLE) -> np.ndarray:
+    """
+    Remove DC offset with a streaming one-pole high-pass filter.
+
+    The filter state is seeded with the first sample so a constant offset
+    does not produce a start-up transient. Filters in place when the buffer
+    is a writable contiguous 1-D array and returns the filtered buffer.
+    """
+    if len(audio) == 0:
+        return audio
+    kernels = _numba_kernels()
+    if kernels is not None:
+        if not (audio.ndim == 1 and audio.flags.writeable and audio.flags.c_contiguous):
+            audio = np.array(audio, order='C')
+        kernels.dc_block_kernel(audio, pole)
+        return audio
+    if SCIPY_AVAILABLE:
+        from scipy.signal import lfilter
+        filtered = lfilter([1.0, -1.0], [1.0, -pole], audio, zi=[-audio[0]])[0]
+        return filtered.astype(audio.dtype, copy=False)
+    return audio - np.mean(audio)
+
+
+def _downmix(audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Average the channels of a (frames, channels) buffer into float32 mono.
+
+    Channels are summed straight into a float32 buffer (out, when given, so
+    block-wise callers can reuse one allocation) and scaled in place, so no
+    float64 or full-size temporary is created.
+    """
+    if out is None:
+        out = np.empty(audio.shape[0], dtype=np.float32)
+    np.sum(audio, axis=1, dtype=np.float32, out=out)
+    out *= np.float32(1.0 / audio.shape[1])
+    return out
+
+
+def _rms(audio: np.ndarray) -> float:
+    """Root-mean-square of a mono buffer, using numpy-rms for float32 input."""
+    if _fast_rms is not None and audio.dtype == np.float32 and audio.ndim == 1:
+        return float(_fast_rms(np.ascontiguousarray(audio))[0])
+    return float(np.sqrt(np.mean(audio * audio)))
+
+
+def _frame_rms(audio: np.ndarray, frame_size: int) -> np.ndarray:
+    """RMS of consecutive non-overlapping frames (trailing partial frame dropped)."""
+    num_frames = len(audio) // frame_size
+    trimmed = audio[:num_frames * frame_size]
+    if _fast_rms is not None and audio.dtype == np.float32 and audio.ndim == 1:
+        return _fast_rms(np.ascontiguousarray(trimmed), window_size=frame_size)
+    # Per-frame energy as a row-wise dot product: no squared copy of the buffer
+    frames = trimmed.reshape(num_frames, frame_size)
+    return np.sqrt(np.einsum('ij,ij->i', frames, frames) / frame_size)
+
 
 # ============================================================================
 # Enums and Data Classes
 # ============================================================================
 
+# Report/config dataclasses use __slots__ where supported (Python 3.10+) to
+# drop the per-instance __dict__ in batch analysis
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 class AudioQualityLevel(Enum):
     """Quality assessment levels."""
     EXCELLENT = "excellent"  # Optimal for diarization
@@ -147,7 +441,7 @@ class AudioQualityIssue(Enum):
     SAMPLE_RATE_MISMATCH = "sample_rate_mismatch"  # Non-optimal sample rate
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AudioQualityWarning:
     """Represents a single audio quality warning."""
     issue: AudioQualityIssue
@@ -168,7 +462,7 @@ class AudioQualityWarning:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AudioQualityReport:
     """
     Comprehensive audio quality report for diarization optimization.
@@ -209,13 +503,18 @@ class AudioQualityReport:
 
     @property
     def warning_count(self) -> int:
-        return len([w for w in self.warnings if w.severity == "warning"])
+        return self._severity_counts()["warning"]
 
     @property
     def error_count(self) -> int:
-        return len([w for w in self.warnings if w.severity == "error"])
+        return self._severity_counts()["error"]
+
+    def _severity_counts(self) -> Counter:
+        """Count warnings by severity in a single sweep."""
+        return Counter(w.severity for w in self.warnings)
 
     def to_dict(self) -> Dict[str, Any]:
+        severity_counts = self._severity_counts()
         return {
             "overall_quality": self.overall_quality.value,
             "diarization_suitability": round(self.diarization_suitability, 3),
@@ -237,15 +536,31 @@ class AudioQualityReport:
             },
             "warnings": [w.to_dict() for w in self.warnings],
             "summary": {
-                "has_warnings": self.has_warnings,
-                "has_critical_issues": self.has_critical_issues,
-                "warning_count": self.warning_count,
-                "error_count": self.error_count
+                "has_warnings": bool(self.warnings),
+                "has_critical_issues": severity_counts["error"] > 0,
+                "warning_count": severity_counts["warning"],
+                "error_count": severity_counts["error"]
             }
         }
 
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """
+        Serialize the report to UTF-8 JSON, using orjson when available.
 
-@dataclass
+        Args:
+            indent: Pretty-print with two-space indentation
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(self.to_dict(), option=option)
+        if indent:
+            return json.dumps(self.to_dict(), indent=2).encode("utf-8")
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DiarizationPreprocessingConfig:
     """
     Configuration for diarization-optimized audio preprocessing.
@@ -257,6 +572,7 @@ class DiarizationPreprocessingConfig:
     target_sample_rate: int = 16000
     target_channels: int = 1
     target_bit_depth: int = 16
+    output_format: str = DIARIZATION_OUTPUT_FORMAT  # Format of prepared diarization audio
 
     # Minimal processing (DEFAULT: enabled for diarization)
     remove_dc_offset: bool = True  # Remove DC offset (safe, doesn't affect speaker characteristics)
@@ -282,7 +598,8 @@ class DiarizationPreprocessingConfig:
             "target_format": {
                 "sample_rate": self.target_sample_rate,
                 "channels": self.target_channels,
-                "bit_depth": self.target_bit_depth
+                "bit_depth": self.target_bit_depth,
+                "output_format": self.output_format
             },
             "minimal_processing": {
                 "remove_dc_offset": self.remove_dc_offset,
@@ -340,43 +657,131 @@ class AudioQualityAnalyzer:
 
         # Ensure mono for analysis
         if len(audio.shape) > 1 and audio.shape[1] > 1:
-            audio = np.mean(audio, axis=1)
+            audio = _downmix(audio)
+
+        # Basic metrics, peak, clipping and per-frame RMS for noise floor
+        # estimation (20ms frames) from a single pass over the buffer
+        frame_size = int(0.02 * sample_rate)
+        stats, frame_rms = _audio_frame_stats(audio, frame_size)
+
+        self._apply_statistics(report, len(audio), stats, frame_rms)
+        return report
+
+    def analyze_stream(
+        self,
+        audio_path: str,
+        blocksize: int = STREAM_BLOCK_SIZE,
+        dtype: str = "int16"
+    ) -> AudioQualityReport:
+        """
+        Perform the same analysis as analyze() while reading the file in blocks.
 
-        # Basic metrics
-        report.peak_amplitude = float(np.max(np.abs(audio)))
-        report.dc_offset = float(np.mean(audio))
+        Peak memory is bounded by the block size plus one RMS value per 20ms
+        frame, so multi-hour recordings can be analyzed without decoding the
+        whole file into memory. Uncompressed WAV files are memory-mapped
+        rather than read through libsndfile.
+
+        Args:
+            audio_path: Path to audio file
+            blocksize: Approximate number of frames per block (rounded down
+                      to a whole number of 20ms analysis frames)
+            dtype: "int16" analyzes mono 16-bit PCM files on their integer
+                  samples; "float32" converts every block to float first
+
+        Returns:
+            AudioQualityReport with detailed analysis
+        """
+        info = None
+        if SOUNDFILE_AVAILABLE:
+            try:
+                info = _audio_info(audio_path)
+            except RuntimeError:
+                pass
+        if info is None:
+            # Not readable by libsndfile: decode through the fallback backends
+            audio, sample_rate = _decode_audio(audio_path)
+            return self.analyze(audio, sample_rate)
+
+        sample_rate = info.samplerate
+        num_samples = info.frames
+
+        report = AudioQualityReport()
+        report.sample_rate = sample_rate
+        report.channels = info.channels
+        report.duration_seconds = num_samples / sample_rate
+
+        # Blocks hold a whole number of frames so frame boundaries line up
+        frame_size = int(0.02 * sample_rate)
+        blocksize = max(frame_size, blocksize - blocksize % frame_size)
+        frame_rms = np.empty(num_samples // frame_size, dtype=np.float32)
+
+        # Mono 16-bit files are read and analyzed as integers, skipping the
+        # float conversion entirely
+        pcm16 = dtype == "int16" and info.subtype == 'PCM_16' and info.channels == 1
+        read_dtype = 'int16' if pcm16 else 'float32'
+
+        # Multichannel blocks are downmixed into one reused buffer
+        mono = np.empty(blocksize, dtype=np.float32) if info.channels > 1 else None
+
+        total = total_sq = peak = 0.0
+        clipping_samples = 0
+        frame_pos = 0
+        for block in _read_blocks(audio_path, info, blocksize, read_dtype):
+            if pcm16:
+                block_stats, block_frame_rms = _pcm16_frame_stats(block, frame_size)
+            else:
+                if block.ndim > 1:
+                    block = _downmix(block, mono[:len(block)])
+                block_stats, block_frame_rms = _audio_frame_stats(block, frame_size)
+            total += block_stats[0]
+            total_sq += block_stats[1]
+            peak = max(peak, block_stats[2])
+            clipping_samples += block_stats[3]
+
+            block_frames = len(block_frame_rms)
+            frame_rms[frame_pos:frame_pos + block_frames] = block_frame_rms
+            frame_pos += block_frames
+
+        self._apply_statistics(
+            report, num_samples, (total, total_sq, peak, clipping_samples), frame_rms[:frame_pos]
+        )
+        return report
+
+    def _apply_statistics(
+        self,
+        report: AudioQualityReport,
+        num_samples: int,
+        stats: Tuple[float, float, float, int],
+        frame_rms: np.ndarray
+    ) -> None:
+        """Derive report metrics, warnings and quality from accumulated statistics."""
+        total, total_sq, peak, clipping_samples = stats
+        report.peak_amplitude = peak
+        report.dc_offset = total / num_samples
 
         # RMS level
-        rms = np.sqrt(np.mean(audio ** 2))
+        rms = np.sqrt(total_sq / num_samples)
         report.rms_level_db = 20 * np.log10(rms + 1e-10)
 
         # Clipping detection
-        clipping_samples = np.sum(np.abs(audio) >= CLIPPING_THRESHOLD)
-        report.clipping_percentage = (clipping_samples / len(audio)) * 100
+        report.clipping_percentage = (clipping_samples / num_samples) * 100
 
         # Noise floor estimation (using lowest 10% of frames)
-        frame_size = int(0.02 * sample_rate)  # 20ms frames
-        if len(audio) >= frame_size:
-            num_frames = len(audio) // frame_size
-            frame_energies = []
-            for i in range(num_frames):
-                frame = audio[i * frame_size:(i + 1) * frame_size]
-                frame_rms = np.sqrt(np.mean(frame ** 2))
-                if frame_rms > 0:
-                    frame_energies.append(20 * np.log10(frame_rms + 1e-10))
-
-            if frame_energies:
-                frame_energies.sort()
-                # Use lowest 10% of frames as noise floor estimate
-                noise_frames = frame_energies[:max(1, len(frame_energies) // 10)]
-                report.noise_floor_db = float(np.mean(noise_frames))
-
-                # Dynamic range
-                report.dynamic_range_db = max(frame_energies) - min(frame_energies)
-
-                # Silence percentage
-                silent_frames = sum(1 for e in frame_energies if e < SILENCE_THRESHOLD_DB)
-                report.silence_percentage = (silent_frames / len(frame_energies)) * 100
+        # dB is monotonic in RMS, so selection and thresholds are done on the
+        # linear values and log10 is only evaluated for the frames needed
+        frame_rms = frame_rms[frame_rms > 0]
+        if frame_rms.size:
+            # Use lowest 10% of frames as noise floor estimate
+            k = max(1, frame_rms.size // 10)
+            noise_frames = np.partition(frame_rms, k - 1)[:k]
+            report.noise_floor_db = float(np.mean(_to_db(noise_frames)))
+
+            # Dynamic range
+            report.dynamic_range_db = float(_to_db(frame_rms.max()) - _to_db(frame_rms.min()))
+
+            # Silence percentage
+            silent_frames = np.count_nonzero(frame_rms + 1e-10 < _SILENCE_THRESHOLD_RMS)
+            report.silence_percentage = (silent_frames / frame_rms.size) * 100
 
         # SNR estimation
         report.estimated_snr_db = report.rms_level_db - report.noise_floor_db
@@ -387,8 +792,6 @@ class AudioQualityAnalyzer:
         # Calculate overall quality
         self._calculate_overall_quality(report)
 
-        return report
-
     def _generate_warnings(self, report: AudioQualityReport) -> None:
         """Generate warnings based on quality metrics."""
         warnings = []
@@ -468,50 +871,58 @@ class AudioQualityAnalyzer:
 
         # Short duration warning
         if report.duration_seconds < MIN_AUDIO_DURATION_S:
-            warnings.append(AudioQualityWarning(
-                issue=AudioQualityIssue.SHORT_DURATION,
-                severity="info",
-                message=f"Audio duration is very short ({report.duration_seconds:.2f}s)",
-                value=report.duration_seconds,
-                threshold=MIN_AUDIO_DURATION_S,
-                recommendation="Diarization works best with longer audio segments (>5 seconds)."
-            ))
+            warnings.append(self._short_duration_warning(report.duration_seconds))
 
         report.warnings = warnings
 
+    @staticmethod
+    def _short_duration_warning(duration_seconds: float) -> AudioQualityWarning:
+        """Warning for audio shorter than MIN_AUDIO_DURATION_S."""
+        return AudioQualityWarning(
+            issue=AudioQualityIssue.SHORT_DURATION,
+            severity="info",
+            message=f"Audio duration is very short ({duration_seconds:.2f}s)",
+            value=duration_seconds,
+            threshold=MIN_AUDIO_DURATION_S,
+            recommendation="Diarization works best with longer audio segments (>5 seconds)."
+        )
+
     def _calculate_overall_quality(self, report: AudioQualityReport) -> None:
         """Calculate overall quality score and level."""
-        # Start with perfect score
-        score = 1.0
+        # Start with perfect score and deduct for issues. Each deduction is a
+        # lookup indexed by how many thresholds the metric crosses (0, 1 or 2),
+        # which replaces the if/elif cascades with branch-free arithmetic.
+        clipping_level = (
+            int(report.clipping_percentage > CLIPPING_PERCENTAGE_WARNING)
+            + int(report.clipping_percentage > 1.0)
+        )
+        snr_level = (
+            int(report.estimated_snr_db < LOW_SNR_THRESHOLD_DB)
+            + int(report.estimated_snr_db < 5.0)
+        )
+        noise_level = (
+            int(report.noise_floor_db > HIGH_NOISE_FLOOR_DB)
+            + int(report.noise_floor_db > -25.0)
+        )
+        volume_level = int(report.rms_level_db < -40.0) + int(report.rms_level_db < -50.0)
+        dynamic_range_level = (
+            int(report.dynamic_range_db < MIN_DYNAMIC_RANGE_DB)
+            + int(report.dynamic_range_db < 10.0)
+        )
 
-        # Deduct for issues
-        if report.clipping_percentage > 1.0:
-            score -= 0.3
-        elif report.clipping_percentage > CLIPPING_PERCENTAGE_WARNING:
-            score -= 0.15
-
-        if report.estimated_snr_db < 5.0:
-            score -= 0.3
-        elif report.estimated_snr_db < LOW_SNR_THRESHOLD_DB:
-            score -= 0.15
-
-        if report.noise_floor_db > -25.0:
-            score -= 0.2
-        elif report.noise_floor_db > HIGH_NOISE_FLOOR_DB:
-            score -= 0.1
-
-        if report.rms_level_db < -50.0:
-            score -= 0.2
-        elif report.rms_level_db < -40.0:
-            score -= 0.1
-
-        if report.dynamic_range_db < 10.0:
-            score -= 0.15
-        elif report.dynamic_range_db < MIN_DYNAMIC_RANGE_DB:
-            score -= 0.05
-
-        # Clamp score
+        score = 1.0
+        score -= _CLIPPING_PENALTIES[clipping_level]
+        score -= _SNR_PENALTIES[snr_level]
+        score -= _NOISE_PENALTIES[noise_level]
+        score -= _VOLUME_PENALTIES[volume_level]
+        score -= _DYNAMIC_RANGE_PENALTIES[dynamic_range_level]
+
+        # Clamp score. Audio shorter than MIN_AUDIO_DURATION_S is unsuitable
+        # whatever its signal quality, which also lets the header-only check
+        # in validate_for_diarization reach the same verdict without decoding.
         score = max(0.0, min(1.0, score))
+        if report.duration_seconds < MIN_AUDIO_DURATION_S:
+            score = 0.0
         report.diarization_suitability = score
 
         # Determine quality level
@@ -527,6 +938,198 @@ class AudioQualityAnalyzer:
             report.overall_quality = AudioQualityLevel.CRITICAL
 
 
+# ============================================================================
+# Audio Loading
+# ============================================================================
+
+# NumPy dtypes for pydub sample widths (in bytes)
+_PCM_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+def _decode_audio(audio_path: str) -> Tuple[np.ndarray, int]:
+    """Decode an audio file to float32 samples using the available backend."""
+    if SOUNDFILE_AVAILABLE:
+        try:
+            audio, sample_rate = sf.read(audio_path, dtype='float32')
+            return audio, sample_rate
+        except RuntimeError:
+            # Containers libsndfile cannot decode (e.g. M4A/AAC) go through
+            # the slower ffmpeg-based backends below
+            if not (PYDUB_AVAILABLE or TORCHAUDIO_AVAILABLE):
+                raise
+    if PYDUB_AVAILABLE:
+        audio_segment = AudioSegment.from_file(audio_path)
+        sample_rate = audio_segment.frame_rate
+        sample_width = audio_segment.sample_width
+        dtype = _PCM_DTYPES.get(sample_width)
+        if dtype is not None:
+            # Reinterpret the raw PCM bytes directly (no per-sample Python objects)
+            raw = np.frombuffer(audio_segment.raw_data, dtype=dtype)
+            samples = raw.astype(np.float32) * np.float32(1.0 / (2 ** (sample_width * 8 - 1)))
+        else:
+            samples = np.array(audio_segment.get_array_of_samples(), dtype=np.float32)
+            samples = samples / (2 ** (sample_width * 8 - 1))
+        if audio_segment.channels == 2:
+            samples = samples.reshape((-1, 2))
+        return samples, sample_rate
+    if TORCHAUDIO_AVAILABLE:
+        waveform, sample_rate = torchaudio.load(audio_path)
+        return waveform.numpy().T.squeeze(), sample_rate
+    raise RuntimeError(
+        "No audio loading library available. "
+        "Install soundfile, pydub, or torchaudio."
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_info(audio_path: str, mtime_ns: int, size: int) -> Any:
+    """sf.info() keyed by file version (mtime and size are part of the key)."""
+    return sf.info(audio_path)
+
+
+def _audio_info(audio_path: str) -> Any:
+    """
+    Return soundfile's header information for audio_path.
+
+    The header is parsed once per file version and shared by the
+    validation and analysis steps that each need it. A file that is
+    rewritten gets a new mtime/size and is parsed again.
+    """
+    stat = os.stat(audio_path)
+    return _cached_info(os.path.abspath(audio_path), stat.st_mtime_ns, stat.st_size)
+
+
+# NumPy dtypes of memory-mappable WAV data, keyed by (format tag, bits per sample)
+_WAV_MMAP_DTYPES = {(1, 16): '<i2', (1, 32): '<i4', (3, 32): '<f4'}
+
+# WAVE_FORMAT_EXTENSIBLE: the real format tag is in the sub-format GUID
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def _mmap_wav(audio_path: str) -> Optional[np.memmap]:
+    """
+    Memory-map the sample data of an uncompressed WAV file.
+
+    Parses the RIFF header to locate the ``data`` chunk and maps it
+    read-only as a (frames, channels) array of 16/32-bit PCM or 32-bit
+    float samples. Nothing is read until a slice is accessed, so the OS
+    only pages in what the caller touches.
+
+    Returns:
+        The mapped samples, or None if the file is not a WAV file in one of
+        those encodings (callers then read it through soundfile)
+    """
+    with open(audio_path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            return None
+        fmt = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+            if chunk_id == b'fmt ':
+                fmt = f.read(chunk_size)
+                if chunk_size % 2:
+                    f.seek(1, os.SEEK_CUR)
+            elif chunk_id == b'data':
+                data_offset = f.tell()
+                break
+            else:
+                # Chunks are padded to an even size
+                f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+        file_size = os.fstat(f.fileno()).st_size
+
+    if fmt is None or len(fmt) < 16:
+        return None
+    format_tag, channels, _, _, block_align, bits = struct.unpack('<HHIIHH', fmt[:16])
+    if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        format_tag = struct.unpack('<H', fmt[24:26])[0]
+    dtype = _WAV_MMAP_DTYPES.get((format_tag, bits))
+    if dtype is None or channels == 0 or block_align != channels * bits // 8:
+        return None
+
+    # Streaming writers may leave the data size unset; trust the file size
+    data_size = min(chunk_size, file_size - data_offset)
+    num_frames = data_size // block_align
+    if num_frames == 0:
+        return None
+    return np.memmap(audio_path, dtype=dtype, mode='r', offset=data_offset, shape=(num_frames, channels))
+
+
+def _read_blocks(audio_path: str, info: Any, blocksize: int, dtype: str) -> Iterator[np.ndarray]:
+    """
+    Yield consecutive blocks of samples as soundfile.blocks() would.
+
+    Uncompressed WAV files are sliced from a memory map instead of being
+    copied through libsndfile; integer samples are scaled to float32
+    exactly as libsndfile does when dtype is 'float32'.
+    """
+    mapped = _mmap_wav(audio_path) if info.format == 'WAV' else None
+    if mapped is None or len(mapped) != info.frames:
+        yield from sf.blocks(audio_path, blocksize=blocksize, dtype=dtype, always_2d=False)
+        return
+
+    if mapped.shape[1] == 1:
+        mapped = mapped[:, 0]
+    scale = None
+    if mapped.dtype.kind == 'i' and dtype == 'float32':
+        scale = np.float32(1.0 / 2 ** (mapped.dtype.itemsize * 8 - 1))
+    for start in range(0, len(mapped), blocksize):
+        block = mapped[start:start + blocksize]
+        if scale is not None:
+            block = block.astype(np.float32) * scale
+        yield block
+
+
+# ============================================================================
+# Background Audio Writer
+# ============================================================================
+
+# Pending writes allowed before _save_audio blocks (each holds one buffer)
+MAX_PENDING_WRITES = 2
+
+
+class _AudioWriter:
+    """
+    Write processed audio on one background thread.
+
+    soundfile releases the GIL while encoding and writing, so a sequential
+    batch can decode and process the next file while the previous one is
+    saved. At most max_pending writes are queued; submit() blocks beyond
+    that so finished buffers cannot pile up in memory.
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING_WRITES):
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = []
+
+    def submit(self, output_path: str, write, *args) -> None:
+        """Queue write(*args), which saves output_path."""
+        self._slots.acquire()
+        future = self._executor.submit(write, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append((output_path, future))
+
+    def close(self) -> int:
+        """Wait for all queued writes; report failures and return their count."""
+        self._executor.shutdown(wait=True)
+        failures = 0
+        for output_path, future in self._pending:
+            error = future.exception()
+            if error is not None:
+                print(f"Error: failed to write {output_path}: {error}", file=sys.stderr)
+                failures += 1
+        self._pending.clear()
+        return failures
+
+
+# Set by main() for sequential batch runs; _save_audio then writes in the background
+_audio_writer: Optional[_AudioWriter] = None
+
+
 # ============================================================================
 # Diarization Audio Preprocessor
 # ============================================================================
@@ -564,8 +1167,10 @@ class DiarizationAudioPreprocessor:
     def prepare_for_diarization(
         self,
         audio_path: str,
-        output_path: Optional[str] = None
-    ) -> Tuple[str, AudioQualityReport]:
+        output_path: Optional[str] = None,
+        compute_quality: Optional[bool] = None,
+        output_format: Optional[str] = None
+    ) -> Tuple[str, Optional[AudioQualityReport]]:
         """
         Prepare audio file for optimal speaker diarization.
 
@@ -574,6 +1179,9 @@ class DiarizationAudioPreprocessor:
         - Removes DC offset
         - Applies gentle peak limiting
 
+        The result is written as 16-bit FLAC by default (config.output_format),
+        which is lossless and roughly halves the size of the intermediate file.
+
         IMPORTANT: Does NOT apply noise suppression, echo cancellation,
         or loudness normalization, as these destroy speaker characteristics.
 
@@ -581,10 +1189,54 @@ class DiarizationAudioPreprocessor:
             audio_path: Path to input audio file
             output_path: Optional path for processed output. If not provided,
                         creates a temporary file.
+            compute_quality: Whether to run the quality analysis pass. Defaults
+                            to config.validate_quality.
+            output_format: Container format to write ("flac" or "wav"). Defaults
+                          to the output_path extension when a path is given,
+                          otherwise to config.output_format.
+
+        Returns:
+            Tuple of (processed_audio_path, quality_report). quality_report is
+            None when the quality analysis was skipped.
+        """
+        processed_audio, sample_rate, quality_report = self.prepare_waveform(
+            audio_path, compute_quality=compute_quality
+        )
+
+        # Ensure output path
+        if output_path is None:
+            output_format = output_format or self.config.output_format
+            output_path = tempfile.mktemp(suffix=f"_diarization.{output_format}")
+
+        # Save processed audio
+        self._save_audio(processed_audio, sample_rate, output_path, output_format)
+
+        return output_path, quality_report
+
+    def prepare_waveform(
+        self,
+        audio_path: str,
+        compute_quality: Optional[bool] = None
+    ) -> Tuple[np.ndarray, int, Optional[AudioQualityReport]]:
+        """
+        Apply the prepare_for_diarization() processing and return the result in memory.
+
+        Callers that hand the audio straight to a model (diarize.py passes it
+        to the pyannote pipeline) skip encoding a temporary file and decoding
+        it again.
+
+        Args:
+            audio_path: Path to input audio file
+            compute_quality: Whether to run the quality analysis pass. Defaults
+                            to config.validate_quality.
 
         Returns:
-            Tuple of (processed_audio_path, quality_report)
+            Tuple of (mono float32 samples, sample_rate, quality_report).
+            quality_report is None when the quality analysis was skipped.
         """
+        if compute_quality is None:
+            compute_quality = self.config.validate_quality
+
         audio_path = Path(audio_path)
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
@@ -594,43 +1246,38 @@ class DiarizationAudioPreprocessor:
 
         # Ensure mono
         if len(audio.shape) > 1 and audio.shape[1] > 1:
-            audio = np.mean(audio, axis=1)
+            audio = _downmix(audio)
 
         # Analyze quality BEFORE processing
-        quality_report = self.quality_analyzer.analyze(audio, sample_rate)
+        quality_report = self.quality_analyzer.analyze(audio, sample_rate) if compute_quality else None
 
-        # Apply minimal processing
-        processed_audio = audio.copy()
+        # Apply minimal processing. The decoded buffer is owned by this call,
+        # so the steps below modify it in place instead of copying it first.
+        processed_audio = audio
 
         # Remove DC offset (safe for speaker embeddings)
         if self.config.remove_dc_offset:
-            dc_offset = np.mean(processed_audio)
-            processed_audio = processed_audio - dc_offset
+            processed_audio = _dc_block(processed_audio, _dc_block_pole(sample_rate))
 
         # Resample if needed
         if sample_rate != self.config.target_sample_rate:
             processed_audio = self._resample(
                 processed_audio, sample_rate, self.config.target_sample_rate
             )
-            quality_report.sample_rate = self.config.target_sample_rate
+            if quality_report is not None:
+                quality_report.sample_rate = self.config.target_sample_rate
 
         # Apply gentle peak limiting (to prevent clipping without affecting dynamics)
         if self.config.apply_peak_limiting:
-            peak = np.max(np.abs(processed_audio))
+            peak = _peak_amplitude(processed_audio)
             if peak > PEAK_LIMIT_RATIO:
                 # Soft limiting: only reduce peaks above threshold
                 processed_audio = self._soft_peak_limit(
-                    processed_audio, PEAK_LIMIT_RATIO
+                    processed_audio, PEAK_LIMIT_RATIO, in_place=True
                 )
 
-        # Ensure output path
-        if output_path is None:
-            output_path = tempfile.mktemp(suffix="_diarization.wav")
-
-        # Save processed audio
-        self._save_audio(processed_audio, self.config.target_sample_rate, output_path)
-
-        return output_path, quality_report
+        processed_audio = np.ascontiguousarray(processed_audio, dtype=np.float32)
+        return processed_audio, self.config.target_sample_rate, quality_report
 
     def prepare_for_transcription(
         self,
@@ -661,10 +1308,10 @@ class DiarizationAudioPreprocessor:
 
         # Ensure mono
         if len(audio.shape) > 1 and audio.shape[1] > 1:
-            audio = np.mean(audio, axis=1)
+            audio = _downmix(audio)
 
         # Remove DC offset
-        audio = audio - np.mean(audio)
+        audio = _dc_block(audio, _dc_block_pole(sample_rate))
 
         # Resample if needed
         if sample_rate != self.config.target_sample_rate:
@@ -676,7 +1323,7 @@ class DiarizationAudioPreprocessor:
 
         # Light normalization for transcription (NOT for diarization!)
         target_rms = 10 ** (-20.0 / 20)  # -20dB
-        current_rms = np.sqrt(np.mean(audio ** 2))
+        current_rms = _rms(audio)
         if current_rms > 1e-10:
             gain = target_rms / current_rms
             # Limit gain to prevent over-amplification
@@ -693,34 +1340,43 @@ class DiarizationAudioPreprocessor:
 
         return output_path
 
-    def analyze_quality(self, audio_path: str) -> AudioQualityReport:
+    def analyze_quality(self, audio_path: str, dtype: str = "int16") -> AudioQualityReport:
         """
         Analyze audio quality without processing.
 
         Use this to check if audio is suitable for diarization
-        before running the full pipeline.
+        before running the full pipeline. The file is read in blocks, so
+        memory use does not grow with the recording length.
 
         Args:
             audio_path: Path to audio file
+            dtype: Sample type for 16-bit PCM files ("int16" or "float32"),
+                  see AudioQualityAnalyzer.analyze_stream
 
         Returns:
             AudioQualityReport with detailed analysis
         """
-        audio, sample_rate = self._load_audio(audio_path)
-        return self.quality_analyzer.analyze(audio, sample_rate)
+        return self.quality_analyzer.analyze_stream(audio_path, dtype=dtype)
 
-    def validate_for_diarization(self, audio_path: str) -> Tuple[bool, AudioQualityReport]:
+    def validate_for_diarization(self, audio_path: str, dtype: str = "int16") -> Tuple[bool, AudioQualityReport]:
         """
         Validate if audio is suitable for accurate diarization.
 
         Args:
             audio_path: Path to audio file
+            dtype: Sample type for 16-bit PCM files ("int16" or "float32")
 
         Returns:
             Tuple of (is_suitable, quality_report)
             is_suitable is True if audio quality is acceptable for diarization
         """
-        report = self.analyze_quality(audio_path)
+        # Header-only check: audio too short for analysis is rejected
+        # without decoding the samples
+        header_report = self._short_audio_report(audio_path)
+        if header_report is not None:
+            return False, header_report
+
+        report = self.analyze_quality(audio_path, dtype)
 
         # Audio is suitable if quality is at least "fair" and no critical issues
         is_suitable = (
@@ -733,44 +1389,90 @@ class DiarizationAudioPreprocessor:
 
         return is_suitable, report
 
+    def _short_audio_report(self, audio_path: str) -> Optional[AudioQualityReport]:
+        """
+        Build a report from the file header alone if the audio is too short.
+
+        Returns None when the audio is long enough (or the header cannot be
+        read without decoding), in which case full analysis is required.
+        """
+        if not SOUNDFILE_AVAILABLE:
+            return None
+        try:
+            info = _audio_info(audio_path)
+        except RuntimeError:
+            return None
+
+        duration = info.frames / info.samplerate
+        if duration >= MIN_AUDIO_DURATION_S:
+            return None
+
+        report = AudioQualityReport(
+            sample_rate=info.samplerate,
+            channels=info.channels,
+            duration_seconds=duration,
+        )
+        # Same warning and scoring as full analysis of the decoded samples
+        report.warnings = [self.quality_analyzer._short_duration_warning(duration)]
+        self.quality_analyzer._calculate_overall_quality(report)
+        return report
+
     def _load_audio(self, audio_path: str) -> Tuple[np.ndarray, int]:
         """Load audio file using available backend."""
-        if SOUNDFILE_AVAILABLE:
-            audio, sample_rate = sf.read(audio_path, dtype='float32')
-            return audio, sample_rate
-        elif PYDUB_AVAILABLE:
-            audio_segment = AudioSegment.from_file(audio_path)
-            sample_rate = audio_segment.frame_rate
-            samples = np.array(audio_segment.get_array_of_samples(), dtype=np.float32)
-            samples = samples / (2 ** (audio_segment.sample_width * 8 - 1))
-            if audio_segment.channels == 2:
-                samples = samples.reshape((-1, 2))
-            return samples, sample_rate
-        elif TORCHAUDIO_AVAILABLE:
-            waveform, sample_rate = torchaudio.load(audio_path)
-            return waveform.numpy().T.squeeze(), sample_rate
-        else:
-            raise RuntimeError(
-                "No audio loading library available. "
-                "Install soundfile, pydub, or torchaudio."
-            )
+        return _decode_audio(audio_path)
 
-    def _save_audio(self, audio: np.ndarray, sample_rate: int, output_path: str) -> None:
-        """Save audio to WAV file."""
+    def _save_audio(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        output_path: str,
+        audio_format: Optional[str] = None
+    ) -> None:
+        """
+        Save audio as 16-bit PCM (WAV by default).
+
+        audio_format selects the container ("wav" or "flac"); when None it
+        is taken from the output_path extension.
+
+        Float32 buffers are clipped to [-1, 1] in place, so callers must pass
+        a buffer they own. During a batch run the write itself is queued on
+        the background writer and may complete after this method returns.
+        """
         # Ensure audio is float32 and in valid range
-        audio = np.clip(audio, -1.0, 1.0).astype(np.float32)
+        if audio.dtype == np.float32 and audio.flags.writeable:
+            np.clip(audio, -1.0, 1.0, out=audio)
+        else:
+            audio = np.clip(audio, -1.0, 1.0).astype(np.float32, copy=False)
 
         if SOUNDFILE_AVAILABLE:
-            sf.write(output_path, audio, sample_rate)
+            write = functools.partial(
+                sf.write, output_path, audio, sample_rate,
+                format=audio_format.upper() if audio_format else None,
+                subtype="PCM_16"
+            )
         elif TORCHAUDIO_AVAILABLE:
             waveform = torch.from_numpy(audio).unsqueeze(0) if len(audio.shape) == 1 else torch.from_numpy(audio.T)
-            torchaudio.save(output_path, waveform, sample_rate)
+            write = functools.partial(
+                torchaudio.save, output_path, waveform, sample_rate,
+                format=audio_format, encoding="PCM_S", bits_per_sample=16
+            )
         else:
             raise RuntimeError("No audio saving library available.")
 
+        if _audio_writer is not None:
+            _audio_writer.submit(output_path, write)
+        else:
+            write()
+
     def _resample(self, audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
         """Resample audio to target sample rate."""
-        if TORCHAUDIO_AVAILABLE:
+        if SCIPY_AVAILABLE:
+            # Polyphase FIR with anti-aliasing, e.g. 48k -> 16k is up=1, down=3
+            from scipy.signal import resample_poly
+            g = math.gcd(orig_sr, target_sr)
+            resampled = resample_poly(audio, target_sr // g, orig_sr // g, axis=0)
+            return resampled.astype(np.float32, copy=False)
+        elif TORCHAUDIO_AVAILABLE:
             resampler = torchaudio.transforms.Resample(orig_sr, target_sr)
             audio_tensor = torch.from_numpy(audio).float()
             if len(audio_tensor.shape) == 1:
@@ -778,18 +1480,25 @@ class DiarizationAudioPreprocessor:
             resampled = resampler(audio_tensor)
             return resampled.squeeze().numpy()
         else:
-            # Simple linear interpolation fallback
-            duration = len(audio) / orig_sr
-            target_length = int(duration * target_sr)
-            indices = np.linspace(0, len(audio) - 1, target_length)
-            return np.interp(indices, np.arange(len(audio)), audio)
+            # Linear interpolation has no anti-aliasing and would skew the
+            # noise/SNR metrics, so refuse rather than silently degrade
+            raise RuntimeError(
+                f"Cannot resample {orig_sr}Hz audio to {target_sr}Hz: "
+                "no resampling library available. Install scipy or torchaudio."
+            )
 
-    def _soft_peak_limit(self, audio: np.ndarray, threshold: float) -> np.ndarray:
+    def _soft_peak_limit(
+        self,
+        audio: np.ndarray,
+        threshold: float,
+        in_place: bool = False
+    ) -> np.ndarray:
         """
         Apply soft peak limiting to prevent clipping.
 
         Uses soft knee compression above threshold to preserve dynamics
-        while preventing peaks from exceeding the limit.
+        while preventing peaks from exceeding the limit. With in_place=True
+        the input buffer is modified and returned instead of a copy.
         """
         # Find samples above threshold
         above_threshold = np.abs(audio) > threshold
@@ -797,18 +1506,17 @@ class DiarizationAudioPreprocessor:
         if not np.any(above_threshold):
             return audio
 
-        result = audio.copy()
+        result = audio if in_place else audio.copy()
 
         # Apply soft compression to samples above threshold
-        # Using tanh-based soft clipper
-        for i in np.where(above_threshold)[0]:
-            sample = audio[i]
-            sign = np.sign(sample)
-            magnitude = np.abs(sample)
-            # Compress magnitude above threshold using tanh
-            excess = magnitude - threshold
-            compressed_excess = np.tanh(excess * 2) * (1 - threshold)
-            result[i] = sign * (threshold + compressed_excess)
+        # Using tanh-based soft clipper (vectorized over all peak samples)
+        selected = audio[above_threshold]
+        sign = np.sign(selected)
+        magnitude = np.abs(selected)
+        # Compress magnitude above threshold using tanh
+        excess = magnitude - threshold
+        compressed_excess = np.tanh(excess * 2.0) * (1.0 - threshold)
+        result[above_threshold] = sign * (threshold + compressed_excess)
 
         return result
 
@@ -832,14 +1540,28 @@ class DiarizationAudioPreprocessor:
 
         result = audio.copy()
 
-        for i in range(0, len(audio) - frame_size, hop_size):
-            frame = audio[i:i + frame_size]
-            rms = np.sqrt(np.mean(frame ** 2))
-
-            if rms < threshold:
-                # Fade out this frame
-                fade = np.linspace(1.0, 0.1, frame_size)
-                result[i:i + frame_size] *= fade
+        num_frames = len(range(0, len(audio) - frame_size, hop_size))
+        if num_frames == 0:
+            return result
+
+        # Per-frame RMS over a strided view (no frame copies, no squared temp)
+        windows = np.lib.stride_tricks.sliding_window_view(audio, frame_size)[::hop_size][:num_frames]
+        frame_rms = np.sqrt(np.einsum('ij,ij->i', windows, windows) / frame_size)
+        gated_frames = np.flatnonzero(frame_rms < threshold)
+        if gated_frames.size == 0:
+            return result
+
+        # Fade out gated frames. The ramp is built once and broadcast over a
+        # (frames, frame_size) index block; frames are split by phase so that
+        # no block contains overlapping frames and every fade is applied.
+        fade = np.linspace(1.0, 0.1, frame_size, dtype=result.dtype)
+        offsets = np.arange(frame_size)
+        num_phases = -(-frame_size // hop_size)
+        for phase in range(num_phases):
+            starts = gated_frames[gated_frames % num_phases == phase] * hop_size
+            if starts.size:
+                index = starts[:, None] + offsets
+                result[index] *= fade
 
         return result
 
@@ -848,10 +1570,29 @@ class DiarizationAudioPreprocessor:
 # Convenience Functions
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def get_preprocessor(validate_quality: bool = True) -> DiarizationAudioPreprocessor:
+    """
+    Return a shared preprocessor instance, constructed on first use.
+
+    Preprocessors hold no per-file state, so one instance per configuration
+    is reused by the convenience functions and CLI handlers.
+
+    Args:
+        validate_quality: Whether the preprocessor runs quality validation
+
+    Returns:
+        Cached DiarizationAudioPreprocessor
+    """
+    config = DiarizationPreprocessingConfig(validate_quality=validate_quality)
+    return DiarizationAudioPreprocessor(config)
+
+
 def prepare_audio_for_diarization(
     audio_path: str,
     output_path: Optional[str] = None,
-    validate_quality: bool = True
+    validate_quality: bool = True,
+    output_format: Optional[str] = None
 ) -> Tuple[str, Optional[AudioQualityReport]]:
     """
     Convenience function to prepare audio for diarization.
@@ -860,49 +1601,205 @@ def prepare_audio_for_diarization(
         audio_path: Path to input audio file
         output_path: Optional path for processed output
         validate_quality: Whether to perform quality validation
+        output_format: Optional output container ("flac" or "wav")
 
     Returns:
         Tuple of (processed_audio_path, quality_report or None)
     """
-    preprocessor = DiarizationAudioPreprocessor()
-
-    if validate_quality:
-        return preprocessor.prepare_for_diarization(audio_path, output_path)
-    else:
-        # Skip quality validation
-        config = DiarizationPreprocessingConfig(validate_quality=False)
-        preprocessor = DiarizationAudioPreprocessor(config)
-        processed_path, _ = preprocessor.prepare_for_diarization(audio_path, output_path)
-        return processed_path, None
+    return get_preprocessor(validate_quality).prepare_for_diarization(
+        audio_path, output_path, output_format=output_format
+    )
 
 
-def check_audio_quality(audio_path: str) -> AudioQualityReport:
+def check_audio_quality(audio_path: str, dtype: str = "int16") -> AudioQualityReport:
     """
     Check audio quality for diarization suitability.
 
     Args:
         audio_path: Path to audio file
+        dtype: Sample type for 16-bit PCM files ("int16" or "float32")
 
     Returns:
         AudioQualityReport with detailed analysis
     """
-    preprocessor = DiarizationAudioPreprocessor()
-    return preprocessor.analyze_quality(audio_path)
+    return get_preprocessor().analyze_quality(audio_path, dtype)
+
+
+def validate_audio_for_diarization(audio_path: str, dtype: str = "int16") -> Tuple[bool, AudioQualityReport]:
+    """
+    Validate if audio is suitable for accurate diarization.
+
+    Args:
+        audio_path: Path to audio file
+        dtype: Sample type for 16-bit PCM files ("int16" or "float32")
+
+    Returns:
+        Tuple of (is_suitable, quality_report)
+    """
+    return get_preprocessor().validate_for_diarization(audio_path, dtype)
 
 
 # ============================================================================
 # CLI Interface
 # ============================================================================
 
-def main():
-    """Command-line interface for diarization audio preprocessing."""
+# Process exit codes. validate reports unsuitable audio with its own code so
+# scripts can tell it apart from missing or unreadable files.
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_UNSUITABLE = 2
+
+# Icon shown before each warning, by severity
+_SEVERITY_ICONS = {"error": "!", "warning": "⚠", "info": "ℹ"}
+
+
+def _saved_message(output_path: str) -> str:
+    """
+    Report where processed audio was written. During sequential batch runs
+    the write is still queued on _audio_writer, which reports failures when
+    the batch ends.
+    """
+    if _audio_writer is not None:
+        return f"Processed audio queued for writing to: {output_path}"
+    return f"Processed audio saved to: {output_path}"
+
+
+def _cmd_prepare(args: argparse.Namespace, audio_file: str) -> Tuple[int, str]:
+    """Handle the ``prepare`` command for one file."""
+    print(f"Preparing audio for diarization: {audio_file}", file=sys.stderr)
+
+    output_path, quality_report = prepare_audio_for_diarization(
+        audio_file,
+        args.output,
+        validate_quality=not args.no_quality_check,
+        output_format=args.format
+    )
+
+    lines = [_saved_message(output_path)]
+
+    if quality_report:
+        lines.append(f"\nQuality Assessment: {quality_report.overall_quality.value.upper()}")
+        lines.append(f"Diarization Suitability: {quality_report.diarization_suitability:.1%}")
+
+        if quality_report.has_warnings:
+            lines.append("\nWarnings:")
+            lines.extend(
+                f"  {_SEVERITY_ICONS.get(warning.severity, 'ℹ')} {warning.message}"
+                + (f"\n    → {warning.recommendation}" if warning.recommendation else "")
+                for warning in quality_report.warnings
+            )
+    return 0, "\n".join(lines) + "\n"
+
+
+def _cmd_analyze(args: argparse.Namespace, audio_file: str) -> Tuple[int, str]:
+    """Handle the ``analyze`` command for one file."""
+    quality_report = check_audio_quality(audio_file, args.dtype)
+
+    if args.format == "json":
+        return 0, quality_report.to_json_bytes(indent=True).decode("utf-8") + "\n"
+
+    lines = [
+        f"Audio Quality Analysis: {audio_file}",
+        "=" * 60,
+        f"Overall Quality: {quality_report.overall_quality.value.upper()}",
+        f"Diarization Suitability: {quality_report.diarization_suitability:.1%}",
+        "",
+        "Metrics:",
+        f"  Peak Amplitude: {quality_report.peak_amplitude:.4f}",
+        f"  RMS Level: {quality_report.rms_level_db:.1f} dB",
+        f"  Noise Floor: {quality_report.noise_floor_db:.1f} dB",
+        f"  Estimated SNR: {quality_report.estimated_snr_db:.1f} dB",
+        f"  Dynamic Range: {quality_report.dynamic_range_db:.1f} dB",
+        f"  Clipping: {quality_report.clipping_percentage:.2f}%",
+        f"  Silence: {quality_report.silence_percentage:.1f}%",
+        "",
+        f"Duration: {quality_report.duration_seconds:.2f}s",
+        f"Sample Rate: {quality_report.sample_rate} Hz",
+    ]
+
+    if quality_report.has_warnings:
+        lines.append("")
+        lines.append("Warnings:")
+        lines.extend(
+            f"  {_SEVERITY_ICONS.get(warning.severity, 'ℹ')} [{warning.issue.value}] {warning.message}"
+            for warning in quality_report.warnings
+        )
+    return 0, "\n".join(lines) + "\n"
+
+
+def _cmd_transcribe(args: argparse.Namespace, audio_file: str) -> Tuple[int, str]:
+    """Handle the ``transcribe`` command for one file."""
+    print(f"Preparing audio for transcription: {audio_file}", file=sys.stderr)
+
+    output_path = get_preprocessor().prepare_for_transcription(
+        audio_file,
+        args.output,
+        apply_noise_reduction=not args.no_noise_reduction
+    )
+
+    return 0, _saved_message(output_path) + "\n"
+
+
+def _cmd_validate(args: argparse.Namespace, audio_file: str) -> Tuple[int, str]:
+    """Handle the ``validate`` command for one file."""
+    is_suitable, quality_report = validate_audio_for_diarization(audio_file, args.dtype)
+
+    if is_suitable:
+        lines = [f"✓ Audio is suitable for diarization"]
+    else:
+        lines = [f"✗ Audio may have issues affecting diarization accuracy"]
+    lines.append(f"  Quality: {quality_report.overall_quality.value}")
+    lines.append(f"  Suitability Score: {quality_report.diarization_suitability:.1%}")
+
+    if not is_suitable and quality_report.has_warnings:
+        lines.append("\nIssues detected:")
+        for warning in quality_report.warnings:
+            lines.append(f"  - {warning.message}")
+
+    # Exit with appropriate code
+    return (EXIT_OK if is_suitable else EXIT_UNSUITABLE), "\n".join(lines) + "\n"
+
+
+def _run_command(args: argparse.Namespace, audio_file: str) -> Tuple[int, str]:
+    """
+    Run one CLI command on one file.
+
+    Handlers return their complete output instead of printing it, so each
+    file's result is written with a single stdout write, in input order,
+    whether it ran here or in a worker process/thread. Defined at module
+    level so it can be sent to a ProcessPoolExecutor.
+
+    Returns:
+        Tuple of (exit_code, stdout_text)
+    """
+    # Handlers construct the (cached) preprocessor on demand, so argument
+    # errors and --help never pay for it
+    try:
+        return _COMMANDS[args.command](args, audio_file)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+    return EXIT_ERROR, ""
+
+
+# Per-file command handlers, keyed by subcommand name
+_COMMANDS = {
+    "prepare": _cmd_prepare,
+    "analyze": _cmd_analyze,
+    "transcribe": _cmd_transcribe,
+    "validate": _cmd_validate,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process; reused by ``serve``)."""
     parser = argparse.ArgumentParser(
         description="Audio Preprocessing Pipeline Optimized for Speaker Diarization",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   # Prepare audio for diarization (minimal processing)
-  python diarization_audio_preprocessor.py prepare audio.wav --output diarization_ready.wav
+  python diarization_audio_preprocessor.py prepare audio.wav --output diarization_ready.flac
 
   # Check audio quality without processing
   python diarization_audio_preprocessor.py analyze audio.wav
@@ -913,6 +1810,17 @@ Examples:
   # Validate audio suitability for diarization
   python diarization_audio_preprocessor.py validate audio.wav
 
+  # Validate a batch of files using 4 worker processes
+  python diarization_audio_preprocessor.py validate --jobs 4 recordings/*.wav
+
+  # Keep one process running and read commands from stdin (JSON lines out)
+  printf 'validate a.wav\nanalyze b.wav\n' | python diarization_audio_preprocessor.py serve
+
+Exit Codes:
+  0  success (validate: all files are suitable for diarization)
+  1  error, e.g. a file is missing or cannot be read
+  2  validate only: audio is readable but unsuitable for diarization
+
 Key Principles:
   - MINIMAL processing for diarization to preserve speaker embeddings
   - NO aggressive noise suppression (destroys speaker characteristics)
@@ -922,27 +1830,62 @@ Key Principles:
         """
     )
 
+    # Options shared by every command
+    files_parser = argparse.ArgumentParser(add_help=False)
+    files_parser.add_argument("audio_files", nargs="+", metavar="audio_file", help="Input audio file(s)")
+    files_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes when several files are given"
+    )
+
+    # Options for commands that only compute quality metrics
+    metrics_parser = argparse.ArgumentParser(add_help=False)
+    metrics_parser.add_argument(
+        "--dtype",
+        choices=["int16", "float32"],
+        default="int16",
+        help="Sample type used to analyze 16-bit PCM files (int16 skips the float conversion)"
+    )
+
+    # Options for commands that write processed audio (mostly I/O bound,
+    # so threads avoid the cost of starting worker processes)
+    output_parser = argparse.ArgumentParser(add_help=False)
+    output_parser.add_argument("--output", "-o", help="Output file path (single input file only)")
+    output_parser.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="Number of worker threads when several files are given"
+    )
+
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
     # Prepare command (for diarization)
     prepare_parser = subparsers.add_parser(
         "prepare",
+        parents=[files_parser, output_parser],
         help="Prepare audio for diarization (minimal processing)"
     )
-    prepare_parser.add_argument("audio_file", help="Input audio file")
-    prepare_parser.add_argument("--output", "-o", help="Output file path")
     prepare_parser.add_argument(
         "--no-quality-check",
         action="store_true",
         help="Skip quality validation"
     )
+    prepare_parser.add_argument(
+        "--format", "-f",
+        choices=["flac", "wav"],
+        default=None,
+        help="Output audio format (default: from the --output extension, else flac)"
+    )
 
     # Analyze command
     analyze_parser = subparsers.add_parser(
         "analyze",
+        parents=[files_parser, metrics_parser],
         help="Analyze audio quality without processing"
     )
-    analyze_parser.add_argument("audio_file", help="Input audio file")
     analyze_parser.add_argument(
         "--format", "-f",
         choices=["json", "text"],
@@ -953,10 +1896,9 @@ Key Principles:
     # Transcribe command (for transcription)
     transcribe_parser = subparsers.add_parser(
         "transcribe",
+        parents=[files_parser, output_parser],
         help="Prepare audio for transcription (may include noise reduction)"
     )
-    transcribe_parser.add_argument("audio_file", help="Input audio file")
-    transcribe_parser.add_argument("--output", "-o", help="Output file path")
     transcribe_parser.add_argument(
         "--no-noise-reduction",
         action="store_true",
@@ -964,110 +1906,142 @@ Key Principles:
     )
 
     # Validate command
-    validate_parser = subparsers.add_parser(
+    subparsers.add_parser(
         "validate",
-        help="Validate audio suitability for diarization"
+        parents=[files_parser, metrics_parser],
+        help="Validate audio suitability for diarization (exit code 2 if unsuitable)"
     )
-    validate_parser.add_argument("audio_file", help="Input audio file")
 
-    args = parser.parse_args()
+    # Serve command (persistent process)
+    subparsers.add_parser(
+        "serve",
+        help="Read commands from stdin, one per line, and write one JSON result per file"
+    )
 
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
+    return parser
 
-    try:
-        preprocessor = DiarizationAudioPreprocessor()
 
-        if args.command == "prepare":
-            print(f"Preparing audio for diarization: {args.audio_file}", file=sys.stderr)
+def _check_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject option combinations argparse cannot express."""
+    if getattr(args, "output", None) and len(args.audio_files) > 1:
+        parser.error("--output can only be used with a single input file")
 
-            output_path, quality_report = preprocessor.prepare_for_diarization(
-                args.audio_file,
-                args.output
-            )
 
-            print(f"Processed audio saved to: {output_path}")
+def _serve() -> int:
+    """
+    Run commands read from stdin against this process.
 
-            if quality_report and not args.no_quality_check:
-                print(f"\nQuality Assessment: {quality_report.overall_quality.value.upper()}")
-                print(f"Diarization Suitability: {quality_report.diarization_suitability:.1%}")
+    Each line holds the arguments of a normal invocation, e.g.
+    ``analyze --format json a.wav``. The parser, the imported modules and
+    the preprocessor are reused across lines, so per-command Python
+    startup is paid once. Files are processed sequentially; one JSON
+    object is written per input file (or per rejected line).
+    """
+    parser = _build_parser()
+    for line in sys.stdin:
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            _write_json_line({"error": str(e)})
+            continue
+        if not argv:
+            continue
+
+        # argparse prints --help and usage errors itself; capture them so
+        # nothing but JSON lines reaches stdout
+        usage = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(usage), contextlib.redirect_stderr(usage):
+                args = parser.parse_args(argv)
+                if args.command == "serve":
+                    parser.error("serve cannot be nested")
+                _check_args(parser, args)
+        except SystemExit as e:
+            message = usage.getvalue().strip()
+            if e.code == 0:
+                _write_json_line({"command": argv[0], "exit_code": 0, "output": message})
+            else:
+                _write_json_line({"command": argv[0], "error": message or "invalid arguments"})
+            continue
 
-                if quality_report.has_warnings:
-                    print("\nWarnings:")
-                    for warning in quality_report.warnings:
-                        icon = "!" if warning.severity == "error" else "⚠" if warning.severity == "warning" else "ℹ"
-                        print(f"  {icon} {warning.message}")
-                        if warning.recommendation:
-                            print(f"    → {warning.recommendation}")
+        for audio_file in args.audio_files:
+            exit_code, text = _run_command(args, audio_file)
+            _write_json_line({
+                "command": args.command,
+                "audio_file": audio_file,
+                "exit_code": exit_code,
+                "output": text,
+            })
+    return 0
 
-        elif args.command == "analyze":
-            quality_report = preprocessor.analyze_quality(args.audio_file)
 
-            if args.format == "json":
-                print(json.dumps(quality_report.to_dict(), indent=2))
-            else:
-                print(f"Audio Quality Analysis: {args.audio_file}")
-                print("=" * 60)
-                print(f"Overall Quality: {quality_report.overall_quality.value.upper()}")
-                print(f"Diarization Suitability: {quality_report.diarization_suitability:.1%}")
-                print()
-                print("Metrics:")
-                print(f"  Peak Amplitude: {quality_report.peak_amplitude:.4f}")
-                print(f"  RMS Level: {quality_report.rms_level_db:.1f} dB")
-                print(f"  Noise Floor: {quality_report.noise_floor_db:.1f} dB")
-                print(f"  Estimated SNR: {quality_report.estimated_snr_db:.1f} dB")
-                print(f"  Dynamic Range: {quality_report.dynamic_range_db:.1f} dB")
-                print(f"  Clipping: {quality_report.clipping_percentage:.2f}%")
-                print(f"  Silence: {quality_report.silence_percentage:.1f}%")
-                print()
-                print(f"Duration: {quality_report.duration_seconds:.2f}s")
-                print(f"Sample Rate: {quality_report.sample_rate} Hz")
-
-                if quality_report.has_warnings:
-                    print()
-                    print("Warnings:")
-                    for warning in quality_report.warnings:
-                        icon = "!" if warning.severity == "error" else "⚠" if warning.severity == "warning" else "ℹ"
-                        print(f"  {icon} [{warning.issue.value}] {warning.message}")
-
-        elif args.command == "transcribe":
-            print(f"Preparing audio for transcription: {args.audio_file}", file=sys.stderr)
-
-            output_path = preprocessor.prepare_for_transcription(
-                args.audio_file,
-                args.output,
-                apply_noise_reduction=not args.no_noise_reduction
-            )
+def _write_json_line(result: Dict[str, Any]) -> None:
+    """Write one result object as a JSON line and flush it to the caller."""
+    sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
 
-            print(f"Processed audio saved to: {output_path}")
 
-        elif args.command == "validate":
-            is_suitable, quality_report = preprocessor.validate_for_diarization(args.audio_file)
+def main():
+    """Command-line interface for diarization audio preprocessing."""
+    global _audio_writer
+    parser = _build_parser()
+    args = parser.parse_args()
 
-            if is_suitable:
-                print(f"✓ Audio is suitable for diarization")
-                print(f"  Quality: {quality_report.overall_quality.value}")
-                print(f"  Suitability Score: {quality_report.diarization_suitability:.1%}")
-            else:
-                print(f"✗ Audio may have issues affecting diarization accuracy")
-                print(f"  Quality: {quality_report.overall_quality.value}")
-                print(f"  Suitability Score: {quality_report.diarization_suitability:.1%}")
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
 
-                if quality_report.has_warnings:
-                    print("\nIssues detected:")
-                    for warning in quality_report.warnings:
-                        print(f"  - {warning.message}")
+    if args.command == "serve":
+        sys.exit(_serve())
+
+    _check_args(parser, args)
+    audio_files = args.audio_files
+
+    jobs = min(args.jobs, len(audio_files))
+    threads = min(getattr(args, "threads", 1), len(audio_files))
+    run = functools.partial(_run_command, args)
+
+    if jobs > 1:
+        # Spawned (not forked) workers: Numba's TBB threading layer is not
+        # fork-safe and forked children can hang at exit
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+            results = executor.map(run, audio_files)
+            exit_code = _write_results(results)
+    elif threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = executor.map(run, audio_files)
+            exit_code = _write_results(results)
+    elif args.command in ("prepare", "transcribe") and len(audio_files) > 1:
+        # Overlap each file's write with processing of the next one
+        _audio_writer = writer = _AudioWriter()
+        try:
+            exit_code = _write_results(map(run, audio_files))
+        finally:
+            _audio_writer = None
+            write_failures = writer.close()
+        if write_failures:
+            exit_code = _worst_exit_code(exit_code, EXIT_ERROR)
+    else:
+        exit_code = _write_results(map(run, audio_files))
 
-            # Exit with appropriate code
-            sys.exit(0 if is_suitable else 1)
+    if exit_code:
+        sys.exit(exit_code)
 
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+
+def _write_results(results: Iterable[Tuple[int, str]]) -> int:
+    """Write per-file command output as it becomes available; return the worst exit code."""
+    exit_code = EXIT_OK
+    for file_exit_code, text in results:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        exit_code = _worst_exit_code(exit_code, file_exit_code)
+    return exit_code
+
+
+def _worst_exit_code(a: int, b: int) -> int:
+    """Combine two exit codes: an error outranks unsuitable audio, which outranks success."""
+    return max(a, b, key=(EXIT_OK, EXIT_UNSUITABLE, EXIT_ERROR).index)
 
 
 if __name__ == "__main__":
@@ -32,13 +32,24 @@ Note:
 """
 
 import argparse
+import concurrent.futures
+import copy
+import hashlib
+import importlib.util
 import json
 import os
+import socket
+import socketserver
 import sys
+import threading
 import warnings
-from typing import Optional, Dict, Any, List, Tuple
+import weakref
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Iterable, Iterator, List, TextIO, Tuple, Union
 from pathlib import Path
 
+import numpy as np
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -58,42 +69,73 @@ warnings.filterwarnings(
     category=UserWarning
 )
 
-# PyTorch 2.6+ changed the default weights_only=True for torch.load()
-# This causes issues with pyannote.audio, whisperx, and other libraries that use omegaconf
-# We need to allowlist the necessary classes before importing torch
-try:
-    import typing
-    import collections
+# Persistent cache for compiled models (see Diarizer(compile_models=True)).
+# TorchInductor reads its cache location when torch is imported, so this is
+# set before torch is imported.
+COMPILE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "flow-recap")
+COMPILE_ARTIFACTS_PATH = os.path.join(COMPILE_CACHE_DIR, "diarize_compile.bin")
+os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", os.path.join(COMPILE_CACHE_DIR, "inductor"))
+
+# torch, torchaudio and pyannote.audio take seconds to import, so they are
+# imported by _ensure_pyannote() when the first Diarizer is created; the
+# formatting helpers and the ``serve`` client never pay for them.
+torch = None
+torchaudio = None
+ProgressHook = None
+_PYANNOTE_IMPORTED = False
+
+
+def _module_available(name: str) -> bool:
+    """Whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+PYANNOTE_AVAILABLE = all(_module_available(name) for name in ("torch", "torchaudio", "pyannote.audio"))
+if not PYANNOTE_AVAILABLE:
+    print("Warning: pyannote.audio not installed. Run 'pip install -r requirements.txt' first.")
+
+
+def _ensure_pyannote() -> None:
+    """Import torch, torchaudio and pyannote.audio once, on first use."""
+    global torch, torchaudio, ProgressHook, _PYANNOTE_IMPORTED
+    if _PYANNOTE_IMPORTED:
+        return
+
     import torch
-    import torch.serialization
-    # Allowlist omegaconf classes and other types used by pyannote.audio and whisperx models
-    from omegaconf import DictConfig, ListConfig
-    from omegaconf.base import ContainerMetadata
-    # Add built-in types and common classes needed for model deserialization
-    safe_globals = [DictConfig, ListConfig, ContainerMetadata, typing.Any, list, dict, tuple, set, collections.defaultdict]
-    # Try to add pyannote-specific classes if available
+
+    # PyTorch 2.6+ changed the default weights_only=True for torch.load()
+    # This causes issues with pyannote.audio, whisperx, and other libraries that use omegaconf
+    # We need to allowlist the necessary classes before loading any model
     try:
-        from pyannote.audio.core.model import Specifications
-        from pyannote.audio.core.task import Problem, Resolution
-        safe_globals.extend([Specifications, Problem, Resolution])
+        import typing
+        import collections
+        import torch.serialization
+        # Allowlist omegaconf classes and other types used by pyannote.audio and whisperx models
+        from omegaconf import DictConfig, ListConfig
+        from omegaconf.base import ContainerMetadata
+        # Add built-in types and common classes needed for model deserialization
+        safe_globals = [DictConfig, ListConfig, ContainerMetadata, typing.Any, list, dict, tuple, set, collections.defaultdict]
+        # Try to add pyannote-specific classes if available
+        try:
+            from pyannote.audio.core.model import Specifications
+            from pyannote.audio.core.task import Problem, Resolution
+            safe_globals.extend([Specifications, Problem, Resolution])
+        except ImportError:
+            pass
+        torch.serialization.add_safe_globals(safe_globals)
     except ImportError:
         pass
-    torch.serialization.add_safe_globals(safe_globals)
-except ImportError:
-    pass
-except Exception:
-    # If this fails, continue anyway - the fix may not be needed for older PyTorch versions
-    pass
+    except Exception:
+        # If this fails, continue anyway - the fix may not be needed for older PyTorch versions
+        pass
 
-# Attempt to import pyannote - will be available after pip install
-try:
-    from pyannote.audio import Pipeline
+    import torchaudio
     from pyannote.audio.pipelines.utils.hook import ProgressHook
-    import torch
-    PYANNOTE_AVAILABLE = True
-except ImportError:
-    PYANNOTE_AVAILABLE = False
-    print("Warning: pyannote.audio not installed. Run 'pip install -r requirements.txt' first.")
+    _PYANNOTE_IMPORTED = True
+
 
 # Import diarization-optimized audio preprocessing
 try:
@@ -108,6 +150,164 @@ except ImportError:
     # Preprocessing module not available - will proceed without preprocessing
 
 
+@dataclass
+class Segments:
+    """
+    Diarization segments as parallel arrays (structure of arrays).
+
+    Speaker lookups, statistics and RTTM output read these arrays directly
+    rather than pulling fields out of one dict per segment. speaker_id
+    indexes speakers, which lists labels in order of first appearance.
+    Segments from the pipeline are sorted by start time.
+    """
+    start: np.ndarray
+    end: np.ndarray
+    duration: np.ndarray
+    speaker_id: np.ndarray
+    speakers: List[str]
+    original_speakers: List[str] = field(default_factory=list)
+    _max_end: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @classmethod
+    def from_dicts(cls, segments: List[Dict]) -> "Segments":
+        """Build from a list of segment dicts (as in a diarize() result)."""
+        count = len(segments)
+        start = np.fromiter((seg["start"] for seg in segments), dtype=np.float64, count=count)
+        end = np.fromiter((seg["end"] for seg in segments), dtype=np.float64, count=count)
+        duration = np.fromiter((seg["duration"] for seg in segments), dtype=np.float64, count=count)
+        labels, first_index, inverse = np.unique(
+            [seg["speaker"] for seg in segments], return_index=True, return_inverse=True
+        )
+        # Renumber speakers in order of first appearance
+        order = np.argsort(first_index)
+        rank = np.empty(len(order), dtype=np.int32)
+        rank[order] = np.arange(len(order), dtype=np.int32)
+        return cls(
+            start=start,
+            end=end,
+            duration=duration,
+            speaker_id=rank[inverse.reshape(-1)],
+            speakers=labels[order].tolist(),
+        )
+
+    def to_dict_list(self) -> List[Dict[str, Any]]:
+        """Return one JSON-serializable dict per segment."""
+        return list(self.iter_dicts())
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield one JSON-serializable dict per segment, building each on demand."""
+        ids = self.speaker_id.tolist()
+        for start, end, duration, i in zip(
+            self.start.tolist(), self.end.tolist(), self.duration.tolist(), ids
+        ):
+            seg = {"start": start, "end": end, "duration": duration, "speaker": self.speakers[i]}
+            if self.original_speakers:
+                # Keep original pyannote labels for debugging
+                seg["original_speaker"] = self.original_speakers[i]
+            yield seg
+
+    def sorted_by_start(self) -> "Segments":
+        """Return the segments ordered by start time (self if already ordered)."""
+        if np.all(self.start[1:] >= self.start[:-1]):
+            return self
+        # Stable sort keeps the original order among segments starting together
+        order = np.argsort(self.start, kind="stable")
+        return Segments(
+            start=self.start[order],
+            end=self.end[order],
+            duration=self.duration[order],
+            speaker_id=self.speaker_id[order],
+            speakers=self.speakers,
+            original_speakers=self.original_speakers,
+        )
+
+    @property
+    def max_end(self) -> np.ndarray:
+        """
+        Running maximum of end times.
+
+        Segments may overlap (overlapped speech), so end is not sorted even
+        when start is; max_end is, and locates the first segment that can
+        still reach a given time.
+        """
+        if self._max_end is None:
+            self._max_end = np.maximum.accumulate(self.end) if len(self.end) else self.end
+        return self._max_end
+
+
+# Loaded pipelines keyed by (model name, device, token hash). Each Diarizer
+# keeps a reference to the entry it used, so an entry lives as long as one
+# of them does.
+_PIPELINE_CACHE: "weakref.WeakValueDictionary[Tuple[str, str, str], Any]" = weakref.WeakValueDictionary()
+_PIPELINE_CACHE_LOCK = threading.Lock()
+
+
+def _pipeline_models(pipeline):
+    """
+    Yield (name, component, attribute, model) for the pipeline's models.
+
+    The model lives on .model (segmentation Inference) or .model_
+    (pretrained speaker embedding wrappers).
+    """
+    for name in ("_segmentation", "_embedding"):
+        component = getattr(pipeline, name, None)
+        for attr in ("model", "model_"):
+            model = getattr(component, attr, None)
+            if isinstance(model, torch.nn.Module):
+                yield name, component, attr, model
+                break
+
+
+def _copy_pipeline(pipeline):
+    """
+    Copy a pipeline so it can be configured independently.
+
+    instantiate() and the batch-size, compile and embedding patches all
+    modify the pipeline (and its sub-pipelines) in place, so every Diarizer
+    works on its own copy. The models' weights are shared, not copied.
+    """
+    memo = {id(model): model for _, _, _, model in _pipeline_models(pipeline)}
+    return copy.deepcopy(pipeline, memo)
+
+
+class _ActiveSpeakerEmbedding:
+    """
+    Speaker embedding model that skips rows whose mask is all zeros.
+
+    pyannote embeds every (chunk, local speaker) pair, but most chunks hold
+    fewer speakers than the segmentation model's three slots, so many rows
+    of each batch are empty masks. Those rows get NaN, which is what the
+    embedding models return for masks too short to embed and what the
+    clustering step already filters out. Every other attribute is delegated
+    to the wrapped model.
+    """
+
+    def __init__(self, embedding):
+        self._wrapped = embedding
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped, name)
+
+    def __call__(self, waveforms, masks=None):
+        if masks is None:
+            return self._wrapped(waveforms)
+
+        active = masks.sum(dim=-1) > 0
+        num_active = int(active.sum())
+        if num_active == len(active):
+            return self._wrapped(waveforms, masks=masks)
+
+        embeddings = np.full((len(active), self._wrapped.dimension), np.nan, dtype=np.float32)
+        if num_active:
+            embeddings[active.cpu().numpy()] = self._wrapped(
+                waveforms[active], masks=masks[active]
+            )
+        return embeddings
+
+
 class Diarizer:
     """
     A class to handle speaker diarization using pyannote.audio.
@@ -119,6 +319,10 @@ class Diarizer:
         enable_preprocessing (bool): Whether to apply diarization-optimized preprocessing
         quality_check (bool): Whether to validate audio quality before diarization
         clustering_threshold (float): Threshold for speaker clustering (0.0-2.0)
+        embedding_batch_size (int): Chunks per speaker-embedding forward pass
+        segmentation_batch_size (int): Chunks per segmentation forward pass
+        compile_models (bool): Whether to torch.compile the pipeline's models
+        use_fp16 (bool): Whether inference runs under fp16 autocast (CUDA only)
     """
 
     # Default pyannote model
@@ -130,6 +334,12 @@ class Diarizer:
     # (especially useful for compressed audio from videos or calls)
     DEFAULT_CLUSTERING_THRESHOLD = 0.35
 
+    # pyannote's own defaults. The embedding batch dominates peak VRAM; lower
+    # it (e.g. 8-16) on small GPUs so the model stays on-device, raise it on
+    # large GPUs for throughput.
+    DEFAULT_EMBEDDING_BATCH_SIZE = 32
+    DEFAULT_SEGMENTATION_BATCH_SIZE = 32
+
     def __init__(
         self,
         model_name: str = DEFAULT_MODEL,
@@ -137,7 +347,11 @@ class Diarizer:
         hf_token: Optional[str] = None,
         enable_preprocessing: bool = True,
         quality_check: bool = True,
-        clustering_threshold: Optional[float] = None
+        clustering_threshold: Optional[float] = None,
+        embedding_batch_size: Optional[int] = None,
+        segmentation_batch_size: Optional[int] = None,
+        compile_models: bool = False,
+        use_fp16: Optional[bool] = None
     ):
         """
         Initialize the Diarizer.
@@ -152,14 +366,28 @@ class Diarizer:
                                  Lower values = more speakers detected (more sensitive).
                                  Higher values = fewer speakers (more tolerant).
                                  Default: 0.5 (more sensitive than pyannote's default ~0.7)
+            embedding_batch_size: Chunks per embedding forward pass (default: 32).
+                                 Lower values reduce peak GPU memory.
+            segmentation_batch_size: Chunks per segmentation forward pass (default: 32)
+            compile_models: torch.compile the segmentation and embedding models
+                           (default: False). Compiled artifacts are cached under
+                           ~/.cache/flow-recap, so only the first run pays the
+                           full compilation time.
+            use_fp16: Run the segmentation and embedding forward passes under
+                     fp16 autocast. Defaults to True on CUDA; ignored on CPU.
         """
         if not PYANNOTE_AVAILABLE:
             raise RuntimeError("pyannote.audio is not installed. Please run 'pip install -r requirements.txt'")
+        _ensure_pyannote()
 
         self.model_name = model_name
         self.enable_preprocessing = enable_preprocessing and PREPROCESSOR_AVAILABLE
         self.quality_check = quality_check
         self.clustering_threshold = clustering_threshold if clustering_threshold is not None else self.DEFAULT_CLUSTERING_THRESHOLD
+        self.embedding_batch_size = embedding_batch_size or self.DEFAULT_EMBEDDING_BATCH_SIZE
+        self.segmentation_batch_size = segmentation_batch_size or self.DEFAULT_SEGMENTATION_BATCH_SIZE
+        self.compile_models = compile_models
+        self._compile_cache_saved = False
 
         # Get HF token from parameter or environment
         self.hf_token = hf_token or os.environ.get("HF_TOKEN")
@@ -176,7 +404,11 @@ class Diarizer:
         else:
             self.device = torch.device(device)
 
+        # fp16 autocast only pays off on GPUs (tensor cores)
+        self.use_fp16 = self.device.type == "cuda" and use_fp16 is not False
+
         self.pipeline = None
+        self._base_pipeline = None
 
         # Initialize audio preprocessor if available
         self.preprocessor = None
@@ -192,33 +424,53 @@ class Diarizer:
 
     def load_pipeline(self) -> None:
         """Load the pyannote diarization pipeline and apply clustering threshold."""
-        print(f"Loading pyannote pipeline '{self.model_name}' on {self.device}...")
-        self.pipeline = Pipeline.from_pretrained(
+        from pyannote.audio import Pipeline
+
+        # Diarizers for the same model and device (e.g. with different
+        # thresholds) share one loaded pipeline
+        key = (
             self.model_name,
-            use_auth_token=self.hf_token
+            str(self.device),
+            hashlib.sha256(self.hf_token.encode("utf-8")).hexdigest()
         )
-        self.pipeline = self.pipeline.to(self.device)
+        with _PIPELINE_CACHE_LOCK:
+            base_pipeline = _PIPELINE_CACHE.get(key)
+            if base_pipeline is None:
+                print(f"Loading pyannote pipeline '{self.model_name}' on {self.device}...")
+                base_pipeline = Pipeline.from_pretrained(
+                    self.model_name,
+                    use_auth_token=self.hf_token
+                )
+                base_pipeline = base_pipeline.to(self.device)
+                _PIPELINE_CACHE[key] = base_pipeline
+            else:
+                print(f"Reusing loaded pyannote pipeline '{self.model_name}' on {self.device}")
+        self._base_pipeline = base_pipeline
+        self.pipeline = _copy_pipeline(base_pipeline)
+
+        if self.device.type == "cuda":
+            # Input shapes are fixed per model (constant-length chunks), so
+            # cuDNN's autotuned kernels are picked once and then reused
+            torch.backends.cudnn.benchmark = True
 
         # Apply clustering threshold to improve speaker separation
         # Lower threshold = more sensitive to speaker differences = more speakers detected
         if self.clustering_threshold is not None:
+            # Full parameter dumps only with DIARIZATION_DEBUG=1 (as in live_diarize.py)
+            debug = os.environ.get("DIARIZATION_DEBUG", "0") == "1"
             try:
                 # Get current parameters
                 params = self.pipeline.parameters(instantiated=True)
-                print(f"[Diarization] Original pipeline parameters: {dict(params)}")
+                if debug:
+                    print(f"[Diarization] Original pipeline parameters: {dict(params)}")
 
                 # Build new parameters by merging with existing ones
                 # Only update clustering threshold to preserve other optimized parameters
-                new_params = {}
-
                 # Copy segmentation parameters if they exist
-                if "segmentation" in params or hasattr(params, 'get'):
-                    try:
-                        for key, value in dict(params).items():
-                            if key.startswith("segmentation"):
-                                new_params[key] = value
-                    except Exception:
-                        pass
+                new_params = {
+                    key: value for key, value in params.items()
+                    if isinstance(key, str) and key.startswith("segmentation")
+                }
 
                 # Set the new clustering threshold
                 new_params["clustering"] = {
@@ -230,18 +482,76 @@ class Diarizer:
                 print(f"[Diarization] Applied clustering threshold: {self.clustering_threshold}")
 
                 # Verify the change
-                updated_params = self.pipeline.parameters(instantiated=True)
-                print(f"[Diarization] Updated pipeline parameters: {dict(updated_params)}")
+                if debug:
+                    updated_params = self.pipeline.parameters(instantiated=True)
+                    print(f"[Diarization] Updated pipeline parameters: {dict(updated_params)}")
 
             except Exception as e:
                 print(f"[Diarization] Warning: Could not set clustering threshold: {e}")
                 print("[Diarization] Proceeding with default pipeline parameters...")
 
+        # Batch sizes are plain attributes (not hyper-parameters), so they are
+        # set on the final, instantiated pipeline
+        self.pipeline.embedding_batch_size = self.embedding_batch_size
+        self.pipeline.segmentation_batch_size = self.segmentation_batch_size
+        print(
+            f"[Diarization] Batch sizes: embedding={self.embedding_batch_size}, "
+            f"segmentation={self.segmentation_batch_size}"
+        )
+
+        if self.compile_models:
+            self._compile_models()
+
+        # Wrapped after compilation, which replaces the model inside it
+        if hasattr(self.pipeline, "_embedding"):
+            self.pipeline._embedding = _ActiveSpeakerEmbedding(self.pipeline._embedding)
+
         print("Pipeline loaded successfully.")
 
+    def _compile_models(self) -> None:
+        """
+        Wrap the segmentation and embedding models with torch.compile.
+
+        Artifacts saved by a previous run are loaded first, so compilation
+        is a cache lookup rather than a full Inductor build.
+        """
+        if not hasattr(torch, "compile"):
+            print("[Diarization] Warning: torch.compile requires PyTorch 2.0+, running uncompiled")
+            self.compile_models = False
+            return
+
+        if os.path.exists(COMPILE_ARTIFACTS_PATH) and hasattr(torch.compiler, "load_cache_artifacts"):
+            try:
+                with open(COMPILE_ARTIFACTS_PATH, "rb") as f:
+                    torch.compiler.load_cache_artifacts(f.read())
+                self._compile_cache_saved = True
+                print(f"[Diarization] Loaded compiled model cache from {COMPILE_ARTIFACTS_PATH}")
+            except Exception as e:
+                print(f"[Diarization] Warning: Could not load compiled model cache: {e}")
+
+        for name, component, attr, model in list(_pipeline_models(self.pipeline)):
+            setattr(component, attr, torch.compile(model, mode="reduce-overhead"))
+            print(f"[Diarization] Compiled {name.lstrip('_')} model")
+
+    def _save_compile_cache(self) -> None:
+        """Persist compiled artifacts after the first run that produced them."""
+        self._compile_cache_saved = True
+        if not hasattr(torch.compiler, "save_cache_artifacts"):
+            return
+        try:
+            artifacts = torch.compiler.save_cache_artifacts()
+            if artifacts is None:
+                return
+            os.makedirs(COMPILE_CACHE_DIR, exist_ok=True)
+            with open(COMPILE_ARTIFACTS_PATH, "wb") as f:
+                f.write(artifacts[0])
+            print(f"[Diarization] Saved compiled model cache to {COMPILE_ARTIFACTS_PATH}")
+        except Exception as e:
+            print(f"[Diarization] Warning: Could not save compiled model cache: {e}")
+
     def diarize(
         self,
-        audio_path: str,
+        audio_path: Union[str, Tuple["torch.Tensor", int]],
         num_speakers: Optional[int] = None,
         min_speakers: Optional[int] = None,
         max_speakers: Optional[int] = None,
@@ -260,8 +570,14 @@ class Diarizer:
             Aggressive processing (noise suppression, echo cancellation,
             loudness normalization) is DISABLED to preserve speaker characteristics.
 
+        The audio is decoded once and handed to the pipeline as an in-memory
+        waveform; given a file path, pyannote would re-open and re-decode the
+        file for every chunk it crops.
+
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file, or an already loaded
+                       (waveform, sample_rate) tuple with a (channel, time)
+                       tensor, which is diarized as-is without preprocessing
             num_speakers: Exact number of speakers (if known)
             min_speakers: Minimum number of speakers
             max_speakers: Maximum number of speakers
@@ -270,41 +586,33 @@ class Diarizer:
         Returns:
             Dictionary containing diarization results with speaker segments
         """
-        if self.pipeline is None:
-            self.load_pipeline()
-
-        # Validate audio file
-        audio_path = Path(audio_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-
-        # Apply diarization-optimized preprocessing
-        processed_audio_path = str(audio_path)
-        quality_report = None
-
-        if self.preprocessor is not None:
-            print("[Diarization] Preprocessing audio for optimal diarization...")
-            try:
-                processed_audio_path, quality_report = self.preprocessor.prepare_for_diarization(
-                    str(audio_path)
-                )
-                print(f"[Diarization] Preprocessed audio saved to: {processed_audio_path}")
-
-                # Log quality warnings
-                if quality_report and quality_report.has_warnings:
-                    print(f"[Diarization] Audio quality: {quality_report.overall_quality.value}")
-                    for warning in quality_report.warnings:
-                        icon = "!" if warning.severity == "error" else "⚠" if warning.severity == "warning" else "ℹ"
-                        print(f"[Diarization] {icon} {warning.message}")
-                        if warning.recommendation:
-                            print(f"[Diarization]   → {warning.recommendation}")
-
-            except Exception as e:
-                print(f"[Diarization] Warning: Preprocessing failed: {e}")
-                print("[Diarization] Proceeding with original audio file...")
-                processed_audio_path = str(audio_path)
+        result, _ = self._diarize_segments(
+            audio_path, num_speakers, min_speakers, max_speakers, show_progress
+        )
+        return result
 
-        print(f"Diarizing audio from {processed_audio_path}...")
+    def _diarize_segments(
+        self,
+        audio_path: Union[str, Tuple["torch.Tensor", int]],
+        num_speakers: Optional[int],
+        min_speakers: Optional[int],
+        max_speakers: Optional[int],
+        show_progress: bool
+    ) -> Tuple[Dict[str, Any], Segments]:
+        """Run diarize() and also return its segments as a Segments object."""
+        # Model loading (disk/GPU-bound) overlaps with preprocessing (CPU-bound)
+        pipeline_load = self._start_pipeline_load() if self.pipeline is None else None
+
+        try:
+            audio_path, processed_audio_path, quality_report, audio_input = (
+                self._prepare_input(audio_path)
+            )
+        finally:
+            if pipeline_load is not None:
+                # Even if preparing the audio failed, so no load is left running
+                concurrent.futures.wait([pipeline_load])
+        if pipeline_load is not None:
+            self._finish_pipeline_load(pipeline_load)
 
         # Prepare diarization parameters
         diarization_params = {}
@@ -315,29 +623,41 @@ class Diarizer:
         if max_speakers is not None:
             diarization_params["max_speakers"] = max_speakers
 
-        # Run diarization with optional progress hook
-        if show_progress:
-            with ProgressHook() as hook:
-                diarization = self.pipeline(
-                    processed_audio_path,
-                    hook=hook,
-                    **diarization_params
-                )
-        else:
-            diarization = self.pipeline(processed_audio_path, **diarization_params)
+        if self.device.type == "cuda":
+            torch.cuda.reset_peak_memory_stats(self.device)
+
+        # Run diarization with optional progress hook. No gradients are
+        # needed, and on CUDA the forward passes run in fp16 under autocast.
+        with torch.inference_mode(), torch.autocast(
+            device_type=self.device.type, dtype=torch.float16, enabled=self.use_fp16
+        ):
+            if show_progress:
+                with ProgressHook() as hook:
+                    diarization = self.pipeline(
+                        audio_input,
+                        hook=hook,
+                        **diarization_params
+                    )
+            else:
+                diarization = self.pipeline(audio_input, **diarization_params)
+
+        if self.compile_models and not self._compile_cache_saved:
+            self._save_compile_cache()
+
+        if self.device.type == "cuda":
+            # Reported so the batch sizes can be tuned to the GPU
+            peak_vram_mb = torch.cuda.max_memory_allocated(self.device) / 2**20
+            print(f"[Diarization] Peak GPU memory: {peak_vram_mb:.0f} MB")
 
         # Convert to structured format
         segments = self._convert_to_segments(diarization)
 
-        # Get unique speakers
-        speakers = list(set(seg["speaker"] for seg in segments))
-
         result = {
-            "segments": segments,
-            "speakers": speakers,
-            "num_speakers": len(speakers),
+            "segments": segments.to_dict_list(),
+            "speakers": list(segments.speakers),
+            "num_speakers": len(segments.speakers),
             "metadata": {
-                "audio_file": str(audio_path),
+                "audio_file": str(audio_path) if audio_path is not None else None,
                 "processed_audio_file": processed_audio_path if processed_audio_path != str(audio_path) else None,
                 "model": self.model_name,
                 "device": str(self.device),
@@ -345,7 +665,10 @@ class Diarizer:
                 "requested_min_speakers": min_speakers,
                 "requested_max_speakers": max_speakers,
                 "preprocessing_applied": self.preprocessor is not None,
-                "clustering_threshold": self.clustering_threshold
+                "clustering_threshold": self.clustering_threshold,
+                "embedding_batch_size": self.embedding_batch_size,
+                "segmentation_batch_size": self.segmentation_batch_size,
+                "fp16": self.use_fp16
             }
         }
 
@@ -353,38 +676,167 @@ class Diarizer:
         if quality_report:
             result["audio_quality"] = quality_report.to_dict()
 
-        return result
+        return result, segments
+
+    def _prepare_input(
+        self,
+        audio_path: Union[str, Tuple["torch.Tensor", int]]
+    ) -> Tuple[Optional[Path], Optional[str], Optional["AudioQualityReport"], Union[Dict[str, Any], str]]:
+        """
+        Validate, preprocess and decode the audio given to diarize().
+
+        Returns:
+            Tuple of (audio path or None for a preloaded waveform, path of the
+            audio file actually diarized or None when it was processed in
+            memory, quality report, pipeline input)
+        """
+        preloaded = None
+        if isinstance(audio_path, tuple):
+            waveform, sample_rate = audio_path
+            preloaded = {"waveform": waveform, "sample_rate": sample_rate}
+            audio_path = None
+        else:
+            # Validate audio file
+            audio_path = Path(audio_path)
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        # Apply diarization-optimized preprocessing
+        processed_audio_path = str(audio_path) if audio_path is not None else None
+        quality_report = None
+
+        if self.preprocessor is not None and preloaded is None:
+            print("[Diarization] Preprocessing audio for optimal diarization...")
+            try:
+                # Handed to the pipeline in memory: no temporary file is
+                # encoded only to be decoded again
+                samples, sample_rate, quality_report = self.preprocessor.prepare_waveform(
+                    str(audio_path),
+                    compute_quality=self.quality_check
+                )
+                preloaded = {
+                    "waveform": torch.from_numpy(samples).unsqueeze(0),
+                    "sample_rate": sample_rate
+                }
+                processed_audio_path = None
+                print("[Diarization] Audio preprocessed in memory")
+
+                # Log quality warnings
+                if quality_report and quality_report.has_warnings:
+                    print(f"[Diarization] Audio quality: {quality_report.overall_quality.value}")
+                    for warning in quality_report.warnings:
+                        icon = "!" if warning.severity == "error" else "⚠" if warning.severity == "warning" else "ℹ"
+                        print(f"[Diarization] {icon} {warning.message}")
+                        if warning.recommendation:
+                            print(f"[Diarization]   → {warning.recommendation}")
+
+            except Exception as e:
+                print(f"[Diarization] Warning: Preprocessing failed: {e}")
+                print("[Diarization] Proceeding with original audio file...")
+                processed_audio_path = str(audio_path)
+
+        if preloaded is not None:
+            print("Diarizing preloaded waveform..." if audio_path is None else f"Diarizing audio from {audio_path}...")
+            audio_input = preloaded
+        else:
+            print(f"Diarizing audio from {processed_audio_path}...")
+            audio_input = self._load_waveform(processed_audio_path)
 
-    def _convert_to_segments(self, diarization) -> List[Dict[str, Any]]:
+        # Keep the waveform on the inference device so cropping and
+        # resampling inside the pipeline run there instead of on the CPU
+        if isinstance(audio_input, dict) and self.device.type == "cuda":
+            audio_input["waveform"] = audio_input["waveform"].to(self.device, non_blocking=True)
+
+        return audio_path, processed_audio_path, quality_report, audio_input
+
+    def _start_pipeline_load(self) -> concurrent.futures.Future:
+        """
+        Run load_pipeline() in a background thread.
+
+        On CUDA the thread issues its copies on its own stream, so they do not
+        queue behind (or block) work on the default stream.
+        """
+        def load():
+            if self.device.type != "cuda":
+                self.load_pipeline()
+                return
+            stream = torch.cuda.Stream(self.device)
+            with torch.cuda.stream(stream):
+                self.load_pipeline()
+            stream.synchronize()
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="diarize-pipeline-load"
+        )
+        pipeline_load = executor.submit(load)
+        executor.shutdown(wait=False)
+        return pipeline_load
+
+    def _finish_pipeline_load(self, pipeline_load: concurrent.futures.Future) -> None:
+        """Wait for _start_pipeline_load() and re-raise any error it hit."""
+        try:
+            pipeline_load.result()
+        except BaseException:
+            # Do not keep a half-configured pipeline around
+            self.pipeline = None
+            raise
+
+    def _load_waveform(self, audio_path: str) -> Union[Dict[str, Any], str]:
         """
-        Convert pyannote diarization output to segment list.
+        Decode an audio file into the in-memory input pyannote accepts.
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            {"waveform": (channel, time) tensor, "sample_rate": int}, or the
+            path itself if the file cannot be decoded here (pyannote then
+            reads it through its own backend)
+        """
+        try:
+            waveform, sample_rate = torchaudio.load(audio_path)
+        except Exception as e:
+            print(f"[Diarization] Warning: Could not preload audio ({e}), passing file path to pipeline")
+            return audio_path
+        return {"waveform": waveform, "sample_rate": sample_rate}
+
+    def _convert_to_segments(self, diarization) -> Segments:
+        """
+        Convert pyannote diarization output to segment arrays.
 
         Args:
             diarization: pyannote Annotation object
 
         Returns:
-            List of segment dictionaries with start, end, speaker
+            Segments with start, end, duration and speaker id per segment
         """
-        segments = []
-        # Create a mapping from pyannote speaker labels to normalized labels (Speaker_0, Speaker_1, etc.)
+        starts = []
+        ends = []
+        speaker_ids = []
+        # Map pyannote speaker labels to ids; id i is reported as Speaker_i
         speaker_mapping = {}
-        speaker_counter = 0
 
+        # Runs once per turn: bound methods skip the attribute lookups, and
+        # setdefault assigns new ids (len() is taken before insertion)
+        starts_append = starts.append
+        ends_append = ends.append
+        speaker_ids_append = speaker_ids.append
+        assign_id = speaker_mapping.setdefault
         for turn, _, speaker in diarization.itertracks(yield_label=True):
-            # Normalize speaker label to Speaker_0, Speaker_1, etc.
-            if speaker not in speaker_mapping:
-                speaker_mapping[speaker] = f"Speaker_{speaker_counter}"
-                speaker_counter += 1
-
-            normalized_speaker = speaker_mapping[speaker]
-            segments.append({
-                "start": turn.start,
-                "end": turn.end,
-                "duration": turn.end - turn.start,
-                "speaker": normalized_speaker,
-                "original_speaker": speaker  # Keep original label for debugging
-            })
-        return segments
+            starts_append(turn.start)
+            ends_append(turn.end)
+            speaker_ids_append(assign_id(speaker, len(speaker_mapping)))
+
+        start = np.array(starts, dtype=np.float64)
+        end = np.array(ends, dtype=np.float64)
+        return Segments(
+            start=start,
+            end=end,
+            duration=end - start,
+            speaker_id=np.array(speaker_ids, dtype=np.int32),
+            speakers=[f"Speaker_{i}" for i in range(len(speaker_mapping))],
+            original_speakers=list(speaker_mapping),
+        )
 
     def diarize_with_transcription(
         self,
@@ -403,8 +855,14 @@ class Diarizer:
         Returns:
             Dictionary with combined segments and speaker information
         """
-        diarization_result = self.diarize(audio_path, **kwargs)
-        diarization_segments = diarization_result["segments"]
+        diarization_result, segments = self._diarize_segments(
+            audio_path,
+            kwargs.get("num_speakers"),
+            kwargs.get("min_speakers"),
+            kwargs.get("max_speakers"),
+            kwargs.get("show_progress", True)
+        )
+        sorted_segments = segments.sorted_by_start()
 
         # Assign speakers to transcription segments using weighted overlap
         combined_segments = []
@@ -413,7 +871,7 @@ class Diarizer:
             trans_end = trans_seg.get("end", 0)
 
             # Find the best matching speaker using overlap-based matching
-            speaker = self._find_best_speaker(diarization_segments, trans_start, trans_end)
+            speaker = self._find_best_speaker(sorted_segments, trans_start, trans_end)
 
             combined_segment = {
                 **trans_seg,
@@ -425,13 +883,13 @@ class Diarizer:
             "segments": combined_segments,
             "speakers": diarization_result["speakers"],
             "num_speakers": diarization_result["num_speakers"],
-            "speaker_stats": self.get_speaker_stats(diarization_segments),
+            "speaker_stats": self.get_speaker_stats(segments),
             "metadata": diarization_result["metadata"]
         }
 
     def _find_best_speaker(
         self,
-        diarization_segments: List[Dict],
+        segments: Segments,
         trans_start: float,
         trans_end: float
     ) -> Optional[str]:
@@ -440,215 +898,203 @@ class Diarizer:
 
         This method uses weighted overlap calculation to find the speaker who was
         talking most during the transcription segment, rather than just checking
-        the midpoint.
+        the midpoint. Only the segments bracketed by two binary searches are
+        examined.
 
         Args:
-            diarization_segments: List of diarization segments
+            segments: Diarization segments sorted by start time
             trans_start: Start time of transcription segment in seconds
             trans_end: End time of transcription segment in seconds
 
         Returns:
             Speaker label with best overlap, or None if no overlap found
         """
-        speaker_overlaps = {}
         trans_duration = trans_end - trans_start
 
         if trans_duration <= 0:
-            return self._find_speaker_at_time(diarization_segments, trans_start)
-
-        for seg in diarization_segments:
-            # Calculate overlap between transcription segment and diarization segment
-            overlap_start = max(trans_start, seg["start"])
-            overlap_end = min(trans_end, seg["end"])
-            overlap = max(0, overlap_end - overlap_start)
-
-            if overlap > 0:
-                speaker = seg["speaker"]
-                if speaker not in speaker_overlaps:
-                    speaker_overlaps[speaker] = 0
-                speaker_overlaps[speaker] += overlap
-
-        if not speaker_overlaps:
-            # Fallback to midpoint matching if no overlap found
-            return self._find_speaker_at_time(diarization_segments, (trans_start + trans_end) / 2)
+            return self._find_speaker_at_time(segments, trans_start)
+
+        # Candidates end after trans_start and start before trans_end
+        lo = np.searchsorted(segments.max_end, trans_start, side="right")
+        hi = np.searchsorted(segments.start, trans_end, side="left")
+        if lo < hi:
+            overlap = (
+                np.minimum(trans_end, segments.end[lo:hi])
+                - np.maximum(trans_start, segments.start[lo:hi])
+            )
+            overlapping = overlap > 0
+            if overlapping.any():
+                # Total overlap per speaker; return the speaker with the most,
+                # breaking ties by the earliest overlapping segment
+                candidates = segments.speaker_id[lo:hi][overlapping]
+                speaker_overlaps = np.bincount(
+                    candidates,
+                    weights=overlap[overlapping],
+                    minlength=len(segments.speakers)
+                )
+                best = np.argmax(speaker_overlaps[candidates] == speaker_overlaps.max())
+                return segments.speakers[candidates[best]]
 
-        # Return the speaker with the most overlap
-        return max(speaker_overlaps.items(), key=lambda x: x[1])[0]
+        # Fallback to midpoint matching if no overlap found
+        return self._find_speaker_at_time(segments, (trans_start + trans_end) / 2)
 
     def _find_speaker_at_time(
         self,
-        segments: List[Dict],
+        segments: Segments,
         time: float
     ) -> Optional[str]:
         """
         Find which speaker is speaking at a given time.
 
         Args:
-            segments: List of diarization segments
+            segments: Diarization segments sorted by start time
             time: Time in seconds
 
         Returns:
             Speaker label or None if no speaker found
         """
-        for seg in segments:
-            if seg["start"] <= time <= seg["end"]:
-                return seg["speaker"]
-
-        # If no exact match, find the nearest speaker
-        if segments:
-            nearest = min(segments, key=lambda s: min(abs(s["start"] - time), abs(s["end"] - time)))
-            # Only return nearest if within 1 second
-            if min(abs(nearest["start"] - time), abs(nearest["end"] - time)) <= 1.0:
-                return nearest["speaker"]
+        # Segments starting at or before time that may still reach it
+        lo = np.searchsorted(segments.max_end, time, side="left")
+        hi = np.searchsorted(segments.start, time, side="right")
+        if lo < hi:
+            containing = np.flatnonzero(segments.end[lo:hi] >= time)
+            if containing.size:
+                return segments.speakers[segments.speaker_id[lo + containing[0]]]
+
+        # If no exact match, find the nearest speaker. Every segment before
+        # hi has ended by now, the closest being the first to reach
+        # max_end[hi - 1]; the closest upcoming segment is hi itself.
+        nearest = None
+        distance = np.inf
+        if hi > 0:
+            distance = time - segments.max_end[hi - 1]
+            nearest = np.searchsorted(segments.max_end, segments.max_end[hi - 1], side="left")
+        if hi < len(segments) and segments.start[hi] - time < distance:
+            distance = segments.start[hi] - time
+            nearest = hi
+
+        # Only return nearest if within 1 second
+        if nearest is not None and distance <= 1.0:
+            return segments.speakers[segments.speaker_id[nearest]]
 
         return None
 
-    def get_speaker_stats(self, segments: List[Dict]) -> Dict[str, Dict]:
+    def get_speaker_stats(self, segments: Union[Segments, List[Dict]]) -> Dict[str, Dict]:
         """
         Calculate statistics for each speaker.
 
         Args:
-            segments: List of diarization segments
+            segments: Diarization segments (Segments or a list of segment dicts)
 
         Returns:
             Dictionary with per-speaker statistics
         """
+        if not isinstance(segments, Segments):
+            segments = Segments.from_dicts(segments)
+        if not len(segments):
+            return {}
+
+        # Per-speaker totals and counts in one pass each
+        num_speakers = len(segments.speakers)
+        total_durations = np.bincount(
+            segments.speaker_id, weights=segments.duration, minlength=num_speakers
+        ).tolist()
+        num_segments = np.bincount(segments.speaker_id, minlength=num_speakers).tolist()
+        total_speech = sum(total_durations)
+
+        # Segment positions grouped by speaker, in their original order
+        positions = np.argsort(segments.speaker_id, kind="stable").tolist()
+        boundaries = np.cumsum(num_segments).tolist()
+        starts = segments.start.tolist()
+        ends = segments.end.tolist()
+
+        # Speaker ids follow order of first appearance
         stats = {}
-        for seg in segments:
-            speaker = seg["speaker"]
-            duration = seg["duration"]
-
-            if speaker not in stats:
-                stats[speaker] = {
-                    "total_duration": 0,
-                    "num_segments": 0,
-                    "segments": []
-                }
-
-            stats[speaker]["total_duration"] += duration
-            stats[speaker]["num_segments"] += 1
-            stats[speaker]["segments"].append({
-                "start": seg["start"],
-                "end": seg["end"]
-            })
-
-        # Calculate percentages
-        total_speech = sum(s["total_duration"] for s in stats.values())
-        for speaker in stats:
-            stats[speaker]["percentage"] = (
-                (stats[speaker]["total_duration"] / total_speech * 100)
-                if total_speech > 0 else 0
-            )
+        for k, speaker in enumerate(segments.speakers):
+            group = positions[boundaries[k] - num_segments[k]:boundaries[k]]
+            stats[speaker] = {
+                "total_duration": total_durations[k],
+                "num_segments": num_segments[k],
+                "segments": [{"start": starts[i], "end": ends[i]} for i in group],
+                "percentage": (
+                    (total_durations[k] / total_speech * 100)
+                    if total_speech > 0 else 0
+                )
+            }
 
         return stats
 
 
-def format_diarization(segments: List[Dict]) -> str:
+def format_diarization(segments: Iterable[Dict]) -> str:
     """
     Format diarization segments for display.
 
     Args:
-        segments: List of segment dictionaries
+        segments: Segment dictionaries (any iterable, consumed once)
 
     Returns:
         Formatted string representation
     """
-    lines = []
-    for seg in segments:
-        start = seg["start"]
-        end = seg["end"]
-        speaker = seg["speaker"]
-        text = seg.get("text", "")
-
-        if text:
-            lines.append(f"[{start:.2f}s - {end:.2f}s] {speaker}: {text}")
-        else:
-            lines.append(f"[{start:.2f}s - {end:.2f}s] {speaker}")
+    # Bound %-format methods are measurably faster than per-line f-strings
+    # when exporting long meetings
+    with_text = "[%.2fs - %.2fs] %s: %s".__mod__
+    without_text = "[%.2fs - %.2fs] %s".__mod__
+
+    return "\n".join(
+        with_text((seg["start"], seg["end"], seg["speaker"], seg["text"]))
+        if seg.get("text") else
+        without_text((seg["start"], seg["end"], seg["speaker"]))
+        for seg in segments
+    )
 
-    return "\n".join(lines)
+
+def _rttm_lines(segments: Union[Segments, Iterable[Dict]], audio_file: str) -> Iterator[str]:
+    """Yield the RTTM line of each segment (see format_rttm)."""
+    file_id = Path(audio_file).stem
+
+    # RTTM format: SPEAKER file 1 start duration <NA> <NA> speaker <NA> <NA>
+    line = ("SPEAKER " + file_id.replace("%", "%%") + " 1 %.3f %.3f <NA> <NA> %s <NA> <NA>").__mod__
+    if isinstance(segments, Segments):
+        speaker_labels = [segments.speakers[i] for i in segments.speaker_id.tolist()]
+        return map(line, zip(segments.start.tolist(), segments.duration.tolist(), speaker_labels))
+    return (line((seg["start"], seg["duration"], seg["speaker"])) for seg in segments)
 
 
-def format_rttm(segments: List[Dict], audio_file: str) -> str:
+def format_rttm(segments: Union[Segments, Iterable[Dict]], audio_file: str) -> str:
     """
     Format diarization as RTTM (Rich Transcription Time Marked).
 
     Args:
-        segments: List of segment dictionaries
+        segments: Diarization segments (Segments or any iterable of segment dicts)
         audio_file: Audio file name (for RTTM format)
 
     Returns:
         RTTM formatted string
     """
-    lines = []
-    file_id = Path(audio_file).stem
-
-    for seg in segments:
-        start = seg["start"]
-        duration = seg["duration"]
-        speaker = seg["speaker"]
+    return "\n".join(_rttm_lines(segments, audio_file))
 
-        # RTTM format: SPEAKER file 1 start duration <NA> <NA> speaker <NA> <NA>
-        lines.append(
-            f"SPEAKER {file_id} 1 {start:.3f} {duration:.3f} <NA> <NA> {speaker} <NA> <NA>"
-        )
 
-    return "\n".join(lines)
-
-
-def main():
-    """Main entry point for CLI usage."""
-    parser = argparse.ArgumentParser(
-        description="Perform speaker diarization using pyannote.audio",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python diarize.py meeting.wav
-  python diarize.py meeting.wav --num-speakers 3
-  python diarize.py meeting.wav --min-speakers 2 --max-speakers 5
-  python diarize.py meeting.wav --output diarization.json --format json
-  python diarize.py meeting.wav --output diarization.rttm --format rttm
-
-Environment:
-  HF_TOKEN: Hugging Face access token (required)
-            Get access at: https://huggingface.co/pyannote/speaker-diarization-3.1
-        """
-    )
-
-    parser.add_argument(
-        "audio_file",
-        help="Path to the audio file to diarize"
-    )
-
-    parser.add_argument(
-        "--num-speakers", "-n",
-        type=int,
-        help="Exact number of speakers (if known)"
-    )
-
-    parser.add_argument(
-        "--min-speakers",
-        type=int,
-        help="Minimum number of speakers"
-    )
+def write_rttm(segments: Union[Segments, Iterable[Dict]], audio_file: str, file: TextIO) -> None:
+    """
+    Write diarization as RTTM to an open text file, one line at a time.
 
-    parser.add_argument(
-        "--max-speakers",
-        type=int,
-        help="Maximum number of speakers"
-    )
+    Produces the same text as format_rttm without holding it in memory,
+    so a generator of segments is exported in constant memory.
 
-    parser.add_argument(
-        "--output", "-o",
-        help="Output file path (default: stdout)"
-    )
+    Args:
+        segments: Diarization segments (Segments or any iterable of segment dicts)
+        audio_file: Audio file name (for RTTM format)
+        file: Text file to write to
+    """
+    separator = ""
+    for line in _rttm_lines(segments, audio_file):
+        file.write(separator)
+        file.write(line)
+        separator = "\n"
 
-    parser.add_argument(
-        "--format", "-f",
-        default="json",
-        choices=["json", "text", "rttm"],
-        help="Output format (default: json)"
-    )
 
+def _add_diarizer_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that configure a Diarizer (shared by the CLI and ``serve``)."""
     parser.add_argument(
         "--device", "-d",
         choices=["cuda", "cpu"],
@@ -660,18 +1106,6 @@ Environment:
         help="Hugging Face token (or set HF_TOKEN env var)"
     )
 
-    parser.add_argument(
-        "--no-progress",
-        action="store_true",
-        help="Disable progress bar"
-    )
-
-    parser.add_argument(
-        "--stats",
-        action="store_true",
-        help="Include speaker statistics in output"
-    )
-
     # Preprocessing options
     parser.add_argument(
         "--preprocess",
@@ -710,6 +1144,43 @@ Environment:
              "Try 0.4-0.5 for better separation of similar voices."
     )
 
+    parser.add_argument(
+        "--embedding-batch-size",
+        type=int,
+        default=None,
+        help="Chunks per speaker-embedding batch (default: 32). "
+             "Lower it (e.g. 8-16) if the GPU runs out of memory."
+    )
+
+    parser.add_argument(
+        "--segmentation-batch-size",
+        type=int,
+        default=None,
+        help="Chunks per segmentation batch (default: 32)"
+    )
+
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="torch.compile the pipeline models; compiled artifacts are cached "
+             "in ~/.cache/flow-recap so later runs start faster"
+    )
+
+    precision = parser.add_mutually_exclusive_group()
+    precision.add_argument(
+        "--fp16",
+        dest="fp16",
+        action="store_true",
+        default=None,
+        help="Run inference under fp16 autocast (default on CUDA)"
+    )
+    precision.add_argument(
+        "--fp32",
+        dest="fp16",
+        action="store_false",
+        help="Run inference in full fp32 precision"
+    )
+
     # Alias for --clustering-threshold (for compatibility with other services)
     parser.add_argument(
         "--similarity-threshold",
@@ -720,17 +1191,13 @@ Environment:
              "Lower values = more speakers detected."
     )
 
-    args = parser.parse_args()
 
+def _diarizer_from_args(args: argparse.Namespace) -> Diarizer:
+    """Create a Diarizer from the options added by _add_diarizer_arguments()."""
     # Handle both parameter names - prefer explicit clustering-threshold if both provided
     if args.clustering_threshold is None and args.similarity_threshold_alias is not None:
         args.clustering_threshold = args.similarity_threshold_alias
 
-    if not PYANNOTE_AVAILABLE:
-        print("Error: pyannote.audio is not installed.", file=sys.stderr)
-        print("Please run: pip install -r requirements.txt", file=sys.stderr)
-        sys.exit(1)
-
     # Determine preprocessing settings
     enable_preprocessing = args.preprocess and not args.skip_preprocess
     quality_check = args.quality_check and not args.no_quality_check
@@ -740,28 +1207,341 @@ Environment:
     elif not PREPROCESSOR_AVAILABLE:
         print("[Diarization] Warning: Preprocessing module not available", file=sys.stderr)
 
-    try:
-        # Initialize diarizer with clustering threshold for better speaker separation
-        diarizer = Diarizer(
-            device=args.device,
-            hf_token=args.hf_token,
-            enable_preprocessing=enable_preprocessing,
-            quality_check=quality_check,
-            clustering_threshold=args.clustering_threshold
+    # Initialize diarizer with clustering threshold for better speaker separation
+    return Diarizer(
+        device=args.device,
+        hf_token=args.hf_token,
+        enable_preprocessing=enable_preprocessing,
+        quality_check=quality_check,
+        clustering_threshold=args.clustering_threshold,
+        embedding_batch_size=args.embedding_batch_size,
+        segmentation_batch_size=args.segmentation_batch_size,
+        compile_models=args.compile,
+        use_fp16=args.fp16
+    )
+
+
+# Default socket of ``diarize.py serve``; clients connect when DIARIZE_SOCKET is set
+DEFAULT_SOCKET_PATH = "/tmp/diarize.sock"
+
+
+class _DiarizeRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle one client connection of ``diarize.py serve``.
+
+    Each line is a JSON request such as
+    ``{"audio_path": "a.wav", "num_speakers": 2, "stats": true}``, with an
+    optional ``options`` object of Diarizer settings the client expects
+    (see _diarizer_request_options); each response is one JSON line holding
+    either ``result`` (the diarize() output) or ``error`` and ``error_type``.
+    """
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = {"result": _diarize_request(self.server.diarizer, json.loads(line))}
+            except Exception as e:
+                response = {"error": str(e), "error_type": type(e).__name__}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def _diarize_request(diarizer: Diarizer, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Diarize the file named by one server request."""
+    _check_request_options(diarizer, request.get("options") or {})
+    result, segments = diarizer._diarize_segments(
+        request["audio_path"],
+        request.get("num_speakers"),
+        request.get("min_speakers"),
+        request.get("max_speakers"),
+        show_progress=False
+    )
+    if request.get("stats"):
+        result["speaker_stats"] = diarizer.get_speaker_stats(segments)
+    return result
+
+
+def _diarizer_request_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Diarizer settings given explicitly on the command line, keyed by Diarizer
+    attribute, for a request to ``diarize.py serve``.
+
+    The server's pipeline is already configured, so these are not applied
+    there but checked against its own settings (see _check_request_options).
+    """
+    clustering_threshold = args.clustering_threshold
+    if clustering_threshold is None:
+        clustering_threshold = args.similarity_threshold_alias
+    options = {
+        "device": args.device,
+        "clustering_threshold": clustering_threshold,
+        "embedding_batch_size": args.embedding_batch_size,
+        "segmentation_batch_size": args.segmentation_batch_size,
+        "use_fp16": args.fp16,
+    }
+    if args.skip_preprocess:
+        options["enable_preprocessing"] = False
+    if args.no_quality_check:
+        options["quality_check"] = False
+    if args.compile:
+        options["compile_models"] = True
+    return {name: value for name, value in options.items() if value is not None}
+
+
+def _check_request_options(diarizer: Diarizer, options: Dict[str, Any]) -> None:
+    """
+    Check that the server's Diarizer matches the settings a request expects.
+
+    Raises:
+        ValueError: If any requested setting differs from the server's
+    """
+    mismatches = []
+    for name, requested in options.items():
+        if name == "device":
+            actual = diarizer.device.type
+        elif name == "use_fp16":
+            # Diarizer ignores fp16 on CPU, so compare what it would resolve to
+            actual = diarizer.use_fp16
+            requested = diarizer.device.type == "cuda" and requested
+        elif name in ("clustering_threshold", "embedding_batch_size", "segmentation_batch_size",
+                      "enable_preprocessing", "quality_check", "compile_models"):
+            actual = getattr(diarizer, name)
+        else:
+            raise ValueError(f"Unknown diarizer option in request: {name}")
+        if actual != requested:
+            mismatches.append(f"{name}={actual!r} (requested {requested!r})")
+    if mismatches:
+        raise ValueError(
+            "The diarization server was started with different options: "
+            + ", ".join(mismatches)
+            + ". Restart 'diarize.py serve' with these options or unset DIARIZE_SOCKET."
         )
 
-        # Perform diarization
-        result = diarizer.diarize(
-            args.audio_file,
-            num_speakers=args.num_speakers,
-            min_speakers=args.min_speakers,
-            max_speakers=args.max_speakers,
-            show_progress=not args.no_progress
+
+def _serve(argv: List[str]) -> int:
+    """
+    Load the pipeline once and diarize files sent over a Unix socket.
+
+    Loading pyannote/speaker-diarization-3.1 takes far longer than
+    diarizing a short file, so batch callers keep one server running and
+    point DIARIZE_SOCKET at it. Requests are handled one at a time on the
+    single loaded pipeline.
+    """
+    parser = argparse.ArgumentParser(
+        prog="diarize.py serve",
+        description="Keep the diarization pipeline loaded and diarize files sent over a Unix socket"
+    )
+    parser.add_argument(
+        "--socket",
+        default=DEFAULT_SOCKET_PATH,
+        help=f"Unix socket path to listen on (default: {DEFAULT_SOCKET_PATH})"
+    )
+    _add_diarizer_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not hasattr(socketserver, "UnixStreamServer"):
+        print("Error: serve requires Unix domain sockets, which this platform lacks.", file=sys.stderr)
+        return 1
+    if not PYANNOTE_AVAILABLE:
+        print("Error: pyannote.audio is not installed.", file=sys.stderr)
+        print("Please run: pip install -r requirements.txt", file=sys.stderr)
+        return 1
+
+    # A socket file left behind by a previous server would make bind() fail,
+    # but one a live server is listening on must not be taken over
+    if os.path.exists(args.socket):
+        if _socket_in_use(args.socket):
+            print(f"Error: a diarization server is already listening on {args.socket}.", file=sys.stderr)
+            return 1
+        os.unlink(args.socket)
+
+    try:
+        diarizer = _diarizer_from_args(args)
+        diarizer.load_pipeline()
+    except ValueError as e:
+        print(f"Configuration error: {e}", file=sys.stderr)
+        return 1
+
+    with socketserver.UnixStreamServer(args.socket, _DiarizeRequestHandler) as server:
+        server.diarizer = diarizer
+        print(f"[Diarization] Serving on {args.socket}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.socket)
+    return 0
+
+
+def _socket_in_use(socket_path: str) -> bool:
+    """Check whether a server accepts connections on a Unix socket path."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        # Stale socket file: nothing is listening on it
+        return False
+    return True
+
+
+def _request_diarization(socket_path: str, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to a running ``diarize.py serve``.
+
+    Returns:
+        The server's response, or None if no server could be reached
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as response_file:
+                line = response_file.readline()
+    except (OSError, AttributeError) as e:
+        print(
+            f"[Diarization] Warning: Could not reach diarization server at {socket_path} ({e}), "
+            "diarizing in this process",
+            file=sys.stderr
         )
+        return None
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def main():
+    """Main entry point for CLI usage."""
+    if sys.argv[1:2] == ["serve"]:
+        sys.exit(_serve(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(
+        description="Perform speaker diarization using pyannote.audio",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python diarize.py meeting.wav
+  python diarize.py meeting.wav --num-speakers 3
+  python diarize.py meeting.wav --min-speakers 2 --max-speakers 5
+  python diarize.py meeting.wav --output diarization.json --format json
+  python diarize.py meeting.wav --output diarization.rttm --format rttm
+
+  # Keep the pipeline loaded in one process and send it files
+  python diarize.py serve --socket /tmp/diarize.sock &
+  DIARIZE_SOCKET=/tmp/diarize.sock python diarize.py meeting.wav
+
+Environment:
+  HF_TOKEN: Hugging Face access token (required)
+            Get access at: https://huggingface.co/pyannote/speaker-diarization-3.1
+  DIARIZE_SOCKET: Socket of a running 'diarize.py serve'. Files are then
+            diarized by that server, which rejects the request if it was
+            started with different diarizer options than given here; if it
+            cannot be reached, diarization runs in this process.
+        """
+    )
+
+    parser.add_argument(
+        "audio_file",
+        help="Path to the audio file to diarize"
+    )
+
+    parser.add_argument(
+        "--num-speakers", "-n",
+        type=int,
+        help="Exact number of speakers (if known)"
+    )
 
-        # Add statistics if requested
-        if args.stats:
-            result["speaker_stats"] = diarizer.get_speaker_stats(result["segments"])
+    parser.add_argument(
+        "--min-speakers",
+        type=int,
+        help="Minimum number of speakers"
+    )
+
+    parser.add_argument(
+        "--max-speakers",
+        type=int,
+        help="Maximum number of speakers"
+    )
+
+    parser.add_argument(
+        "--output", "-o",
+        help="Output file path (default: stdout)"
+    )
+
+    parser.add_argument(
+        "--format", "-f",
+        default="json",
+        choices=["json", "text", "rttm"],
+        help="Output format (default: json)"
+    )
+
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="Disable progress bar"
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Include speaker statistics in output"
+    )
+
+    _add_diarizer_arguments(parser)
+
+    args = parser.parse_args()
+
+    try:
+        result = None
+        socket_path = os.environ.get("DIARIZE_SOCKET")
+        if socket_path:
+            response = _request_diarization(socket_path, {
+                "audio_path": os.path.abspath(args.audio_file),
+                "num_speakers": args.num_speakers,
+                "min_speakers": args.min_speakers,
+                "max_speakers": args.max_speakers,
+                "stats": args.stats,
+                "options": _diarizer_request_options(args)
+            })
+            if response is not None:
+                if "error" in response:
+                    if response.get("error_type") == "FileNotFoundError":
+                        raise FileNotFoundError(response["error"])
+                    if response.get("error_type") == "ValueError":
+                        raise ValueError(response["error"])
+                    raise RuntimeError(response["error"])
+                result = response["result"]
+
+        if result is None:
+            if not PYANNOTE_AVAILABLE:
+                print("Error: pyannote.audio is not installed.", file=sys.stderr)
+                print("Please run: pip install -r requirements.txt", file=sys.stderr)
+                sys.exit(1)
+
+            diarizer = _diarizer_from_args(args)
+
+            # Perform diarization
+            result, segments = diarizer._diarize_segments(
+                args.audio_file,
+                args.num_speakers,
+                args.min_speakers,
+                args.max_speakers,
+                show_progress=not args.no_progress
+            )
+
+            # Add statistics if requested (from the segment arrays, rather
+            # than rebuilding them from the result's dicts)
+            if args.stats:
+                result["speaker_stats"] = diarizer.get_speaker_stats(segments)
+
+        # RTTM files are written line by line rather than built as one string
+        if args.format == "rttm" and args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                write_rttm(result["segments"], args.audio_file, f)
+            print(f"Diarization saved to: {args.output}")
+            return
 
         # Format output
         if args.format == "text":
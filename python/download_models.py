@@ -16,24 +16,51 @@ Usage:
 Environment Variables:
     HF_TOKEN: HuggingFace API token (required)
     MODELS_DIR: Optional custom directory to store models
+    HF_HUB_ENABLE_HF_TRANSFER, HF_XET_*: Transfer tuning; defaults favour
+        throughput (hf_transfer is used when installed)
+    MEETING_NOTES_DEBUG: Set to "1" to print [DEBUG] lines
 """
 
+import importlib.util
 import os
 import sys
+import threading
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore")
 
+# Transfer tuning for large weight files. huggingface_hub reads these when it
+# is imported (lazily, inside the functions below); user settings win.
+# Xet-backed repos: parallel range GETs, written out of order as they arrive
+os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+os.environ.setdefault("HF_XET_NUM_CONCURRENT_RANGE_GETS", "64")
+os.environ.setdefault("HF_XET_RECONSTRUCT_WRITE_SEQUENTIALLY", "0")
+# hf_transfer (Rust, parallel chunked downloads) for LFS files. huggingface_hub
+# refuses to download when this is enabled without the package installed.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 # Maximum retry attempts for network failures
 MAX_RETRIES = 3
 # Base delay for exponential backoff (in seconds)
 BASE_RETRY_DELAY = 2
 
-# Model configurations with expected files for verification
+# Weight file extensions accepted when verifying regular models
+WEIGHT_EXTENSIONS = ('.bin', '.pt', '.safetensors', '.ckpt')
+
+# Never needed by pyannote; skipped even for models without allow_patterns
+DOWNLOAD_IGNORE_PATTERNS = ['*.onnx', '*.msgpack', '*.h5', 'tf_model.*', 'flax_model.*']
+
+# Model configurations with expected files for verification.
+# allow_patterns limits snapshot_download to the files pyannote loads
+# (README media, example audio etc. are not transferred).
 MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
     'pyannote-segmentation-3.0': {
         'repo_id': 'pyannote/segmentation-3.0',
@@ -42,6 +69,7 @@ MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
         'expected_files': ['pytorch_model.bin', 'config.yaml'],
         'min_size_bytes': 10 * 1024 * 1024,  # 10 MB minimum
         'license_url': 'https://huggingface.co/pyannote/segmentation-3.0',
+        'allow_patterns': ['*.bin', '*.safetensors', '*.yaml', '*.json'],
     },
     'pyannote-embedding': {
         'repo_id': 'pyannote/wespeaker-voxceleb-resnet34-LM',
@@ -50,6 +78,7 @@ MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
         'expected_files': ['pytorch_model.bin'],
         'min_size_bytes': 10 * 1024 * 1024,  # 10 MB minimum
         'license_url': 'https://huggingface.co/pyannote/wespeaker-voxceleb-resnet34-LM',
+        'allow_patterns': ['*.bin', '*.safetensors', '*.yaml', '*.json'],
     },
     'pyannote-speaker-diarization-3.1': {
         'repo_id': 'pyannote/speaker-diarization-3.1',
@@ -58,31 +87,48 @@ MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
         'expected_files': ['config.yaml'],
         'min_size_bytes': 1024,  # 1 KB minimum (pipeline configs are smaller)
         'license_url': 'https://huggingface.co/pyannote/speaker-diarization-3.1',
+        # The pipeline itself is just config; README.md keeps the snapshot
+        # above min_size_bytes as it was when every file was downloaded
+        'allow_patterns': ['*.yaml', '*.json', 'README.md'],
     },
 }
 
+# Models download concurrently; print() writes the text and the newline
+# separately, so output lines are serialized to keep them parseable
+_out_lock = threading.Lock()
+
+# [DEBUG] lines are only logged by the Electron app; skip them unless asked for
+_DEBUG = os.environ.get("MEETING_NOTES_DEBUG") == "1"
+
 def print_progress(model_id: str, progress: int, message: str):
     """Print progress in parseable format."""
-    print(f"[PROGRESS] {model_id} {progress} {message}", file=sys.stderr, flush=True)
+    with _out_lock:
+        print(f"[PROGRESS] {model_id} {progress} {message}", file=sys.stderr, flush=True)
 
 def print_complete(model_id: str):
     """Print completion in parseable format."""
-    print(f"[COMPLETE] {model_id}", file=sys.stderr, flush=True)
+    with _out_lock:
+        print(f"[COMPLETE] {model_id}", file=sys.stderr, flush=True)
 
 def print_error(model_id: str, message: str):
     """Print error in parseable format."""
-    print(f"[ERROR] {model_id} {message}", file=sys.stderr, flush=True)
+    with _out_lock:
+        print(f"[ERROR] {model_id} {message}", file=sys.stderr, flush=True)
 
 def print_license_required(model_id: str, url: str):
     """Print license requirement message in parseable format."""
-    print(f"[LICENSE_REQUIRED] {model_id} {url}", file=sys.stderr, flush=True)
+    with _out_lock:
+        print(f"[LICENSE_REQUIRED] {model_id} {url}", file=sys.stderr, flush=True)
 
 def print_debug(message: str):
-    """Print debug message for troubleshooting."""
-    print(f"[DEBUG] {message}", file=sys.stderr, flush=True)
+    """Print debug message for troubleshooting (MEETING_NOTES_DEBUG=1 only, not flushed)."""
+    if _DEBUG:
+        with _out_lock:
+            sys.stderr.write(f"[DEBUG] {message}\n")
 
+@lru_cache(maxsize=1)
 def get_hf_cache_dir() -> str:
-    """Get the HuggingFace cache directory."""
+    """Get the HuggingFace cache directory (resolved once per run)."""
     # Check environment variables first
     if os.environ.get('HF_HOME'):
         return os.environ.get('HF_HOME')
@@ -97,44 +143,79 @@ def get_hf_cache_dir() -> str:
         return os.path.join(home, '.cache', 'huggingface')
 
 
-def get_total_file_size(directory: Path) -> int:
-    """Calculate total size of all files in a directory recursively."""
+@lru_cache(maxsize=1)
+def get_hf_hub_dir() -> Path:
+    """Get the hub directory inside the HuggingFace cache (resolved once per run)."""
+    return Path(get_hf_cache_dir()) / 'hub'
+
+
+def scan_files(directory: Path) -> Tuple[int, List[str]]:
+    """
+    Walk a directory tree once with os.scandir.
+    Returns (total size of all files in bytes, file paths).
+
+    Snapshot files in the HF cache are symlinks to blobs, so file sizes
+    follow symlinks; symlinked directories are not descended into.
+    """
     total_size = 0
+    files = []
+    pending = [str(directory)]
     try:
-        for item in directory.rglob('*'):
-            if item.is_file():
-                total_size += item.stat().st_size
-    except Exception as e:
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
+                        files.append(entry.path)
+    except OSError as e:
         print_debug(f"Error calculating size for {directory}: {e}")
-    return total_size
+    return total_size, files
 
 
-def check_model_access(repo_id: str, token: str) -> Tuple[bool, Optional[str]]:
-    """
-    Check if the user has access to a gated model.
-    Returns (has_access, error_message).
+def get_total_file_size(directory: Path) -> int:
+    """Calculate total size of all files in a directory recursively."""
+    return scan_files(directory)[0]
+
+
+# Shared HfApi; see get_hf_api()
+_api = None
+
+def _pooled_session():
     """
-    try:
-        from huggingface_hub import HfApi
-        api = HfApi()
+    Create a requests.Session that keeps connections to huggingface.co alive.
 
-        # Try to get model info - this will fail for gated models if access not granted
-        try:
-            model_info = api.model_info(repo_id, token=token)
-            return True, None
-        except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "401" in error_str or "gated" in error_str.lower():
-                return False, f"License agreement required. Visit https://huggingface.co/{repo_id} to accept terms."
-            elif "404" in error_str:
-                return False, f"Model not found: {repo_id}"
-            else:
-                # Other errors might be network issues - allow to proceed
-                print_debug(f"Warning checking access for {repo_id}: {e}")
-                return True, None
-    except ImportError:
-        # If HfApi not available, allow to proceed
-        return True, None
+    huggingface_hub creates one session per thread through this factory, so
+    the hub calls made on a thread (token check, then each download's
+    metadata requests) reuse a TLS connection instead of opening one per
+    request.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Connection-level retries only; download_with_retry handles the rest
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=2)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def get_hf_api():
+    """Return the shared HfApi, configuring the pooled HTTP backend on first use."""
+    global _api
+    if _api is None:
+        import huggingface_hub
+        # configure_http_backend exists in huggingface_hub 0.20-0.x (requests based)
+        if hasattr(huggingface_hub, "configure_http_backend"):
+            huggingface_hub.configure_http_backend(backend_factory=_pooled_session)
+        _api = huggingface_hub.HfApi(library_name="flow-recap")
+    return _api
 
 
 def validate_token_permissions(token: str) -> Tuple[bool, Optional[str]]:
@@ -146,8 +227,7 @@ def validate_token_permissions(token: str) -> Tuple[bool, Optional[str]]:
         return False, "HuggingFace token is required but not provided."
 
     try:
-        from huggingface_hub import HfApi
-        api = HfApi()
+        api = get_hf_api()
 
         # Verify token by getting user info
         try:
@@ -165,6 +245,62 @@ def validate_token_permissions(token: str) -> Tuple[bool, Optional[str]]:
     except ImportError:
         return True, None
 
+# verify_model_in_cache results per (model_id, snapshot path, snapshot mtime_ns).
+# None means the snapshot lacks the expected files.
+_verify_cache: Dict[Tuple[str, str, int], Optional[Tuple[bool, Optional[str]]]] = {}
+_verify_cache_lock = threading.Lock()
+_NOT_CACHED = object()
+
+def invalidate_verify_cache(model_id: str):
+    """Forget cached verification results for a model (e.g. after downloading it)."""
+    with _verify_cache_lock:
+        for key in [key for key in _verify_cache if key[0] == model_id]:
+            del _verify_cache[key]
+
+def _verify_snapshot(model_id: str, snapshot_path: Path, model_type: str, min_size: int) -> Optional[Tuple[bool, Optional[str]]]:
+    """
+    Check one snapshot directory for the model's files.
+    Returns (is_verified, error_message), or None if the expected files are missing.
+    """
+    # One walk collects both the file list and the total size
+    total_size, files = scan_files(snapshot_path)
+
+    if model_type == 'pipeline':
+        # For pipeline models, check for config.yaml
+        found_files = [f for f in files if os.path.basename(f) == 'config.yaml']
+        for file_path in found_files:
+            print_debug(f"Found config.yaml: {file_path}")
+
+        if found_files:
+            # Verify minimum size
+            print_debug(f"Pipeline model total size: {total_size} bytes (min: {min_size})")
+            if total_size >= min_size:
+                print_debug(f"[verify] Pipeline model {model_id} verified successfully")
+                return True, None
+            else:
+                return False, f"Model files incomplete. Expected min {min_size} bytes, got {total_size} bytes."
+
+        print_debug(f"[verify] Pipeline model verification failed: config.yaml not found")
+    else:
+        # For regular models, check for weight files (.bin, .pt, .safetensors, .ckpt)
+        found_weights = [f for f in files if f.endswith(WEIGHT_EXTENSIONS)]
+        for file_path in found_weights:
+            print_debug(f"Found weight file: {file_path}")
+
+        if found_weights:
+            # Verify minimum size
+            print_debug(f"Regular model total size: {total_size} bytes (min: {min_size})")
+            if total_size >= min_size:
+                print_debug(f"[verify] Regular model {model_id} verified successfully")
+                return True, None
+            else:
+                return False, f"Model files incomplete. Expected min {min_size} bytes, got {total_size} bytes."
+
+        print_debug(f"[verify] Regular model verification failed: no weight files found")
+
+    return None
+
+
 def verify_model_in_cache(model_id: str, repo_id: str) -> Tuple[bool, Optional[str]]:
     """
     Verify that model files exist in the HF cache location.
@@ -174,8 +310,7 @@ def verify_model_in_cache(model_id: str, repo_id: str) -> Tuple[bool, Optional[s
     if not config:
         return False, f"Unknown model ID: {model_id}"
 
-    hf_cache = get_hf_cache_dir()
-    hub_path = Path(hf_cache) / 'hub'
+    hub_path = get_hf_hub_dir()
 
     if not hub_path.exists():
         return False, f"HuggingFace cache directory not found: {hub_path}"
@@ -218,52 +353,17 @@ def verify_model_in_cache(model_id: str, repo_id: str) -> Tuple[bool, Optional[s
         snapshot_path = sorted(snapshots, key=lambda x: x.stat().st_mtime, reverse=True)[0]
         print_debug(f"Checking snapshot: {snapshot_path}")
 
-        if model_type == 'pipeline':
-            # For pipeline models, check for config.yaml
-            found_config = False
-            found_files = []
-
-            # Check all files recursively
-            for file_path in snapshot_path.rglob('*'):
-                if file_path.is_file():
-                    if file_path.name == 'config.yaml':
-                        found_config = True
-                        found_files.append(str(file_path))
-                        print_debug(f"Found config.yaml: {file_path}")
-
-            if found_config:
-                # Verify minimum size
-                total_size = get_total_file_size(snapshot_path)
-                print_debug(f"Pipeline model total size: {total_size} bytes (min: {min_size})")
-                if total_size >= min_size:
-                    print_debug(f"[verify] Pipeline model {model_id} verified successfully")
-                    return True, None
-                else:
-                    return False, f"Model files incomplete. Expected min {min_size} bytes, got {total_size} bytes."
-
-            print_debug(f"[verify] Pipeline model verification failed: config.yaml not found")
-        else:
-            # For regular models, check for weight files (.bin, .pt, .safetensors, .ckpt)
-            weight_extensions = ('.bin', '.pt', '.safetensors', '.ckpt')
-            found_weights = []
-
-            for file_path in snapshot_path.rglob('*'):
-                if file_path.is_file():
-                    if file_path.name.endswith(weight_extensions):
-                        found_weights.append(file_path)
-                        print_debug(f"Found weight file: {file_path}")
-
-            if found_weights:
-                # Verify minimum size
-                total_size = get_total_file_size(snapshot_path)
-                print_debug(f"Regular model total size: {total_size} bytes (min: {min_size})")
-                if total_size >= min_size:
-                    print_debug(f"[verify] Regular model {model_id} verified successfully")
-                    return True, None
-                else:
-                    return False, f"Model files incomplete. Expected min {min_size} bytes, got {total_size} bytes."
-
-            print_debug(f"[verify] Regular model verification failed: no weight files found")
+        # Reuse the result for an unchanged snapshot. Adding or removing files
+        # in it changes its mtime; post-download checks also invalidate it.
+        key = (model_id, str(snapshot_path), snapshot_path.stat().st_mtime_ns)
+        with _verify_cache_lock:
+            cached = _verify_cache.get(key, _NOT_CACHED)
+        if cached is _NOT_CACHED:
+            cached = _verify_snapshot(model_id, snapshot_path, model_type, min_size)
+            with _verify_cache_lock:
+                _verify_cache[key] = cached
+        if cached is not None:
+            return cached
 
     return False, f"Model not found in HuggingFace cache. Checked patterns: {patterns}"
 
@@ -274,7 +374,7 @@ def download_with_retry(repo_id: str, token: str, model_id: str) -> Tuple[Option
     Returns (local_dir, error_message).
     """
     from huggingface_hub import snapshot_download
-    from huggingface_hub.utils import RepositoryNotFoundError, HfHubHTTPError
+    from huggingface_hub.utils import GatedRepoError, RepositoryNotFoundError, HfHubHTTPError
 
     last_error = None
 
@@ -287,11 +387,24 @@ def download_with_retry(repo_id: str, token: str, model_id: str) -> Tuple[Option
                 repo_id=repo_id,
                 token=token,
                 local_dir_use_symlinks=False,
-                ignore_patterns=None  # Download all files
+                allow_patterns=MODEL_CONFIGS.get(model_id, {}).get('allow_patterns'),
+                ignore_patterns=DOWNLOAD_IGNORE_PATTERNS
             )
 
             return local_dir, None
 
+        except GatedRepoError:
+            # License not accepted yet (checked before RepositoryNotFoundError,
+            # its base class) - permanent until the user accepts the terms
+            config = MODEL_CONFIGS.get(model_id, {})
+            license_url = config.get('license_url', f'https://huggingface.co/{repo_id}')
+            error_msg = (
+                f"License agreement required for {repo_id}. "
+                f"Please visit {license_url} to accept the model license agreement, "
+                f"then try downloading again."
+            )
+            return None, error_msg
+
         except RepositoryNotFoundError:
             # Don't retry for repository not found - this is a permanent error
             config = MODEL_CONFIGS.get(model_id, {})
@@ -334,9 +447,188 @@ def download_with_retry(repo_id: str, token: str, model_id: str) -> Tuple[Option
 
     return None, f"Failed after {MAX_RETRIES} attempts. Last error: {last_error}"
 
+def _await_snapshot_visible(local_dir: Optional[str], expected_files: List[str], timeout: float = 0.5) -> bool:
+    """
+    Poll with backoff until one of the expected files shows up in local_dir.
+    Returns False if none appeared within about `timeout` seconds.
+    """
+    if not local_dir or not expected_files:
+        return False
+    snapshot = Path(local_dir)
+    waited = 0.0
+    for delay in (0.01, 0.02, 0.05, 0.1, 0.2, 0.5):
+        if any(any(snapshot.rglob(name)) for name in expected_files):
+            return True
+        if waited >= timeout:
+            break
+        delay = min(delay, timeout - waited)
+        time.sleep(delay)
+        waited += delay
+    return False
+
+@dataclass(frozen=True)
+class ModelPlan:
+    """Per-model download settings, resolved once before the downloads start."""
+    model_id: str
+    repo_id: str
+    display_name: str
+    license_url: str
+    progress_start: int
+    progress_end: int
+
+def build_download_plan(models: List[Tuple[str, str]]) -> List[ModelPlan]:
+    """Resolve display names, license URLs and progress ranges (10-90%) for each model."""
+    total_models = len(models)
+    plan = []
+    for idx, (model_id, repo_id) in enumerate(models):
+        config = MODEL_CONFIGS.get(model_id, {})
+        plan.append(ModelPlan(
+            model_id=model_id,
+            repo_id=repo_id,
+            display_name=config.get('display_name', model_id),
+            license_url=config.get('license_url', f'https://huggingface.co/{repo_id}'),
+            progress_start=int(10 + (idx / total_models) * 80),
+            progress_end=int(10 + ((idx + 1) / total_models) * 80),
+        ))
+    return plan
+
+def download_model(plan: ModelPlan, token: str, license_errors: Optional[List[str]] = None) -> bool:
+    """
+    Download and verify one model, reporting its progress.
+    Models whose license must be accepted first are appended to license_errors.
+    Returns True if the model is available in the cache afterwards.
+    """
+    if license_errors is None:
+        license_errors = []
+
+    from huggingface_hub.utils import RepositoryNotFoundError, HfHubHTTPError
+
+    model_id, repo_id = plan.model_id, plan.repo_id
+    display_name = plan.display_name
+    license_url = plan.license_url
+    model_progress_start = plan.progress_start
+    model_progress_end = plan.progress_end
+    config = MODEL_CONFIGS.get(model_id, {})
+
+    try:
+        # Step 1: Check if already downloaded and verified
+        print_progress(model_id, model_progress_start, f"Checking if {display_name} is already cached...")
+        is_verified, _ = verify_model_in_cache(model_id, repo_id)
+
+        if is_verified:
+            print_progress(model_id, model_progress_end, f"{display_name} already downloaded and verified")
+            print_complete(model_id)
+            return True
+
+        # Step 2: Download the model with retry logic
+        print_progress(model_id, model_progress_start + 5, f"Downloading {display_name}...")
+
+        local_dir, download_error = download_with_retry(repo_id, token, model_id)
+
+        if download_error:
+            # Check if it's a license error
+            if "accept" in download_error.lower() or "license" in download_error.lower():
+                print_license_required(model_id, license_url)
+                license_errors.append(model_id)
+            print_error(model_id, download_error)
+            return False
+
+        # Step 3: Post-download verification
+        print_progress(model_id, model_progress_end - 5, f"Verifying {display_name}...")
+
+        # Wait (briefly) until the downloaded files are visible
+        _await_snapshot_visible(local_dir, config.get('expected_files', []))
+
+        # Verify the download (recomputed, not the pre-download result)
+        invalidate_verify_cache(model_id)
+        is_verified, verify_error = verify_model_in_cache(model_id, repo_id)
+
+        if is_verified:
+            print_progress(model_id, model_progress_end, f"{display_name} downloaded and verified successfully")
+            print_complete(model_id)
+            return True
+        else:
+            # Fallback: Check the local_dir returned by snapshot_download
+            if local_dir and os.path.isdir(local_dir):
+                actual_path = os.path.realpath(local_dir)
+                model_type = config.get('type', 'regular')
+                min_size = config.get('min_size_bytes', 0)
+
+                # Check total size
+                total_size, files = scan_files(Path(actual_path))
+
+                if total_size >= min_size:
+                    # Check for expected files
+                    if model_type == 'pipeline':
+                        has_expected_files = any(os.path.basename(f) == 'config.yaml' for f in files)
+                    else:
+                        has_expected_files = any(f.endswith(WEIGHT_EXTENSIONS) for f in files)
+
+                    if has_expected_files:
+                        print_debug(f"Fallback verification passed for {model_id}")
+                        print_progress(model_id, model_progress_end, f"{display_name} downloaded successfully (fallback verification)")
+                        print_complete(model_id)
+                        return True
+
+            # If we get here, verification failed
+            error_msg = verify_error or f"Model files not found after download"
+            print_error(model_id, f"Download verification failed: {error_msg}")
+            return False
+
+    except RepositoryNotFoundError:
+        print_license_required(model_id, license_url)
+        license_errors.append(model_id)
+        error_msg = (
+            f"Repository not found: {repo_id}. "
+            f"Please ensure you have accepted the model terms at {license_url}"
+        )
+        print_error(model_id, error_msg)
+        return False
+
+    except HfHubHTTPError as e:
+        error_str = str(e)
+        if "401" in error_str or "403" in error_str:
+            print_license_required(model_id, license_url)
+            license_errors.append(model_id)
+            error_msg = (
+                f"Access denied for {repo_id}. "
+                f"Please accept the model terms at {license_url}"
+            )
+        else:
+            error_msg = f"HTTP error downloading {display_name}: {e}"
+        print_error(model_id, error_msg)
+        return False
+
+    except Exception as e:
+        print_error(model_id, f"Failed to download {display_name}: {e}")
+        return False
+
 def download_models():
     """Download all required PyAnnote models with improved error handling and verification."""
 
+    # Build models list from MODEL_CONFIGS (uses correct repository IDs)
+    models_to_download = [
+        (model_id, config['repo_id'])
+        for model_id, config in MODEL_CONFIGS.items()
+    ]
+
+    # Check the local cache first: on a warm start every model verifies and
+    # no network round-trip (token validation, login, download) is needed.
+    unverified = []
+    for model_plan in build_download_plan(models_to_download):
+        is_verified, _ = verify_model_in_cache(model_plan.model_id, model_plan.repo_id)
+        if is_verified:
+            print_progress(model_plan.model_id, model_plan.progress_end,
+                           f"{model_plan.display_name} already downloaded and verified")
+            print_complete(model_plan.model_id)
+        else:
+            unverified.append(model_plan)
+
+    if not unverified:
+        print_progress("all", 100, "All models downloaded successfully!")
+        print("[DOWNLOAD_COMPLETE]", file=sys.stderr, flush=True)
+        sys.exit(0)
+
     hf_token = os.environ.get('HF_TOKEN')
     if not hf_token:
         print_error("all", "HuggingFace token not provided. Please save your token in Settings and try again.")
@@ -365,141 +657,26 @@ def download_models():
         print_error("all", f"Failed to authenticate: {e}")
         sys.exit(1)
 
-    # Build models list from MODEL_CONFIGS (uses correct repository IDs)
-    models_to_download = [
-        (model_id, config['repo_id'])
-        for model_id, config in MODEL_CONFIGS.items()
-    ]
-
-    total_models = len(models_to_download)
     errors_occurred = False
     license_errors = []
 
-    # Pre-download validation: Check access to all gated models
-    print_progress("all", 8, "Checking model access permissions...")
-    for model_id, repo_id in models_to_download:
-        config = MODEL_CONFIGS.get(model_id, {})
-        has_access, access_error = check_model_access(repo_id, hf_token)
-        if not has_access:
-            license_url = config.get('license_url', f'https://huggingface.co/{repo_id}')
-            print_license_required(model_id, license_url)
-            license_errors.append((model_id, access_error))
+    # Download the missing models concurrently. The transfers are network-bound
+    # and release the GIL, so the total time approaches that of the slowest
+    # model. Gated models are reported by the download itself (no model_info
+    # preflight per model), into license_errors.
+    with ThreadPoolExecutor(max_workers=len(unverified)) as executor:
+        futures = [
+            executor.submit(download_model, model_plan, hf_token, license_errors)
+            for model_plan in unverified
+        ]
+        for future in as_completed(futures):
+            if not future.result():
+                errors_occurred = True
 
-    # If any license errors, report them all and exit
     if license_errors:
-        for model_id, error in license_errors:
-            print_error(model_id, error)
         print_error("all",
             "Some models require license acceptance. "
             "Please visit the URLs above and accept the model licenses, then try again.")
-        sys.exit(1)
-
-    # Download each model with per-model progress reporting
-    for idx, (model_id, repo_id) in enumerate(models_to_download):
-        config = MODEL_CONFIGS.get(model_id, {})
-        display_name = config.get('display_name', model_id)
-        license_url = config.get('license_url', f'https://huggingface.co/{repo_id}')
-
-        # Calculate progress ranges for this model
-        model_progress_start = int(10 + (idx / total_models) * 80)  # 10-90%
-        model_progress_end = int(10 + ((idx + 1) / total_models) * 80)
-
-        try:
-            # Step 1: Check if already downloaded and verified
-            print_progress(model_id, model_progress_start, f"Checking if {display_name} is already cached...")
-            is_verified, _ = verify_model_in_cache(model_id, repo_id)
-
-            if is_verified:
-                print_progress(model_id, model_progress_end, f"{display_name} already downloaded and verified")
-                print_complete(model_id)
-                continue
-
-            # Step 2: Download the model with retry logic
-            print_progress(model_id, model_progress_start + 5, f"Downloading {display_name}...")
-
-            local_dir, download_error = download_with_retry(repo_id, hf_token, model_id)
-
-            if download_error:
-                # Check if it's a license error
-                if "accept" in download_error.lower() or "license" in download_error.lower():
-                    print_license_required(model_id, license_url)
-                print_error(model_id, download_error)
-                errors_occurred = True
-                continue
-
-            # Step 3: Post-download verification
-            print_progress(model_id, model_progress_end - 5, f"Verifying {display_name}...")
-
-            # Small delay to ensure filesystem sync
-            time.sleep(0.5)
-
-            # Verify the download
-            is_verified, verify_error = verify_model_in_cache(model_id, repo_id)
-
-            if is_verified:
-                print_progress(model_id, model_progress_end, f"{display_name} downloaded and verified successfully")
-                print_complete(model_id)
-            else:
-                # Fallback: Check the local_dir returned by snapshot_download
-                if local_dir and os.path.isdir(local_dir):
-                    actual_path = os.path.realpath(local_dir)
-                    model_type = config.get('type', 'regular')
-                    min_size = config.get('min_size_bytes', 0)
-
-                    # Check total size
-                    total_size = get_total_file_size(Path(actual_path))
-
-                    if total_size >= min_size:
-                        # Check for expected files
-                        has_expected_files = False
-                        weight_extensions = ('.bin', '.pt', '.safetensors', '.ckpt')
-
-                        for root, dirs, filenames in os.walk(actual_path):
-                            if model_type == 'pipeline':
-                                if 'config.yaml' in filenames:
-                                    has_expected_files = True
-                                    break
-                            else:
-                                if any(f.endswith(weight_extensions) for f in filenames):
-                                    has_expected_files = True
-                                    break
-
-                        if has_expected_files:
-                            print_debug(f"Fallback verification passed for {model_id}")
-                            print_progress(model_id, model_progress_end, f"{display_name} downloaded successfully (fallback verification)")
-                            print_complete(model_id)
-                            continue
-
-                # If we get here, verification failed
-                error_msg = verify_error or f"Model files not found after download"
-                print_error(model_id, f"Download verification failed: {error_msg}")
-                errors_occurred = True
-
-        except RepositoryNotFoundError:
-            print_license_required(model_id, license_url)
-            error_msg = (
-                f"Repository not found: {repo_id}. "
-                f"Please ensure you have accepted the model terms at {license_url}"
-            )
-            print_error(model_id, error_msg)
-            errors_occurred = True
-
-        except HfHubHTTPError as e:
-            error_str = str(e)
-            if "401" in error_str or "403" in error_str:
-                print_license_required(model_id, license_url)
-                error_msg = (
-                    f"Access denied for {repo_id}. "
-                    f"Please accept the model terms at {license_url}"
-                )
-            else:
-                error_msg = f"HTTP error downloading {display_name}: {e}"
-            print_error(model_id, error_msg)
-            errors_occurred = True
-
-        except Exception as e:
-            print_error(model_id, f"Failed to download {display_name}: {e}")
-            errors_occurred = True
 
     # Final status
     if errors_occurred:
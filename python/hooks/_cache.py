@@ -0,0 +1,80 @@
+# Shared helper for the PyInstaller hooks in this directory
+# collect_submodules() imports every submodule of a package (in a subprocess)
+# to find the importable ones, which dominates analysis time on each rebuild.
+# The result only changes when the installed packages do, so it is cached
+# on disk, keyed on the package's location/modification time and on every
+# installed distribution: a submodule that failed to import because an
+# optional dependency was missing reappears once that dependency is installed.
+# Set MEETING_NOTES_NO_HOOK_CACHE=1 to rescan without reading or writing it.
+#
+# Hooks are loaded by file path; they import this module as hooks._cache,
+# which resolves because PyInstaller puts the entry scripts' directory
+# (python/) on sys.path for the analysis.
+
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import sys
+from functools import lru_cache
+
+from PyInstaller.utils.hooks import collect_submodules
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'meeting-notes', 'pyinstaller')
+
+
+@lru_cache(maxsize=1)
+def _environment_fingerprint():
+    """Interpreter plus the name and version of every installed distribution."""
+    installed = sorted(
+        f"{dist.metadata['Name']}=={dist.version}"
+        for dist in importlib.metadata.distributions()
+    )
+    return '|'.join([sys.executable, sys.version] + installed)
+
+
+def _cache_key(package):
+    """Return a key that changes whenever the build environment changes, or None."""
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin:
+        return None
+    try:
+        mtime = os.stat(spec.origin).st_mtime_ns
+    except OSError:
+        return None
+    source = f"{spec.origin}|{mtime}|{_environment_fingerprint()}"
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+
+
+def cached_submodules(package):
+    """collect_submodules(package), reusing the result of a previous build when possible."""
+    if os.environ.get('MEETING_NOTES_NO_HOOK_CACHE') == '1':
+        return collect_submodules(package)
+    key = _cache_key(package)
+    if key is None:
+        return collect_submodules(package)
+
+    cache_file = os.path.join(CACHE_DIR, f"{package}-{key}.json")
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            modules = json.load(f)
+        print(f"[hooks] Using cached submodule list for {package}")
+        return modules
+    except (OSError, ValueError):
+        pass
+
+    modules = collect_submodules(package)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(modules, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        # Caching is only an optimization; the build goes on without it
+        print(f"[hooks] Could not cache submodule list for {package}: {e}")
+    return modules
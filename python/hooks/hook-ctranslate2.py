@@ -1,10 +1,12 @@
 # PyInstaller hook for ctranslate2
 # This ensures all ctranslate2 submodules and native libs are properly bundled
 
-from PyInstaller.utils.hooks import collect_submodules, collect_data_files, collect_dynamic_libs
+from PyInstaller.utils.hooks import collect_data_files, collect_dynamic_libs
+
+from hooks._cache import cached_submodules
 
 # Collect all submodules
-hiddenimports = collect_submodules('ctranslate2')
+hiddenimports = cached_submodules('ctranslate2')
 
 # Collect data files
 datas = collect_data_files('ctranslate2')
@@ -1,13 +1,15 @@
 # PyInstaller hook for faster_whisper
 # This ensures all faster_whisper submodules and dependencies are properly bundled
 
-from PyInstaller.utils.hooks import collect_submodules, collect_data_files
+from PyInstaller.utils.hooks import collect_data_files
+
+from hooks._cache import cached_submodules
 
 # Collect all faster_whisper submodules
-hiddenimports = collect_submodules('faster_whisper')
+hiddenimports = cached_submodules('faster_whisper')
 
 # Also need ctranslate2
-hiddenimports += collect_submodules('ctranslate2')
+hiddenimports += cached_submodules('ctranslate2')
 
 # Collect data files (assets, etc) - note: datas format is [(src, dest)]
 datas = collect_data_files('faster_whisper')
@@ -0,0 +1,20 @@
+# PyInstaller hook for huggingface_hub
+# huggingface_hub imports hf_transfer only at download time (when
+# HF_HUB_ENABLE_HF_TRANSFER=1), so PyInstaller cannot see it; its compiled
+# Rust extension must be bundled explicitly or downloads fail in the app
+
+from PyInstaller.utils.hooks import collect_dynamic_libs
+
+hiddenimports = []
+binaries = []
+try:
+    import hf_transfer  # noqa: F401
+    hiddenimports = ['hf_transfer']
+    binaries = collect_dynamic_libs('hf_transfer')
+except ImportError:
+    # download_models.py only enables hf_transfer when it is importable
+    pass
+
+# Debug output
+print(f"[hook-huggingface_hub] Collected {len(hiddenimports)} hidden imports")
+print(f"[hook-huggingface_hub] Collected {len(binaries)} binary files")
@@ -1,11 +1,14 @@
 # PyInstaller hook for torchaudio
 # Fixes circular import issues with torchaudio.backend module
 
-from PyInstaller.utils.hooks import collect_submodules, collect_data_files
+from PyInstaller.utils.hooks import collect_data_files
+
+from hooks._cache import cached_submodules
 
 # Collect all torchaudio submodules EXCEPT sox backends to avoid circular imports
-hiddenimports = [m for m in collect_submodules('torchaudio')
-                 if 'sox' not in m.lower()]
+# (torchaudio's module names are all lowercase, so no .lower() is needed)
+hiddenimports = [m for m in cached_submodules('torchaudio')
+                 if 'sox' not in m]
 
 # Explicitly include backend modules that we DO want (soundfile backend only)
 hiddenimports.extend([
@@ -18,8 +21,8 @@ hiddenimports.extend([
     # 'torchaudio.backend.sox_backend',     # EXCLUDED
 ])
 
-# Remove any duplicate imports
-hiddenimports = list(set(hiddenimports))
+# Remove any duplicate imports, keeping the collection order
+hiddenimports = list(dict.fromkeys(hiddenimports))
 
 # Collect data files (model configs, etc.)
 datas = collect_data_files('torchaudio')
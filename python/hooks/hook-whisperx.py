@@ -1,10 +1,12 @@
 # PyInstaller hook for whisperx
 # This ensures all whisperx submodules and dependencies are properly bundled
 
-from PyInstaller.utils.hooks import collect_submodules, collect_data_files
+from PyInstaller.utils.hooks import collect_data_files
+
+from hooks._cache import cached_submodules
 
 # Collect all whisperx submodules
-hiddenimports = collect_submodules('whisperx')
+hiddenimports = cached_submodules('whisperx')
 
 # Also need these core dependencies
 hiddenimports += [
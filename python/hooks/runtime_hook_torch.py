@@ -12,27 +12,42 @@ os.environ['MEETING_NOTES_BUNDLED'] = '1'
 # ============================================================================
 # Fix 1: Patch torch.load to use weights_only=False
 # ============================================================================
-import functools
 import torch
 import torch.serialization
 
-_original_torch_load = torch.load
+def _default_weights_only_false():
+    """
+    Make weights_only=False the default of torch.load itself.
 
-@functools.wraps(_original_torch_load)
-def _patched_torch_load(*args, **kwargs):
-    if 'weights_only' not in kwargs:
-        kwargs['weights_only'] = False
-    return _original_torch_load(*args, **kwargs)
+    torch.load declares weights_only as a keyword-only argument, so its
+    default lives in __kwdefaults__. Changing it there needs no wrapper:
+    calls run at full speed, and references taken before this hook ran
+    (from torch import load) see the new default too. Explicitly passed
+    values are left untouched, as before.
+    """
+    for function in (torch.load, getattr(torch.load, '__wrapped__', None)):
+        kwdefaults = getattr(function, '__kwdefaults__', None)
+        if kwdefaults and 'weights_only' in kwdefaults:
+            kwdefaults['weights_only'] = False
+            return True
+    return False
 
-# Patch ALL references to torch.load
-torch.load = _patched_torch_load
-torch.serialization.load = _patched_torch_load
+# Newer torch releases can change the default through a public setter,
+# which leaves torch.load itself untouched
+_set_default_load_weights_only = getattr(torch.serialization, 'set_default_load_weights_only', None)
 
-# Also patch via sys.modules to ensure all imports see the patched version
-if 'torch' in sys.modules:
-    sys.modules['torch'].load = _patched_torch_load
-if 'torch.serialization' in sys.modules:
-    sys.modules['torch.serialization'].load = _patched_torch_load
+if _set_default_load_weights_only is not None:
+    _set_default_load_weights_only(False)
+elif not _default_weights_only_false():
+    # Fallback for a torch.load without a keyword-only default to change
+    _original_torch_load = torch.load
+
+    def _patched_torch_load(*args, weights_only=False, **kwargs):
+        return _original_torch_load(*args, weights_only=weights_only, **kwargs)
+
+    # torch.load and torch.serialization.load are separate module attributes
+    torch.load = _patched_torch_load
+    torch.serialization.load = _patched_torch_load
 
 print("[Runtime Hook] torch.load patched to use weights_only=False by default", file=sys.stderr)
 
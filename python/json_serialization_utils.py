@@ -15,6 +15,7 @@ Key Functions:
 - to_json_serializable(): Recursively convert any object to JSON-serializable types
 - NumpyTorchJSONEncoder: Custom JSON encoder class for json.dumps()
 - safe_json_dumps(): Safe wrapper around json.dumps() with automatic conversion
+  (uses orjson when it is installed)
 
 Usage:
     from json_serialization_utils import to_json_serializable, safe_json_dumps
@@ -31,9 +32,9 @@ This module directly fixes the error:
 """
 
 import json
-import math
 import sys
 import warnings
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 # Import numpy (required)
@@ -47,6 +48,25 @@ try:
 except ImportError:
     pass
 
+# isinstance() target for tensors; the empty tuple never matches without torch
+_TENSOR_TYPE = torch.Tensor if TORCH_AVAILABLE else ()
+
+# Optional fast JSON encoder. numpy values, dataclasses and datetimes are left
+# to the default callback (no OPT_SERIALIZE_NUMPY, passthrough options), so
+# they are converted exactly like on the json path: float32 widened to float64,
+# NaN/Infinity in arrays sanitized, str(obj) for dataclasses and datetimes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+_INF = float('inf')
+_NEG_INF = float('-inf')
+_FLOAT_MAX = sys.float_info.max
+
 
 def _handle_special_float(value: float, warn: bool = True) -> Union[float, None]:
     """
@@ -65,7 +85,10 @@ def _handle_special_float(value: float, warn: bool = True) -> Union[float, None]
         - -sys.float_info.max for negative Infinity
         - The original value if it's a normal float
     """
-    if math.isnan(value):
+    # Finite values (the common case); NaN is the only value unequal to itself
+    if value == value and value != _INF and value != _NEG_INF:
+        return value
+    if value != value:
         if warn:
             warnings.warn(
                 "NaN value encountered during JSON serialization, converting to null",
@@ -73,18 +96,91 @@ def _handle_special_float(value: float, warn: bool = True) -> Union[float, None]
                 stacklevel=3
             )
         return None
-    elif math.isinf(value):
-        if warn:
-            sign = "positive" if value > 0 else "negative"
-            warnings.warn(
-                f"{sign.capitalize()} Infinity encountered during JSON serialization, "
-                f"converting to {'max' if value > 0 else 'min'} float value",
-                RuntimeWarning,
-                stacklevel=3
-            )
-        # Return max/min float as a large but valid number
-        return sys.float_info.max if value > 0 else -sys.float_info.max
-    return value
+    # Infinity
+    if warn:
+        sign = "positive" if value > 0 else "negative"
+        warnings.warn(
+            f"{sign.capitalize()} Infinity encountered during JSON serialization, "
+            f"converting to {'max' if value > 0 else 'min'} float value",
+            RuntimeWarning,
+            stacklevel=3
+        )
+    # Return max/min float as a large but valid number
+    return _FLOAT_MAX if value > 0 else -_FLOAT_MAX
+
+
+def _sanitize_float(value: float, counts: Optional[List[int]]) -> Union[float, None]:
+    """
+    _handle_special_float for the recursive walkers: instead of one warning
+    per value, special values are tallied in counts ([NaN, +Inf, -Inf]) and
+    reported once by _warn_special_floats. counts is None when not warning.
+    """
+    if value == value and value != _INF and value != _NEG_INF:
+        return value
+    if value != value:
+        if counts is not None:
+            counts[0] += 1
+        return None
+    if value > 0:
+        if counts is not None:
+            counts[1] += 1
+        return _FLOAT_MAX
+    if counts is not None:
+        counts[2] += 1
+    return -_FLOAT_MAX
+
+
+def _is_special_float_error(error: ValueError) -> bool:
+    """Check for the ValueError json raises on NaN/Infinity with allow_nan=False."""
+    return str(error).startswith("Out of range float values")
+
+
+def _warn_special_floats(counts: List[int], stacklevel: int) -> None:
+    """Emit a single warning summarizing the special values in counts."""
+    nan_count, pos_inf_count, neg_inf_count = counts
+    parts = []
+    if nan_count:
+        parts.append(f"{nan_count} NaN value(s) converted to null")
+    if pos_inf_count:
+        parts.append(f"{pos_inf_count} positive Infinity value(s) converted to max float value")
+    if neg_inf_count:
+        parts.append(f"{neg_inf_count} negative Infinity value(s) converted to min float value")
+    if parts:
+        warnings.warn(
+            "Special float values encountered during JSON serialization: " + "; ".join(parts),
+            RuntimeWarning,
+            stacklevel=stacklevel + 1
+        )
+
+
+def _orjson_default(value: Any, warn_special_floats: bool) -> Any:
+    """orjson fallback for values it does not encode natively."""
+    # numpy values, tensors, sets, bytes, ... go through the regular conversion
+    return to_json_serializable(value, warn_special_floats)
+
+
+def _orjson_dumps(obj: Any, warn_special_floats: bool) -> Optional[str]:
+    """
+    Serialize with orjson when it is installed (compact separators).
+
+    numpy values go through the same conversion as on the json path (see
+    _ORJSON_OPTIONS). orjson itself writes Python float NaN/Infinity and
+    enums: NaN/Infinity as null (without a warning), enums as their value.
+
+    Returns None when the standard json path must be used instead.
+    """
+    if not ORJSON_AVAILABLE:
+        return None
+    try:
+        return orjson.dumps(
+            obj,
+            default=lambda value: _orjson_default(value, warn_special_floats),
+            option=_ORJSON_OPTIONS
+        ).decode('utf-8')
+    except TypeError:
+        # orjson.JSONEncodeError (e.g. integers beyond 64 bits, non-str keys,
+        # circular or very deep payloads): the json path handles or reports them
+        return None
 
 
 def to_json_serializable(obj: Any, warn_special_floats: bool = True) -> Any:
@@ -95,14 +191,15 @@ def to_json_serializable(obj: Any, warn_special_floats: bool = True) -> Any:
     This function handles:
     1. numpy scalar types (float32, float64, int32, int64, bool_)
     2. numpy arrays (using .tolist() method)
-    3. PyTorch tensors (using .cpu().numpy().tolist())
+    3. PyTorch tensors (converted through numpy, like numpy arrays)
     4. Special float values: NaN -> null, Infinity -> large number
     5. Nested dictionaries and lists (recursive conversion)
     6. Native Python types (preserved without modification)
 
     Args:
         obj: Any Python object that may contain numpy/torch types
-        warn_special_floats: Whether to emit warnings for NaN/Infinity values
+        warn_special_floats: Whether to emit a warning for NaN/Infinity values
+            (one summary warning per call)
 
     Returns:
         Object with all values converted to JSON-serializable types
@@ -117,30 +214,44 @@ def to_json_serializable(obj: Any, warn_special_floats: bool = True) -> Any:
         >>> to_json_serializable(np.float64('nan'))
         None
     """
-    # Handle None
-    if obj is None:
-        return None
+    # Native leaves (str, int, bool, None) are returned as-is right away
+    if type(obj) in _PASSTHROUGH_TYPES:
+        return obj
+    counts = [0, 0, 0] if warn_special_floats else None
+    result = _to_serializable(obj, counts)
+    if counts is not None and any(counts):
+        _warn_special_floats(counts, stacklevel=2)
+    return result
+
+
+def _to_serializable(obj: Any, counts: Optional[List[int]]) -> Any:
+    """Recursive worker of to_json_serializable (see _sanitize_float for counts)."""
+    # Exact-type lookup covers nearly every node (one dict probe instead of a
+    # chain of isinstance checks); subclasses and unknown types fall through
+    handler = _CONVERTERS.get(type(obj))
+    if handler is not None:
+        return handler(obj, counts)
 
     # Handle PyTorch tensors (must check before numpy since tensors have .numpy())
-    if TORCH_AVAILABLE and isinstance(obj, torch.Tensor):
-        # Move to CPU if on GPU, convert to numpy, then to list
-        try:
-            # Handle scalar tensors
-            if obj.dim() == 0:
-                value = float(obj.cpu().item())
-                return _handle_special_float(value, warn_special_floats)
-            # Handle array tensors
-            numpy_array = obj.detach().cpu().numpy()
-            return to_json_serializable(numpy_array.tolist(), warn_special_floats)
-        except Exception as e:
-            # Fallback: try to convert to string
-            warnings.warn(f"Failed to convert torch.Tensor to JSON-serializable: {e}")
-            return str(obj)
+    if isinstance(obj, _TENSOR_TYPE):
+        return _convert_tensor(obj, counts)
+
+    # Handle dictionaries (recursive)
+    if isinstance(obj, dict):
+        return _convert_dict(obj, counts)
+
+    # Handle lists and tuples (recursive)
+    if isinstance(obj, (list, tuple)):
+        return _convert_sequence(obj, counts)
 
     # Handle numpy floating point scalars (float32, float64, etc.)
+    # (before float: numpy.float64 is a float subclass)
     if isinstance(obj, np.floating):
-        value = float(obj)
-        return _handle_special_float(value, warn_special_floats)
+        return _convert_numpy_float(obj, counts)
+
+    # Handle Python floats (check for NaN/Infinity)
+    if isinstance(obj, float):
+        return _sanitize_float(obj, counts)
 
     # Handle numpy integer scalars (int32, int64, etc.)
     if isinstance(obj, np.integer):
@@ -152,46 +263,26 @@ def to_json_serializable(obj: Any, warn_special_floats: bool = True) -> Any:
 
     # Handle numpy arrays
     if isinstance(obj, np.ndarray):
-        # Convert to list first, then recursively process each element
-        # This handles nested arrays and special float values
-        return [to_json_serializable(item, warn_special_floats) for item in obj.tolist()]
-
-    # Handle Python floats (check for NaN/Infinity)
-    if isinstance(obj, float):
-        return _handle_special_float(obj, warn_special_floats)
+        return _convert_ndarray(obj, counts)
 
     # Handle native Python types that are already JSON-serializable
     if isinstance(obj, (str, int, bool)):
         return obj
 
-    # Handle dictionaries (recursive)
-    if isinstance(obj, dict):
-        return {
-            key: to_json_serializable(value, warn_special_floats)
-            for key, value in obj.items()
-        }
-
-    # Handle lists and tuples (recursive)
-    if isinstance(obj, (list, tuple)):
-        return [to_json_serializable(item, warn_special_floats) for item in obj]
-
     # Handle sets (convert to list)
     if isinstance(obj, set):
-        return [to_json_serializable(item, warn_special_floats) for item in obj]
+        return _convert_sequence(obj, counts)
 
     # Handle bytes (decode to string)
     if isinstance(obj, bytes):
-        try:
-            return obj.decode('utf-8')
-        except UnicodeDecodeError:
-            return obj.decode('latin-1')
+        return _convert_bytes(obj, counts)
 
     # For unknown types, try common conversions
     # First try to get numeric value
     if hasattr(obj, 'item'):
         # Many numpy-like objects have .item() method
         try:
-            return to_json_serializable(obj.item(), warn_special_floats)
+            return _to_serializable(obj.item(), counts)
         except Exception:
             pass
 
@@ -202,6 +293,172 @@ def to_json_serializable(obj: Any, warn_special_floats: bool = True) -> Any:
         return None
 
 
+# ----------------------------------------------------------------------------
+# Converters used by to_json_serializable, dispatched on the exact type
+# ----------------------------------------------------------------------------
+
+def _convert_native(obj: Any, counts: Optional[List[int]]) -> Any:
+    # None, str, int and bool are already JSON-serializable
+    return obj
+
+
+def _convert_numpy_float(obj: Any, counts: Optional[List[int]]) -> Union[float, None]:
+    value = float(obj)
+    # Finite check inlined: no extra call for the common case
+    if value == value and value != _INF and value != _NEG_INF:
+        return value
+    return _sanitize_float(value, counts)
+
+
+def _convert_numpy_int(obj: Any, counts: Optional[List[int]]) -> int:
+    return int(obj)
+
+
+def _convert_numpy_bool(obj: Any, counts: Optional[List[int]]) -> bool:
+    return bool(obj)
+
+
+# Values copied as-is by the container converters, without a recursive call
+# (finite floats are copied too: x - x is 0.0 for them, NaN for NaN/Infinity)
+_PASSTHROUGH_TYPES = frozenset((str, int, bool, type(None)))
+
+
+def _convert_dict(obj: Dict[Any, Any], counts: Optional[List[int]]) -> Dict[Any, Any]:
+    return {
+        key: value if type(value) in _PASSTHROUGH_TYPES
+        or (type(value) is float and value - value == 0.0)
+        else _to_serializable(value, counts)
+        for key, value in obj.items()
+    }
+
+
+# Lists/tuples at least this long whose items all share one of these numpy
+# scalar types are converted as a single array (vectorized check + .tolist())
+_HOMOGENEOUS_MIN_LENGTH = 16
+_ARRAY_ITEM_TYPES = frozenset((
+    np.float16, np.float32, np.float64,
+    np.int8, np.int16, np.int32, np.int64, np.intc, np.longlong,
+    np.uint8, np.uint16, np.uint32, np.uint64, np.uintc, np.ulonglong,
+    np.bool_,
+))
+
+
+def _convert_sequence(obj: Any, counts: Optional[List[int]]) -> List[Any]:
+    # e.g. per-frame scores collected as numpy scalars in a Python list
+    if (len(obj) >= _HOMOGENEOUS_MIN_LENGTH and type(obj) is not set
+            and type(obj[0]) in _ARRAY_ITEM_TYPES
+            and len(set(map(type, obj))) == 1):
+        return _convert_ndarray(np.array(obj), counts)
+    # Lists, tuples and sets all become lists
+    return [
+        item if type(item) in _PASSTHROUGH_TYPES
+        or (type(item) is float and item - item == 0.0)
+        else _to_serializable(item, counts)
+        for item in obj
+    ]
+
+
+def _convert_bytes(obj: bytes, counts: Optional[List[int]]) -> str:
+    # utf-8 decoding has its own ASCII fast path in C; a separate isascii()
+    # check would only add a second pass over the data
+    try:
+        return obj.decode('utf-8')
+    except UnicodeDecodeError:
+        return obj.decode('latin-1')
+
+
+def _convert_ndarray(obj: np.ndarray, counts: Optional[List[int]]) -> Any:
+    kind = obj.dtype.kind
+    # Integer/boolean arrays and finite float arrays need no sanitizing:
+    # .tolist() already yields native Python values in a single C call
+    if kind in 'biu':
+        return obj.tolist()
+    if kind == 'f' and obj.ndim:
+        if obj.dtype.itemsize > 8:
+            # np.longdouble: .tolist() keeps longdouble items, which json
+            # cannot encode; narrow to float64 like float() does for scalars
+            obj = obj.astype(np.float64)
+        finite = np.isfinite(obj)
+        if finite.all():
+            # One .tolist() for the whole array, even a large 2-D one:
+            # converting row by row is no faster, and returning numpy scalars
+            # (list(arr)) would only defer the same work to the encoder
+            return obj.tolist()
+        return _sanitize_float_array(obj, finite, counts)
+    # Otherwise (object dtype, 0-d arrays, ...) convert to list first,
+    # then recursively process each element
+    return _to_serializable(obj.tolist(), counts)
+
+
+def _sanitize_float_array(obj: np.ndarray, finite: np.ndarray,
+                          counts: Optional[List[int]]) -> List[Any]:
+    """
+    Convert a float array holding NaN/Infinity with whole-array operations:
+    Infinity is clipped to +/-sys.float_info.max before .tolist(), and only
+    the NaN positions are patched to None afterwards.
+    """
+    nan_mask = np.isnan(obj)
+    # float64 first: float32 cannot represent sys.float_info.max
+    clipped = np.clip(obj.astype(np.float64), -_FLOAT_MAX, _FLOAT_MAX)
+    result = clipped.tolist()
+    nan_positions = np.argwhere(nan_mask).tolist()
+    for position in nan_positions:
+        row = result
+        for index in position[:-1]:
+            row = row[index]
+        row[position[-1]] = None
+
+    if counts is not None:
+        nan_count = len(nan_positions)
+        pos_inf_count = int(np.count_nonzero(np.isposinf(obj)))
+        counts[0] += nan_count
+        counts[1] += pos_inf_count
+        counts[2] += obj.size - int(np.count_nonzero(finite)) - nan_count - pos_inf_count
+    return result
+
+
+def _convert_tensor(obj: Any, counts: Optional[List[int]]) -> Any:
+    try:
+        # Handle scalar tensors (.item() copies from any device)
+        if obj.dim() == 0:
+            value = float(obj.item())
+            return _sanitize_float(value, counts)
+        # numpy has no bfloat16: widen reduced-precision floats first
+        if obj.dtype in _REDUCED_FLOAT_DTYPES:
+            obj = obj.float()
+        # Handle array tensors: move to CPU if on GPU and convert through the
+        # ndarray path (vectorized NaN/Infinity check, one .tolist() call)
+        return _convert_ndarray(obj.detach().cpu().numpy(), counts)
+    except Exception as e:
+        # Fallback: try to convert to string
+        warnings.warn(f"Failed to convert torch.Tensor to JSON-serializable: {e}")
+        return str(obj)
+
+
+_CONVERTERS = {
+    type(None): _convert_native,
+    str: _convert_native,
+    int: _convert_native,
+    bool: _convert_native,
+    float: _sanitize_float,
+    dict: _convert_dict,
+    list: _convert_sequence,
+    tuple: _convert_sequence,
+    set: _convert_sequence,
+    bytes: _convert_bytes,
+    np.ndarray: _convert_ndarray,
+    np.bool_: _convert_numpy_bool,
+}
+for _numpy_type in (np.float16, np.float32, np.float64, np.longdouble):
+    _CONVERTERS[_numpy_type] = _convert_numpy_float
+for _numpy_type in (np.int8, np.int16, np.int32, np.int64, np.intc, np.longlong,
+                    np.uint8, np.uint16, np.uint32, np.uint64, np.uintc, np.ulonglong):
+    _CONVERTERS[_numpy_type] = _convert_numpy_int
+if TORCH_AVAILABLE:
+    _CONVERTERS[torch.Tensor] = _convert_tensor
+    _REDUCED_FLOAT_DTYPES = (torch.float16, torch.bfloat16)
+
+
 class NumpyTorchJSONEncoder(json.JSONEncoder):
     """
     Custom JSON encoder that handles numpy types and PyTorch tensors.
@@ -222,18 +479,23 @@ class NumpyTorchJSONEncoder(json.JSONEncoder):
     """
 
     def __init__(self, *args, warn_special_floats: bool = True, **kwargs):
+        # The C encoder raises ValueError on NaN/Infinity instead of writing
+        # them out; encode() uses that to detect the (rare) payloads that
+        # need sanitizing, so finite payloads are encoded in a single pass
+        kwargs['allow_nan'] = False
         super().__init__(*args, **kwargs)
         self.warn_special_floats = warn_special_floats
 
     def default(self, obj):
         """Handle non-serializable objects."""
         # PyTorch tensors
-        if TORCH_AVAILABLE and isinstance(obj, torch.Tensor):
+        if isinstance(obj, _TENSOR_TYPE):
             try:
                 if obj.dim() == 0:
                     value = float(obj.cpu().item())
                     return _handle_special_float(value, self.warn_special_floats)
-                return obj.detach().cpu().numpy().tolist()
+                # Sanitizes NaN/Infinity elements (allow_nan is off)
+                return _convert_tensor(obj, None)
             except Exception:
                 return str(obj)
 
@@ -246,9 +508,9 @@ class NumpyTorchJSONEncoder(json.JSONEncoder):
         if isinstance(obj, np.integer):
             return int(obj)
 
-        # Numpy arrays
+        # Numpy arrays (NaN/Infinity elements sanitized, allow_nan is off)
         if isinstance(obj, np.ndarray):
-            return obj.tolist()
+            return _convert_ndarray(obj, None)
 
         # Numpy boolean
         if isinstance(obj, np.bool_):
@@ -256,10 +518,7 @@ class NumpyTorchJSONEncoder(json.JSONEncoder):
 
         # Bytes
         if isinstance(obj, bytes):
-            try:
-                return obj.decode('utf-8')
-            except UnicodeDecodeError:
-                return obj.decode('latin-1')
+            return _convert_bytes(obj, None)
 
         # Sets
         if isinstance(obj, set):
@@ -270,21 +529,75 @@ class NumpyTorchJSONEncoder(json.JSONEncoder):
 
     def encode(self, obj):
         """Override encode to handle special float values in nested structures."""
+        # Most payloads contain no NaN/Infinity: leave them entirely to the
+        # C encoder, which raises ValueError (allow_nan=False) otherwise
+        try:
+            return super().encode(obj)
+        except ValueError as e:
+            # Anything else (e.g. a circular reference) is the caller's error
+            if not _is_special_float_error(e):
+                raise
         # Pre-process the object to handle NaN/Infinity in nested dicts/lists
-        processed = self._preprocess_floats(obj)
-        return super().encode(processed)
-
-    def _preprocess_floats(self, obj):
-        """Recursively process floats to handle NaN/Infinity."""
+        return super().encode(self._sanitized(obj))
+
+    def iterencode(self, o, _one_shot=False):
+        """Sanitize up front when streaming (json.dump); encode() retries instead."""
+        if not _one_shot:
+            o = self._sanitized(o)
+        return super().iterencode(o, _one_shot)
+
+    def _sanitized(self, obj):
+        """_preprocess_floats with one summary warning for the whole object."""
+        counts = [0, 0, 0] if self.warn_special_floats else None
+        processed = self._preprocess_floats(obj, counts)
+        if counts is not None:
+            _warn_special_floats(counts, stacklevel=3)
+        return processed
+
+    def _preprocess_floats(self, obj, counts=None):
+        """
+        Recursively process floats to handle NaN/Infinity (tallied in counts).
+
+        Containers are copied only when something inside them changed; clean
+        subtrees are returned as-is (the caller's objects are never mutated).
+        """
         if isinstance(obj, float):
-            return _handle_special_float(obj, self.warn_special_floats)
+            return _sanitize_float(obj, counts)
         elif isinstance(obj, dict):
-            return {k: self._preprocess_floats(v) for k, v in obj.items()}
+            processed = None
+            for key, value in obj.items():
+                new_value = self._preprocess_floats(value, counts)
+                if new_value is not value:
+                    if processed is None:
+                        processed = dict(obj)
+                    processed[key] = new_value
+            return obj if processed is None else processed
         elif isinstance(obj, (list, tuple)):
-            return [self._preprocess_floats(item) for item in obj]
+            processed = None
+            for index, item in enumerate(obj):
+                new_item = self._preprocess_floats(item, counts)
+                if new_item is not item:
+                    if processed is None:
+                        processed = list(obj)
+                    processed[index] = new_item
+            return obj if processed is None else processed
         return obj
 
 
+@lru_cache(maxsize=None)
+def _shared_encoder(warn_special_floats: bool, ensure_ascii: bool) -> NumpyTorchJSONEncoder:
+    """
+    Return a reusable encoder for the given settings.
+
+    Encoders keep no per-call state, so one instance per settings pair saves
+    constructing a new one for every line of streamed output.
+    """
+    return NumpyTorchJSONEncoder(
+        warn_special_floats=warn_special_floats,
+        ensure_ascii=ensure_ascii
+    )
+
+
 def safe_json_dumps(
     obj: Any,
     warn_special_floats: bool = True,
@@ -309,15 +622,29 @@ def safe_json_dumps(
     Raises:
         TypeError: If object cannot be serialized even after conversion
     """
+    # orjson serializes numpy types natively, without Python callbacks
+    if not ensure_ascii and not kwargs:
+        json_str = _orjson_dumps(obj, warn_special_floats)
+        if json_str is not None:
+            return json_str
+
     try:
         # First try with the custom encoder (handles most cases efficiently)
-        encoder = NumpyTorchJSONEncoder(
-            warn_special_floats=warn_special_floats,
-            ensure_ascii=ensure_ascii,
-            **kwargs
-        )
+        if kwargs:
+            encoder = NumpyTorchJSONEncoder(
+                warn_special_floats=warn_special_floats,
+                ensure_ascii=ensure_ascii,
+                **kwargs
+            )
+        else:
+            encoder = _shared_encoder(warn_special_floats, ensure_ascii)
         return encoder.encode(obj)
-    except TypeError as e:
+    except (TypeError, ValueError) as e:
+        # NaN/Infinity left over in values returned by default() (e.g. inside
+        # a set) are recoverable; other ValueErrors such as circular
+        # references are not
+        if isinstance(e, ValueError) and not _is_special_float_error(e):
+            raise
         # If encoding fails, try converting all values first
         try:
             converted = to_json_serializable(obj, warn_special_floats)
@@ -330,7 +657,11 @@ def safe_json_dumps(
             ) from e
 
 
-def safe_output_json(obj: Dict[str, Any], warn_special_floats: bool = False) -> None:
+def safe_output_json(
+    obj: Dict[str, Any],
+    warn_special_floats: bool = False,
+    flush: bool = True
+) -> None:
     """
     Safely output a JSON object as a line to stdout.
 
@@ -340,18 +671,26 @@ def safe_output_json(obj: Dict[str, Any], warn_special_floats: bool = False) ->
     Args:
         obj: Dictionary to output as JSON
         warn_special_floats: Whether to emit warnings for NaN/Infinity
+        flush: Flush stdout after the line. Pass False when emitting a burst
+            of records and flush once after the last one (one write for the
+            whole batch instead of one per line); the reader sees nothing
+            until then.
     """
+    json_str = _orjson_dumps(obj, warn_special_floats)
+    if json_str is not None:
+        print(json_str, flush=flush)
+        return
+
     try:
         # Try with custom encoder first
-        print(
-            json.dumps(obj, ensure_ascii=False, cls=NumpyTorchJSONEncoder),
-            flush=True
-        )
-    except TypeError as e:
+        print(_shared_encoder(True, False).encode(obj), flush=flush)
+    except (TypeError, ValueError) as e:
+        if isinstance(e, ValueError) and not _is_special_float_error(e):
+            raise
         # Recovery: convert all values to native types
         try:
             converted = to_json_serializable(obj, warn_special_floats)
-            print(json.dumps(converted, ensure_ascii=False), flush=True)
+            print(json.dumps(converted, ensure_ascii=False), flush=flush)
         except Exception as recovery_error:
             # Log error to stderr but don't crash
             print(
@@ -365,7 +704,7 @@ def safe_output_json(obj: Dict[str, Any], warn_special_floats: bool = False) ->
                 "error": str(e),
                 "original_type": obj.get("type", "unknown") if isinstance(obj, dict) else "unknown"
             }
-            print(json.dumps(error_obj, ensure_ascii=False), flush=True)
+            print(json.dumps(error_obj, ensure_ascii=False), flush=flush)
 
 
 # ============================================================================
@@ -47,7 +47,6 @@ except Exception:
     pass
 
 import argparse
-import json
 import sys
 import os
 import io
@@ -183,7 +182,7 @@ def to_python_native(obj: Any) -> Any:
     return to_json_serializable(obj, warn_special_floats=False)
 
 
-def output_json(obj: Dict[str, Any]) -> None:
+def output_json(obj: Dict[str, Any], flush: bool = True) -> None:
     """
     Output a JSON object as a line to stdout.
 
@@ -197,26 +196,11 @@ def output_json(obj: Dict[str, Any]) -> None:
     If serialization fails, attempts recovery by converting all values
     to Python native types. This ensures the transcription pipeline continues
     even when individual segments have serialization issues.
+
+    Pass flush=False for all but the last line of a burst (e.g. the segments
+    of one processed chunk) and flush stdout once afterwards.
     """
-    try:
-        # First try with the custom encoder that handles numpy AND torch types
-        print(json.dumps(obj, ensure_ascii=False, cls=NumpyTorchJSONEncoder), flush=True)
-    except TypeError as e:
-        # If encoding still fails, try converting all values to native types
-        try:
-            converted_obj = to_json_serializable(obj, warn_special_floats=False)
-            print(json.dumps(converted_obj, ensure_ascii=False), flush=True)
-        except Exception as recovery_error:
-            # Last resort: log error to stderr but don't crash the pipeline
-            print(f"[WHISPER DEBUG] JSON serialization error (recovery failed): {e}, {recovery_error}",
-                  file=sys.stderr, flush=True)
-            # Output a minimal error marker that can be parsed
-            error_obj = {
-                "type": "serialization_error",
-                "error": str(e),
-                "original_type": obj.get("type", "unknown")
-            }
-            print(json.dumps(error_obj, ensure_ascii=False), flush=True)
+    safe_output_json(obj, flush=flush)
 
 
 def output_status(message: str, **kwargs) -> None:
@@ -229,12 +213,13 @@ def output_error(message: str, code: str = "ERROR") -> None:
     output_json({"type": "error", "message": message, "code": code})
 
 
-def output_segment(text: str, start: float, end: float, confidence: float = None, words: List = None, speaker: str = None) -> None:
+def output_segment(text: str, start: float, end: float, confidence: float = None, words: List = None, speaker: str = None, flush: bool = True) -> None:
     """
     Output a transcribed segment.
 
     All numeric values are explicitly converted to Python native types
     to prevent JSON serialization errors with numpy float32 values.
+    flush is passed on to output_json().
     """
     # Console log for debugging - verify Whisper is transcribing audio
     speaker_info = f", speaker: {speaker}" if speaker else ""
@@ -267,7 +252,23 @@ def output_segment(text: str, start: float, end: float, confidence: float = None
         result["words"] = to_python_native(words)
     if speaker:
         result["speaker"] = str(speaker)
-    output_json(result)
+    output_json(result, flush=flush)
+
+
+def output_segments(segments: List[Dict[str, Any]]) -> None:
+    """Output the segments of one processed chunk, flushing stdout once."""
+    for seg in segments:
+        output_segment(
+            seg["text"],
+            seg["start"],
+            seg["end"],
+            seg.get("confidence"),
+            seg.get("words"),
+            seg.get("speaker"),  # Include speaker label from diarization
+            flush=False
+        )
+    if segments:
+        sys.stdout.flush()
 
 
 # Attempt to import Silero VAD for better voice activity detection
@@ -1650,30 +1651,14 @@ def read_stdin_audio(transcriber: StreamingTranscriber, read_size: int = 4096) -
 
             # Process if we have enough data
             segments = transcriber.process_buffer()
-            for seg in segments:
-                segments_produced += 1
-                output_segment(
-                    seg["text"],
-                    seg["start"],
-                    seg["end"],
-                    seg.get("confidence"),
-                    seg.get("words"),
-                    seg.get("speaker")  # Include speaker label from diarization
-                )
+            segments_produced += len(segments)
+            output_segments(segments)
 
         # Process remaining audio
         output_status("Processing remaining audio...")
         segments = transcriber.process_remaining()
-        for seg in segments:
-            segments_produced += 1
-            output_segment(
-                seg["text"],
-                seg["start"],
-                seg["end"],
-                seg.get("confidence"),
-                seg.get("words"),
-                seg.get("speaker")  # Include speaker label from diarization
-            )
+        segments_produced += len(segments)
+        output_segments(segments)
 
         output_json({
             "type": "complete",
@@ -1711,27 +1696,11 @@ def read_pipe_audio(transcriber: StreamingTranscriber, pipe_path: str) -> None:
                 transcriber.add_audio(data)
 
                 segments = transcriber.process_buffer()
-                for seg in segments:
-                    output_segment(
-                        seg["text"],
-                        seg["start"],
-                        seg["end"],
-                        seg.get("confidence"),
-                        seg.get("words"),
-                        seg.get("speaker")  # Include speaker label from diarization
-                    )
+                output_segments(segments)
 
         # Process remaining
         segments = transcriber.process_remaining()
-        for seg in segments:
-            output_segment(
-                seg["text"],
-                seg["start"],
-                seg["end"],
-                seg.get("confidence"),
-                seg.get("words"),
-                seg.get("speaker")  # Include speaker label from diarization
-            )
+        output_segments(segments)
 
         output_json({"type": "complete", "total_seconds": transcriber.total_processed_samples / transcriber.sample_rate})
 
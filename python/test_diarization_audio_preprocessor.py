@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+test_diarization_audio_preprocessor.py - Unit tests for the diarization audio preprocessor
+
+Tests the diarization_audio_preprocessor module's in-memory helpers:
+- Audio quality analysis of mono and single-channel 2-D buffers
+- Header-only validation of too-short audio
+- The DC blocker's sample-rate independent cutoff
+- The JSON-lines protocol of the serve command
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+
+import numpy as np
+
+# Import the module under test
+from diarization_audio_preprocessor import (
+    DC_BLOCK_POLE,
+    PARALLEL_STATS_MIN_SAMPLES,
+    SOUNDFILE_AVAILABLE,
+    AudioQualityAnalyzer,
+    AudioQualityIssue,
+    DiarizationAudioPreprocessor,
+    _dc_block,
+    _dc_block_pole,
+    _serve,
+)
+
+
+class TestAudioQualityAnalyzer(unittest.TestCase):
+    """Tests for AudioQualityAnalyzer.analyze()."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.audio = rng.uniform(-0.5, 0.5, 16000).astype(np.float32)
+
+    def test_single_channel_column_matches_mono(self):
+        """A (frames, 1) buffer should be analyzed like the 1-D buffer."""
+        analyzer = AudioQualityAnalyzer()
+        # Short buffers take the NumPy path, long ones the parallel kernel
+        for audio in (self.audio, np.tile(self.audio, PARALLEL_STATS_MIN_SAMPLES // 16000 + 1)):
+            with self.subTest(samples=len(audio)):
+                mono = analyzer.analyze(audio, 16000).to_dict()
+                column = analyzer.analyze(audio[:, np.newaxis], 16000).to_dict()
+                self.assertEqual(column, mono)
+
+
+@unittest.skipUnless(SOUNDFILE_AVAILABLE, "soundfile not installed")
+class TestValidateForDiarization(unittest.TestCase):
+    """Tests for DiarizationAudioPreprocessor.validate_for_diarization()."""
+
+    def test_short_audio_header_check_matches_full_analysis(self):
+        """The header-only report should match full analysis of short audio."""
+        import soundfile as sf
+
+        rng = np.random.default_rng(0)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "short.wav")
+            sf.write(path, rng.uniform(-0.5, 0.5, 8000), 16000, subtype="PCM_16")
+            preprocessor = DiarizationAudioPreprocessor()
+            is_suitable, header_report = preprocessor.validate_for_diarization(path)
+            full_report = preprocessor.analyze_quality(path)
+
+        self.assertFalse(is_suitable)
+        self.assertEqual(header_report.overall_quality, full_report.overall_quality)
+        self.assertEqual(header_report.diarization_suitability, full_report.diarization_suitability)
+        short_warnings = [w for w in full_report.warnings if w.issue == AudioQualityIssue.SHORT_DURATION]
+        self.assertEqual(header_report.warnings, short_warnings)
+
+
+class TestDcBlock(unittest.TestCase):
+    """Tests for the one-pole DC blocker."""
+
+    def test_pole_keeps_cutoff_across_sample_rates(self):
+        """A 20 Hz tone should be attenuated the same at 16 kHz and 48 kHz."""
+        self.assertEqual(_dc_block_pole(16000), DC_BLOCK_POLE)
+        gains = []
+        for sample_rate in (16000, 48000):
+            t = np.arange(4 * sample_rate) / sample_rate
+            tone = np.sin(2 * np.pi * 20 * t)
+            filtered = _dc_block(tone.copy(), _dc_block_pole(sample_rate))
+            tail = slice(2 * sample_rate, None)
+            gains.append(np.std(filtered[tail]) / np.std(tone[tail]))
+        self.assertAlmostEqual(gains[0], gains[1], delta=0.01)
+
+    def test_removes_constant_offset(self):
+        """A constant offset should be removed without a start-up transient."""
+        audio = np.full(1000, 0.25, dtype=np.float32)
+        np.testing.assert_allclose(_dc_block(audio, _dc_block_pole(48000)), 0.0, atol=1e-6)
+
+
+class TestServe(unittest.TestCase):
+    """Tests for the serve command's stdin/stdout protocol."""
+
+    def test_help_and_usage_errors_stay_json(self):
+        """--help and invalid arguments should produce JSON records, not plain text."""
+        out = StringIO()
+        commands = "analyze --help\nvalidate --format json a.wav\n"
+        with mock.patch("sys.stdin", StringIO(commands)), redirect_stdout(out):
+            self.assertEqual(_serve(), 0)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["exit_code"], 0)
+        self.assertIn("usage:", records[0]["output"])
+        self.assertIn("unrecognized arguments", records[1]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -16,19 +16,25 @@ speaker diarization data can be correctly serialized to JSON.
 import json
 import math
 import sys
+import datetime
 import unittest
 import warnings
+from contextlib import redirect_stdout
+from dataclasses import dataclass
 from io import StringIO
+from unittest import mock
 
 import numpy as np
 
 # Import the module under test
+import json_serialization_utils
 from json_serialization_utils import (
     to_json_serializable,
     NumpyTorchJSONEncoder,
     safe_json_dumps,
     safe_output_json,
     _handle_special_float,
+    ORJSON_AVAILABLE,
     TORCH_AVAILABLE
 )
 
@@ -147,6 +153,37 @@ class TestNumpyArrayConversion(unittest.TestCase):
         self.assertIsNone(result[1])
         self.assertEqual(result[2], sys.float_info.max)
 
+    def test_2d_array_with_special_floats(self):
+        """Special values inside nested rows should be converted too."""
+        arr = np.array([[0.5, float('-inf')], [float('nan'), 2.0]], dtype=np.float32)
+        result = to_json_serializable(arr, warn_special_floats=False)
+        self.assertEqual(result, [[0.5, -sys.float_info.max], [None, 2.0]])
+
+    def test_special_floats_warn_once_per_call(self):
+        """Many special values should produce a single summary warning."""
+        arr = np.array([float('nan')] * 100 + [float('inf')])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            to_json_serializable({"scores": arr})
+        self.assertEqual(len(w), 1)
+        self.assertIn("100 NaN", str(w[0].message))
+        self.assertIn("1 positive Infinity", str(w[0].message))
+
+    def test_object_array_conversion(self):
+        """Object arrays should have their elements converted recursively."""
+        arr = np.array([np.float32(0.5), np.int64(3), "a"], dtype=object)
+        result = to_json_serializable(arr)
+        self.assertEqual(result, [0.5, 3, "a"])
+        self.assertIs(type(result[1]), int)
+
+    def test_longdouble_array_conversion(self):
+        """Extended precision arrays should convert to native floats."""
+        arr = np.array([1.5, float('nan')], dtype=np.longdouble)
+        result = to_json_serializable(arr, warn_special_floats=False)
+        self.assertEqual(result, [1.5, None])
+        self.assertIs(type(result[0]), float)
+        self.assertEqual(json.dumps(to_json_serializable(arr[:1])), "[1.5]")
+
 
 class TestNestedStructureConversion(unittest.TestCase):
     """Tests for nested data structure conversion."""
@@ -339,6 +376,12 @@ class TestPyTorchTensorConversion(unittest.TestCase):
         result = to_json_serializable(tensor)
         self.assertEqual(result, [1.0, 2.0])
 
+    def test_bfloat16_tensor_conversion(self):
+        """bfloat16 tensors (no numpy equivalent) should still convert."""
+        tensor = torch.tensor([0.5, float('nan')], dtype=torch.bfloat16)
+        result = to_json_serializable(tensor, warn_special_floats=False)
+        self.assertEqual(result, [0.5, None])
+
     def test_dict_with_tensor_values(self):
         """Dictionaries with tensor values should be converted."""
         data = {
@@ -378,6 +421,23 @@ class TestNumpyTorchJSONEncoder(unittest.TestCase):
         self.assertIsNone(parsed["nan"])
         self.assertEqual(parsed["inf"], sys.float_info.max)
 
+    def test_encoder_with_special_floats_in_array(self):
+        """NaN/Infinity inside numpy arrays should produce valid JSON."""
+        data = {"values": np.array([0.5, float('nan'), float('-inf')])}
+        result = json.dumps(data, cls=NumpyTorchJSONEncoder)
+        parsed = json.loads(result, parse_constant=lambda c: self.fail(c))
+        self.assertEqual(parsed["values"], [0.5, None, -sys.float_info.max])
+
+    def test_encoder_with_nested_special_float(self):
+        """A special value deep inside lists/tuples should still be handled."""
+        data = {"segments": [{"scores": (0.5, float('-inf'))}], "ok": [1, 2.5]}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = json.dumps(data, cls=NumpyTorchJSONEncoder)
+        parsed = json.loads(result)
+        self.assertEqual(parsed["segments"][0]["scores"], [0.5, -sys.float_info.max])
+        self.assertEqual(parsed["ok"], [1, 2.5])
+
 
 class TestSafeJsonDumps(unittest.TestCase):
     """Tests for the safe_json_dumps function."""
@@ -410,6 +470,70 @@ class TestSafeJsonDumps(unittest.TestCase):
         parsed = json.loads(result)
         self.assertEqual(parsed["nested"]["value"], 0.5)
 
+    def test_strided_and_byteswapped_arrays(self):
+        """Transposed and non-native byte order arrays should keep their values."""
+        data = {
+            "transposed": np.arange(6, dtype=np.float32).reshape(2, 3).T,
+            "big_endian": np.array([1.5, 2.5], dtype='>f8')
+        }
+        parsed = json.loads(safe_json_dumps(data))
+        self.assertEqual(parsed["transposed"], [[0.0, 3.0], [1.0, 4.0], [2.0, 5.0]])
+        self.assertEqual(parsed["big_endian"], [1.5, 2.5])
+
+    def test_circular_reference_raises_value_error(self):
+        """Circular references should not be reported as a serialization TypeError."""
+        data = {"items": []}
+        data["items"].append(data)
+        with self.assertRaisesRegex(ValueError, "Circular reference"):
+            safe_json_dumps(data)
+
+    @unittest.skipUnless(ORJSON_AVAILABLE, "orjson not installed")
+    def test_orjson_matches_json_path(self):
+        """orjson output should decode to the same values as the json path's output."""
+        @dataclass
+        class Point:
+            a: int
+
+        payloads = [
+            {"type": "segment", "text": "h\u00e9llo \"quoted\"\n", "start": 1.25},
+            {"score": np.float32(0.95), "scores": np.array([0.95, 0.5], dtype=np.float32)},
+            {"half": np.float16(0.1), "halves": np.array([0.1], dtype=np.float16)},
+            {"ids": np.arange(4), "mask": np.array([True, False]), "count": np.int64(3)},
+            {"matrix": np.array([[0.5, 1.5], [2.5, 3.5]]), "column": np.ones((3, 2))[:, 0]},
+            {"gaps": np.array([np.nan, np.inf, 1.0]), "missing": float("nan")},
+            {"created": datetime.datetime(2020, 1, 1), "day": datetime.date(2020, 1, 1)},
+            {"stamps": np.array(['2020-01-01'], dtype='datetime64[D]')},
+            {"point": Point(1), "tags": ("a", None, False)},
+            {"bytes": b"abc", "big": 2 ** 70, 1: "non-str key"},
+        ]
+        for payload in payloads:
+            with self.subTest(payload=payload), warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                fast = safe_json_dumps(payload)
+                with mock.patch.object(json_serialization_utils, "ORJSON_AVAILABLE", False):
+                    reference = safe_json_dumps(payload)
+                self.assertEqual(json.loads(fast), json.loads(reference))
+
+    def test_json_path_keeps_default_separators(self):
+        """Without orjson, output should keep json.dumps()'s default separators."""
+        with mock.patch.object(json_serialization_utils, "ORJSON_AVAILABLE", False):
+            self.assertEqual(safe_json_dumps({"a": [1, 2]}), '{"a": [1, 2]}')
+
+
+class TestSafeOutputJson(unittest.TestCase):
+    """Tests for the safe_output_json function."""
+
+    def test_outputs_one_line_per_record(self):
+        """Each record should be written as one JSON line, flushed or not."""
+        out = StringIO()
+        with redirect_stdout(out):
+            safe_output_json({"type": "segment", "score": np.float32(0.5)})
+            safe_output_json({"type": "segment", "scores": np.array([1, 2])}, flush=False)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])["score"], 0.5)
+        self.assertEqual(json.loads(lines[1])["scores"], [1, 2])
+
 
 class TestNativeTypePreservation(unittest.TestCase):
     """Tests that native Python types are preserved."""